@@ -11,7 +11,7 @@ _needs_reload = "bpy" in locals()
 
 import bpy
 
-from . import panels
+from . import properties, panels
 from .operators import (
     add_gpencil,
     gn_solid_mesh,
@@ -19,15 +19,24 @@ from .operators import (
     gn_path_mesh,
     gn_blocks_mesh,
     gn_wall_mesh,
+    gn_screw_mesh,
     screw_mesh,
     bool_cut,
     array_on_curve,
     apply_modifiers,
     knife_cut,
+    purge_orphans,
+    gn_stamp_scatter,
+    lattice_wrap,
+    triangle_budget,
+    bake_cache,
+    freeze,
+    frame_baker,
 )
 
 if _needs_reload:
     import importlib
+    properties = importlib.reload(properties)
     panels = importlib.reload(panels)
     add_gpencil = importlib.reload(add_gpencil)
     gn_solid_mesh = importlib.reload(gn_solid_mesh)
@@ -35,13 +44,22 @@ if _needs_reload:
     gn_path_mesh = importlib.reload(gn_path_mesh)
     gn_blocks_mesh = importlib.reload(gn_blocks_mesh)
     gn_wall_mesh = importlib.reload(gn_wall_mesh)
+    gn_screw_mesh = importlib.reload(gn_screw_mesh)
     screw_mesh = importlib.reload(screw_mesh)
     bool_cut = importlib.reload(bool_cut)
     array_on_curve = importlib.reload(array_on_curve)
     apply_modifiers = importlib.reload(apply_modifiers)
     knife_cut = importlib.reload(knife_cut)
+    purge_orphans = importlib.reload(purge_orphans)
+    gn_stamp_scatter = importlib.reload(gn_stamp_scatter)
+    lattice_wrap = importlib.reload(lattice_wrap)
+    triangle_budget = importlib.reload(triangle_budget)
+    bake_cache = importlib.reload(bake_cache)
+    freeze = importlib.reload(freeze)
+    frame_baker = importlib.reload(frame_baker)
 
 registration_modules = [
+    properties,
     panels,
     add_gpencil,
     gn_solid_mesh,
@@ -54,6 +72,13 @@ registration_modules = [
     array_on_curve,
     apply_modifiers,
     knife_cut,
+    purge_orphans,
+    gn_stamp_scatter,
+    lattice_wrap,
+    triangle_budget,
+    bake_cache,
+    freeze,
+    frame_baker,
 ]
 
 
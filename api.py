@@ -0,0 +1,252 @@
+"""Context-free Python API for GreaseMesh.
+
+The GPTools operators are thin wrappers around these functions. They take
+the objects and settings explicitly, never read or change the selection,
+the active object or the screen, and return what they created, so scripts,
+batch jobs and handlers can drive them without faking UI state:
+
+    from bl_ext.user_default.grease_mesh import api
+
+    api.make_solid(bpy.data.objects["Shape"], thickness=0.2, resolution=96)
+    api.bool_cut(bpy.data.objects["Door"], [bpy.data.objects["Wall"]], cut_depth=1.0)
+
+Extra keyword arguments of the ``make_*`` functions set modifier inputs by
+their panel name, in snake_case (``corner_radius`` for "Corner Radius").
+Unusable strokes raise ValueError and unknown inputs KeyError. Objects must
+be in Object mode. ``scene`` defaults to the current scene and
+``depsgraph`` to its evaluated depsgraph.
+
+``solid_mesh``, ``blocks_mesh`` and ``wall_mesh`` skip Geometry Nodes altogether: they
+build the finished mesh straight from the strokes and replace the GP object
+with it, which is much faster when converting many drawings.
+
+Knife Cut has no counterpart here: it projects through a 3D viewport.
+"""
+
+import bpy
+
+from .operators.apply_modifiers import apply_modifiers as _apply_modifiers, convert_from_buffers
+from .operators.array_on_curve import _local_x_extent, add_array_on_stroke_modifier
+from .operators.bool_cut import bool_cut_targets
+from .operators.gn_blocks_mesh import add_blocks_modifier, build_blocks_data
+from .operators.gn_mirror_mesh import add_mirror_modifier
+from .operators.gn_path_mesh import add_path_modifier
+from .operators.gn_solid_mesh import add_solid_modifier, build_solid_data
+from .operators.gn_stamp_scatter import add_stamp_scatter_modifier
+from .operators.gn_wall_mesh import add_wall_modifier, build_wall_data
+from .operators.lattice_wrap import wrap_objects
+from .operators.screw_mesh import add_live_screw, screw_each_profile, screw_to_mesh
+from .utils.freeze import freeze_objects, unfreeze_object
+from .utils.modifier_io import set_inputs
+from .utils.regions import update_regions
+
+__all__ = (
+    "make_solid",
+    "make_mirror",
+    "make_blocks",
+    "make_path",
+    "make_wall",
+    "make_screw",
+    "solid_mesh",
+    "blocks_mesh",
+    "wall_mesh",
+    "array_on_stroke",
+    "stamp_scatter",
+    "bool_cut",
+    "lattice_wrap",
+    "apply_modifiers",
+    "freeze",
+    "unfreeze",
+)
+
+
+def _scene(scene):
+    return scene if scene is not None else bpy.context.scene
+
+
+def _depsgraph(depsgraph):
+    return depsgraph if depsgraph is not None else bpy.context.evaluated_depsgraph_get()
+
+
+# ---------------------------------------------------------------------------
+# Mesh from GP
+# ---------------------------------------------------------------------------
+
+
+def make_solid(gp_obj, scene=None, depsgraph=None, view_position=None, **params):
+    """Add (or refit) the SolidMesh modifier. Returns the modifier.
+
+    The fill plane's normal faces ``view_position`` (a world-space point);
+    without one it faces away from nearby geometry.
+    """
+    scene = _scene(scene)
+    mod, _ = add_solid_modifier(gp_obj, scene, _depsgraph(depsgraph), view_position)
+    if params:
+        set_inputs(mod, params)
+        # Timers don't run in background jobs, so don't wait for the handler
+        update_regions(mod, gp_obj, scene)
+    return mod
+
+
+def make_mirror(gp_obj, scene=None, **params):
+    """Add a MirrorMesh modifier. Returns the modifier."""
+    mod = add_mirror_modifier(gp_obj, _scene(scene))
+    set_inputs(mod, params)
+    return mod
+
+
+def make_blocks(gp_obj, scene=None, depsgraph=None, view_position=None, **params):
+    """Add (or refit) the BlocksMesh modifier. Returns the modifier.
+
+    Needs strokes on a layer other than 'Paint' for the plane fit.
+    """
+    mod = add_blocks_modifier(gp_obj, _scene(scene), _depsgraph(depsgraph), view_position)
+    set_inputs(mod, params)
+    return mod
+
+
+def make_path(gp_obj, scene=None, **params):
+    """Add a PathMesh modifier sweeping the 'Profile' layer along 'Path'.
+    Returns the modifier."""
+    mod = add_path_modifier(gp_obj, _scene(scene))
+    set_inputs(mod, params)
+    return mod
+
+
+def make_wall(gp_obj, scene=None, **params):
+    """Add a WallMesh modifier. Returns the modifier."""
+    scene = _scene(scene)
+    mod = add_wall_modifier(gp_obj, scene)
+    if params:
+        set_inputs(mod, params)
+        update_regions(mod, gp_obj, scene)
+    return mod
+
+
+def make_screw(gp_obj, live=True, separate_profiles=False, collection=None,
+               resolution=0, tolerance=0.01, render_tolerance=0.002):
+    """Revolve the drawn profile.
+
+    Live adds a Screw modifier on ``gp_obj`` and returns it. Otherwise
+    ``gp_obj`` is replaced by mesh objects with a Screw modifier (one per
+    connected profile with ``separate_profiles``), linked to ``collection``
+    (default: the GP's first collection), and the list of them is returned.
+    """
+    if live and not separate_profiles:
+        mod, _ = add_live_screw(gp_obj, resolution, tolerance, render_tolerance)
+        return mod
+
+    if collection is None:
+        collection = gp_obj.users_collection[0]
+    if separate_profiles:
+        return screw_each_profile(gp_obj, collection, resolution, tolerance, render_tolerance)
+    mesh_obj, _, _, _ = screw_to_mesh(gp_obj, collection, resolution, tolerance, render_tolerance)
+    return [mesh_obj]
+
+
+def solid_mesh(gp_obj, scene=None, depsgraph=None, view_position=None, **params):
+    """Replace ``gp_obj`` with the Solid result as a plain mesh object, built
+    without Geometry Nodes. ``params`` are the SolidMesh inputs. Returns the
+    mesh object."""
+    data = build_solid_data(gp_obj, _scene(scene), _depsgraph(depsgraph), view_position, **params)
+    if data is None:
+        raise ValueError("The strokes enclose no area")
+    return convert_from_buffers(gp_obj, data)
+
+
+def blocks_mesh(gp_obj, scene=None, depsgraph=None, view_position=None, **params):
+    """Replace ``gp_obj`` with the Blocks result as a plain mesh object, built
+    without Geometry Nodes. ``params`` are the BlocksMesh inputs except Noise
+    Strength. Returns the mesh object."""
+    data = build_blocks_data(gp_obj, _scene(scene), _depsgraph(depsgraph), view_position, **params)
+    if data is None:
+        raise ValueError("No closed stroke on the 'Paint' layer")
+    return convert_from_buffers(gp_obj, data)
+
+
+def wall_mesh(gp_obj, scene=None, **params):
+    """Replace ``gp_obj`` with the Wall result as a plain mesh object, built
+    without Geometry Nodes. ``params`` are the WallMesh inputs. Returns the
+    mesh object."""
+    data = build_wall_data(gp_obj, _scene(scene), **params)
+    if data is None:
+        raise ValueError("No wall strokes")
+    return convert_from_buffers(gp_obj, data)
+
+
+# ---------------------------------------------------------------------------
+# Scatter and array
+# ---------------------------------------------------------------------------
+
+
+def array_on_stroke(mesh_obj, gp_obj, spacing=None, **params):
+    """Instance ``mesh_obj`` along the strokes of ``gp_obj``. Returns the modifier.
+
+    Spacing defaults to the mesh's X size, so copies touch end to end.
+    """
+    if spacing is None:
+        spacing = max(_local_x_extent(mesh_obj), 0.01)
+    mod = add_array_on_stroke_modifier(mesh_obj, gp_obj, spacing)
+    set_inputs(mod, params)
+    return mod
+
+
+def stamp_scatter(gp_obj, target, collection, **params):
+    """Scatter objects of ``collection`` on ``target`` at the marks drawn in
+    ``gp_obj``. Returns the modifier."""
+    if not collection.all_objects:
+        raise ValueError(f"Collection '{collection.name}' has no objects")
+    mod = add_stamp_scatter_modifier(gp_obj, target, collection)
+    set_inputs(mod, params)
+    return mod
+
+
+# ---------------------------------------------------------------------------
+# Cutting and deforming
+# ---------------------------------------------------------------------------
+
+
+def bool_cut(gp_obj, targets, cut_depth=10.0, resolution=0, frame=None, depsgraph=None):
+    """Cut the shape drawn in ``gp_obj`` out of every mesh in ``targets``.
+
+    The GP object is deleted. ``resolution`` resamples the outline to that
+    many points; 0 uses the strokes as drawn. ``frame`` defaults to the
+    scene's current frame. Returns the targets.
+    """
+    if frame is None:
+        frame = bpy.context.scene.frame_current
+    return bool_cut_targets(gp_obj, targets, _depsgraph(depsgraph), frame, cut_depth, resolution)
+
+
+def lattice_wrap(sources, target, resolution=6, offset=0.0, depsgraph=None):
+    """Wrap each source mesh onto ``target``. Returns the lattice objects."""
+    sources = [o for o in sources if o is not target and len(o.data.vertices) > 0]
+    return wrap_objects(sources, target, _depsgraph(depsgraph), resolution, offset)
+
+
+# ---------------------------------------------------------------------------
+# Applying and freezing
+# ---------------------------------------------------------------------------
+
+
+def apply_modifiers(objects, depsgraph=None):
+    """Apply all modifiers on ``objects``; GP objects become new mesh objects.
+
+    Returns the resulting mesh objects.
+    """
+    objects = [o for o in objects if o.type in {"MESH", "GREASEPENCIL"} and o.modifiers]
+    if not objects:
+        return []
+    applied, converted, _ = _apply_modifiers(objects, _depsgraph(depsgraph))
+    return applied + [new_obj for _, new_obj in converted]
+
+
+def freeze(objects, depsgraph=None):
+    """Freeze GP objects into a cached mesh. Returns the objects frozen."""
+    return freeze_objects(objects, _depsgraph(depsgraph))
+
+
+def unfreeze(obj):
+    """Bring a frozen object back to its live modifiers. Returns False if it
+    wasn't frozen."""
+    return unfreeze_object(obj)
@@ -0,0 +1,330 @@
+"""Headless batch conversion of .blend files.
+
+Run it from a terminal with the add-on enabled (the module path below is
+for an extension installed from disk into the default user repository):
+
+    blender -b --python-expr "import bl_ext.user_default.grease_mesh.batch as b; b.main()" -- \\
+        --recipe WALL --param Height=3 --param Thickness=0.2 \\
+        --export GLB --output ./converted --jobs 8 drawings/
+
+Every file (directories are searched for .blend files) is opened in its own
+background Blender, a pool of ``--jobs`` of them at a time. Each worker runs
+the recipe through the context-free ``api`` on the Grease Pencil objects
+whose names match ``--objects``, sets the given modifier inputs, and saves or
+exports the result to ``--output``. The files are never modified in place.
+
+``--recipe`` is one of Solid, Mirror, Blocks, Path or Wall, or a JSON file
+holding the same settings::
+
+    {"recipe": "SOLID", "objects": "Shape*", "params": {"Thickness": 0.1},
+     "export": "BLEND", "apply": false}
+
+Parameters are modifier inputs by their panel name. Values are read as JSON
+when possible (``Center=[0, 0, 1]``, ``Triangulate=true``) and as text
+otherwise (``Normal Mode=Minimum Twist``). Exports other than BLEND always
+apply the modifiers first.
+
+``--direct`` (or ``"direct": true``) builds Solid, Blocks and Wall meshes straight
+from the strokes instead of through their Geometry Nodes modifiers; the
+result is the same plain mesh ``--apply`` gives, much sooner.
+"""
+
+import argparse
+import concurrent.futures
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+
+import bpy
+
+from . import api
+
+RECIPES = {
+    'SOLID': api.make_solid,
+    'MIRROR': api.make_mirror,
+    'BLOCKS': api.make_blocks,
+    'PATH': api.make_path,
+    'WALL': api.make_wall,
+}
+
+DIRECT_RECIPES = {
+    'SOLID': api.solid_mesh,
+    'BLOCKS': api.blocks_mesh,
+    'WALL': api.wall_mesh,
+}
+
+EXPORT_EXTENSIONS = {
+    'BLEND': ".blend",
+    'GLB': ".glb",
+    'FBX': ".fbx",
+    'OBJ': ".obj",
+    'STL': ".stl",
+}
+
+
+# ---------------------------------------------------------------------------
+# Worker side — runs inside the background Blender that opened one file
+# ---------------------------------------------------------------------------
+
+
+def apply_recipe(recipe):
+    """Run the recipe on the matching GP objects of the open file.
+
+    Returns (converted objects, {object name: reason} for the ones that failed).
+    """
+    direct = recipe.get("direct", False)
+    make = (DIRECT_RECIPES if direct else RECIPES)[recipe["recipe"]]
+    pattern = recipe.get("objects", "*")
+    targets = [
+        obj for obj in bpy.context.view_layer.objects
+        if obj.type == 'GREASEPENCIL' and fnmatch.fnmatchcase(obj.name, pattern)
+    ]
+
+    converted = []
+    failed = {}
+    for obj in targets:
+        name = obj.name
+        try:
+            result = make(obj, **recipe.get("params", {}))
+        except (KeyError, ValueError) as err:
+            failed[name] = str(err.args[0]) if err.args else repr(err)
+            continue
+        converted.append(result if direct else obj)
+    return converted, failed
+
+
+def _export(fmt, filepath):
+    if fmt == 'BLEND':
+        bpy.ops.wm.save_as_mainfile(filepath=filepath, copy=True)
+    elif fmt == 'GLB':
+        bpy.ops.export_scene.gltf(filepath=filepath, export_format='GLB', use_selection=True)
+    elif fmt == 'FBX':
+        bpy.ops.export_scene.fbx(filepath=filepath, use_selection=True)
+    elif fmt == 'OBJ':
+        bpy.ops.wm.obj_export(filepath=filepath, export_selected_objects=True)
+    elif fmt == 'STL':
+        bpy.ops.wm.stl_export(filepath=filepath, export_selected_objects=True)
+
+
+def worker_main():
+    """Entry point of a worker: ``-- --job <job.json>``."""
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="grease_mesh.batch worker")
+    parser.add_argument("--job", required=True)
+    with open(parser.parse_args(argv).job) as f:
+        job = json.load(f)
+    recipe = job["recipe"]
+
+    result = {"converted": [], "failed": {}, "convert_time": 0.0, "export_time": 0.0}
+    try:
+        start = time.perf_counter()
+        converted, result["failed"] = apply_recipe(recipe)
+        result["converted"] = [obj.name for obj in converted]
+        fmt = recipe.get("export", 'BLEND')
+        if converted and not recipe.get("direct") and (recipe.get("apply") or fmt != 'BLEND'):
+            converted = api.apply_modifiers(converted)
+        result["convert_time"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if converted:
+            # Exporters write the selection
+            for obj in bpy.context.view_layer.objects:
+                obj.select_set(obj in converted)
+            _export(fmt, job["output"])
+        result["export_time"] = time.perf_counter() - start
+        result["status"] = "ok" if converted else "empty"
+    except Exception:
+        result["status"] = "failed"
+        result["error"] = traceback.format_exc()
+
+    with open(job["result"], "w") as f:
+        json.dump(result, f)
+
+
+# ---------------------------------------------------------------------------
+# Driver side — expands the file list and runs the worker pool
+# ---------------------------------------------------------------------------
+
+
+def _parse_value(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def load_recipe(args):
+    """Build the recipe dict from ``--recipe`` (a name or a JSON file) and the overrides."""
+    if args.recipe.lower().endswith(".json"):
+        with open(args.recipe) as f:
+            recipe = json.load(f)
+    else:
+        recipe = {"recipe": args.recipe}
+    recipe["recipe"] = recipe["recipe"].upper()
+    if recipe["recipe"] not in RECIPES:
+        raise ValueError(f"Unknown recipe '{recipe['recipe']}' (choose from {', '.join(RECIPES)})")
+
+    params = dict(recipe.get("params", {}))
+    for item in args.param:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"--param expects NAME=VALUE, got '{item}'")
+        params[name.strip()] = _parse_value(value.strip())
+    recipe["params"] = params
+    for key in ("objects", "export"):
+        if getattr(args, key) is not None:
+            recipe[key] = getattr(args, key)
+    recipe["export"] = recipe.get("export", 'BLEND').upper()
+    if recipe["export"] not in EXPORT_EXTENSIONS:
+        raise ValueError(f"Unknown export format '{recipe['export']}'")
+    if args.apply:
+        recipe["apply"] = True
+    if args.direct:
+        recipe["direct"] = True
+    if recipe.get("direct") and recipe["recipe"] not in DIRECT_RECIPES:
+        raise ValueError(f"--direct supports {', '.join(DIRECT_RECIPES)} only")
+    return recipe
+
+
+def collect_files(paths):
+    """.blend files named on the command line or found under named directories."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".blend"))
+        else:
+            files.append(path)
+    return [os.path.abspath(f) for f in files]
+
+
+def _output_paths(files, directory, extension):
+    """One output file per input, named after it; clashing names get a suffix."""
+    taken = set()
+    outputs = []
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name, n = stem, 1
+        while name in taken:
+            n += 1
+            name = f"{stem}_{n}"
+        taken.add(name)
+        outputs.append(os.path.join(directory, name + extension))
+    return outputs
+
+
+def _run_file(source, output, recipe, work_dir, threads, timeout):
+    """Convert one file in a background Blender. Returns its result dict."""
+    stem = os.path.splitext(os.path.basename(output))[0]
+    job_path = os.path.join(work_dir, f"{stem}.job.json")
+    result_path = os.path.join(work_dir, f"{stem}.result.json")
+    with open(job_path, "w") as f:
+        json.dump({"recipe": recipe, "output": output, "result": result_path}, f)
+
+    cmd = [
+        bpy.app.binary_path, "-b", "-t", str(threads), source,
+        "--python-exit-code", "1",
+        "--python-expr", f"import {__name__} as batch; batch.worker_main()",
+        "--", "--job", job_path,
+    ]
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        log, returncode = proc.stdout + proc.stderr, proc.returncode
+    except subprocess.TimeoutExpired as err:
+        log, returncode = f"{err.stdout or ''}{err.stderr or ''}\nTimed out after {timeout}s", None
+
+    result = {"status": "failed", "error": f"Blender exited with code {returncode}"}
+    if os.path.exists(result_path):
+        with open(result_path) as f:
+            result = json.load(f)
+    result["file"] = source
+    result["output"] = output
+    result["time"] = time.perf_counter() - start
+    if result["status"] == "failed":
+        log_path = os.path.splitext(output)[0] + ".log"
+        with open(log_path, "w") as f:
+            f.write(log)
+        result["log"] = log_path
+    return result
+
+
+def _summary_line(result):
+    name = os.path.basename(result["file"])
+    if result["status"] == "failed":
+        error = result.get("error", "").strip().splitlines()
+        return f"[FAILED] {result['time']:7.2f}s  {name}: {error[-1] if error else 'unknown error'}"
+    line = (
+        f"[{result['status'].upper():^6}] {result['time']:7.2f}s  {name}: "
+        f"{len(result['converted'])} converted "
+        f"(convert {result['convert_time']:.2f}s, export {result['export_time']:.2f}s)"
+    )
+    if result["failed"]:
+        line += f", {len(result['failed'])} failed: " + "; ".join(
+            f"{obj} ({reason})" for obj, reason in result["failed"].items()
+        )
+    return line
+
+
+def main(argv=None):
+    """Driver entry point; arguments follow ``--`` on the Blender command line."""
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="grease_mesh.batch", description="Convert .blend drawings with a GreaseMesh recipe.")
+    parser.add_argument("paths", nargs="+", help=".blend files or directories to search")
+    parser.add_argument("--recipe", required=True, help="Solid, Mirror, Blocks, Path, Wall, or a recipe .json file")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=VALUE", help="Modifier input to set (repeatable)")
+    parser.add_argument("--objects", help="Grease Pencil object name pattern (default *)")
+    parser.add_argument("--export", help="BLEND (default), GLB, FBX, OBJ or STL")
+    parser.add_argument("--apply", action="store_true", help="Apply the modifiers before saving a BLEND")
+    parser.add_argument("--direct", action="store_true", help="Build Solid/Blocks/Wall meshes without Geometry Nodes")
+    parser.add_argument("--output", default="greasemesh_batch", help="Output directory")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Files converted at once")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before a file is given up")
+    parser.add_argument("--report", help="Write per-file results to this JSON file")
+    args = parser.parse_args(argv)
+
+    try:
+        recipe = load_recipe(args)
+    except (OSError, ValueError) as err:
+        parser.error(str(err))
+    files = collect_files(args.paths)
+    if not files:
+        parser.error("No .blend files found")
+
+    output_dir = os.path.abspath(args.output)
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = _output_paths(files, output_dir, EXPORT_EXTENSIONS[recipe["export"]])
+    jobs = max(1, min(args.jobs, len(files)))
+    threads = max(1, (os.cpu_count() or 1) // jobs)
+
+    print(f"GreaseMesh batch: {len(files)} file(s), recipe {recipe['recipe']}, {jobs} worker(s)", flush=True)
+    start = time.perf_counter()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="greasemesh_batch_") as work_dir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_run_file, source, output, recipe, work_dir, threads, args.timeout)
+                for source, output in zip(files, outputs)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results.append(result)
+                print(_summary_line(result), flush=True)
+
+    failed = [r for r in results if r["status"] == "failed"]
+    print(
+        f"GreaseMesh batch: {len(results) - len(failed)} done, {len(failed)} failed "
+        f"in {time.perf_counter() - start:.1f}s",
+        flush=True,
+    )
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(sorted(results, key=lambda r: r["file"]), f, indent=2)
+    if failed:
+        sys.exit(1)
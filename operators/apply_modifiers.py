@@ -1,158 +1,314 @@
 import bpy
-
-
-def _apply_gp_modifiers(context, gp_obj):
-    """Extract evaluated mesh from a GP object's GN modifiers via depsgraph."""
-    if context.mode != 'OBJECT':
-        bpy.ops.object.mode_set(mode='OBJECT')
-
-    depsgraph = context.evaluated_depsgraph_get()
-
-    # GN modifiers on GP objects create mesh instances in the depsgraph.
-    # Extract vertex/face data before any scene changes invalidate references.
-    verts = []
-    faces = []
-    smooth_flags = []
-    eval_inst_obj = None
-
-    for inst in depsgraph.object_instances:
-        if inst.object.original == gp_obj and inst.is_instance:
-            eval_inst_obj = inst.object
-            mesh_data = eval_inst_obj.to_mesh()
-            if mesh_data and len(mesh_data.vertices) > 0:
-                verts = [v.co[:] for v in mesh_data.vertices]
-                faces = [list(p.vertices) for p in mesh_data.polygons]
-                smooth_flags = [p.use_smooth for p in mesh_data.polygons]
-            eval_inst_obj.to_mesh_clear()
-            break
-
-    if not verts:
-        return None
-
+from ..utils.mesh_transfer import read_instances_by_object, mesh_from_buffers
+from ..utils.orphans import track_replaced_meshes
+from ..utils.modifier_io import modifier_signature
+from ..utils.viewport_proxy import force_full_detail, restore_detail
+
+# ID property on a GP material pointing at its converted mesh material, so
+# every object (and every later Apply) reuses the same one.
+MESH_MATERIAL_PROP = "greasemesh_mesh_material"
+
+
+def _mesh_material_for(mat, cache):
+    """Return the mesh material standing in for a GP material.
+
+    GP materials lack a shader node tree — they're replaced with a mesh
+    material so renderers and painting addons work correctly. Conversions are
+    cached per call in ``cache`` and persisted on the GP material, so each GP
+    material maps to a single shared mesh material.
+    """
+    if mat is None or mat.node_tree is not None:
+        return mat
+    if mat in cache:
+        return cache[mat]
+
+    mesh_mat = mat.get(MESH_MATERIAL_PROP)
+    if not isinstance(mesh_mat, bpy.types.Material):
+        mesh_mat = bpy.data.materials.new(name=mat.name)
+        mesh_mat.use_nodes = True
+        # Copy the GP surface colour to the Principled BSDF base colour
+        principled = mesh_mat.node_tree.nodes.get("Principled BSDF")
+        if principled and hasattr(mat, "grease_pencil"):
+            gp_mat = mat.grease_pencil
+            col = gp_mat.color
+            principled.inputs["Base Color"].default_value = (col[0], col[1], col[2], col[3])
+        mat[MESH_MATERIAL_PROP] = mesh_mat
+
+    cache[mat] = mesh_mat
+    return mesh_mat
+
+
+def _group_linked_duplicates(gp_objs):
+    """Group GP objects that share data and an identical modifier stack.
+
+    Linked duplicates (Alt+D) with matching GN inputs evaluate to the same
+    local-space mesh, so each group is converted once. Returns a list of
+    groups; the first object of each group is its representative.
+    """
+    groups = {}
+    singles = []
+    for obj in gp_objs:
+        sig = modifier_signature(obj)
+        if sig is None:
+            singles.append([obj])
+            continue
+        groups.setdefault((obj.data.as_pointer(), sig), []).append(obj)
+    return list(groups.values()) + singles
+
+
+def _suspend_duplicates(groups):
+    """Turn off viewport evaluation on every non-representative group member.
+
+    Returns {group index: [(modifier, previous show_viewport)]} so groups
+    that end up not converted can be restored.
+    """
+    suspended = {}
+    for i, group in enumerate(groups):
+        for obj in group[1:]:
+            for mod in obj.modifiers:
+                suspended.setdefault(i, []).append((mod, mod.show_viewport))
+                mod.show_viewport = False
+    return suspended
+
+
+def _convert_gp_objects(groups, buffers, material_cache):
+    """Replace grouped GP objects with mesh objects built from pre-read buffers.
+
+    ``buffers`` comes from read_instances_by_object, so every representative
+    was read in a single scan of ``depsgraph.object_instances`` before
+    anything is removed. All objects of a group share the one mesh built
+    from their representative.
+    Returns a list of (gp_name, new_obj); groups whose modifiers produced no
+    geometry are left untouched and not listed.
+    """
+    converted = []
+    for group in groups:
+        data = buffers.get(group[0])
+        if data is None:
+            continue
+
+        materials = list(group[0].data.materials)
+        new_mesh = mesh_from_buffers(group[0].name, data)
+        for mat in materials:
+            new_mesh.materials.append(_mesh_material_for(mat, material_cache))
+
+        for gp_obj in group:
+            name = gp_obj.name
+            converted.append((name, _replace_with_mesh_object(gp_obj, new_mesh)))
+
+    return converted
+
+
+def _replace_with_mesh_object(gp_obj, mesh):
+    """Remove ``gp_obj`` and put a mesh object using ``mesh`` in its place
+    (same name, transform and collections). Returns the new object."""
     # Collect GP object properties before removing it
     name = gp_obj.name
     matrix = gp_obj.matrix_world.copy()
     collections = list(gp_obj.users_collection)
-    materials = list(gp_obj.data.materials)
 
     # Remove the original GP object
     bpy.data.objects.remove(gp_obj, do_unlink=True)
 
-    # Build a standalone mesh from the extracted data
-    new_mesh = bpy.data.meshes.new(name=name)
-    new_mesh.from_pydata(verts, [], faces)
-    new_mesh.update()
-
-    for flag, poly in zip(smooth_flags, new_mesh.polygons):
-        poly.use_smooth = flag
-
     # Create new mesh object at the same transform
-    new_obj = bpy.data.objects.new(name=name, object_data=new_mesh)
+    new_obj = bpy.data.objects.new(name=name, object_data=mesh)
     for col in collections:
         col.objects.link(new_obj)
     new_obj.matrix_world = matrix
+    return new_obj
 
-    for mat in materials:
-        if mat and mat.node_tree is None:
-            # GP materials lack a shader node tree — replace with a mesh
-            # material so renderers and painting addons work correctly.
-            mesh_mat = bpy.data.materials.new(name=mat.name)
-            mesh_mat.use_nodes = True
-            # Copy the GP surface colour to the Principled BSDF base colour
-            principled = mesh_mat.node_tree.nodes.get("Principled BSDF")
-            if principled and hasattr(mat, "grease_pencil"):
-                gp_mat = mat.grease_pencil
-                col = gp_mat.color
-                principled.inputs["Base Color"].default_value = (col[0], col[1], col[2], col[3])
-            new_obj.data.materials.append(mesh_mat)
-        else:
-            new_obj.data.materials.append(mat)
-
-    # Select the new object
-    context.view_layer.objects.active = new_obj
-    new_obj.select_set(True)
 
-    return new_obj
+def convert_from_buffers(gp_obj, data, material_cache=None):
+    """Replace ``gp_obj`` with a mesh object built from ``data`` buffers,
+    carrying its materials over as Apply does. Returns the new object."""
+    if material_cache is None:
+        material_cache = {}
+    mesh = mesh_from_buffers(gp_obj.name, data)
+    for mat in gp_obj.data.materials:
+        mesh.materials.append(_mesh_material_for(mat, material_cache))
+    return _replace_with_mesh_object(gp_obj, mesh)
+
+
+def _array_curve_objects(obj):
+    """Curve objects referenced by Essentials Array modifiers.
+
+    Older versions of Array on Pencil copied the GP into such a curve; the
+    current ArrayOnStroke modifier reads the GP directly and leaves nothing
+    to clean up.
+    """
+    curves = []
+    for mod in obj.modifiers:
+        if mod.type == 'NODES' and mod.node_group and mod.node_group.name == 'Array':
+            curve_obj = mod.get("Socket_27")
+            if curve_obj and isinstance(curve_obj, bpy.types.Object) and curve_obj.type == 'CURVE':
+                curves.append(curve_obj)
+    return curves
+
+
+def _swap_in_evaluated_mesh(obj, new_mesh):
+    """Replace obj's mesh with its evaluated copy and drop its modifiers.
+
+    Returns (modifier_count, curve objects to clean up, old mesh).
+    """
+    old_mesh = obj.data
+    new_mesh.name = old_mesh.name
+    obj.data = new_mesh
+    # Don't remove old_mesh here — bpy.data.meshes.remove() bypasses undo.
+    # The caller hands it to the orphan registry, which purges it later.
+
+    cleanup_objects = _array_curve_objects(obj)
+
+    count = len(obj.modifiers)
+    for mod in list(obj.modifiers):
+        obj.modifiers.remove(mod)
+    return count, cleanup_objects, old_mesh
+
+
+def _remove_array_sources(curve_objs):
+    """Remove curve objects and their hidden source GP objects."""
+    for curve_obj in curve_objs:
+        # Find the matching hidden GP (name without "_Curve" suffix)
+        gp_name = curve_obj.name.removesuffix("_Curve")
+        gp_obj = bpy.data.objects.get(gp_name)
+        if gp_obj and gp_obj.type == 'GREASEPENCIL':
+            bpy.data.objects.remove(gp_obj, do_unlink=True)
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+
+
+def _has_modifiers(obj):
+    return obj.type in {"MESH", "GREASEPENCIL"} and len(obj.modifiers) > 0
+
+
+def apply_modifiers(targets, depsgraph):
+    """Apply every modifier on ``targets`` from one depsgraph evaluation.
+
+    Meshes get their evaluated mesh swapped in; Grease Pencil objects are
+    replaced by new mesh objects. Objects must be in Object mode. Returns
+    (applied mesh objects, [(GP name, new mesh object)], modifier count).
+    """
+    gp_objs = [o for o in targets if o.type == "GREASEPENCIL"]
+    mesh_objs = [o for o in targets if o.type == "MESH"]
+
+    # Linked duplicates are only evaluated once: their copies skip GN
+    # evaluation and reuse the representative's mesh.
+    gp_groups = _group_linked_duplicates(gp_objs)
+    suspended = _suspend_duplicates(gp_groups)
+
+    # Bake full detail, not the viewport proxy
+    proxy_saved = force_full_detail(targets)
+
+    # Evaluate once. Using bpy.ops.object.modifier_apply() in a loop
+    # creates nested undo steps that break Ctrl+Z, so we use the
+    # low-level approach. Every read happens before any scene change.
+    depsgraph.update()
+    gp_buffers = {}
+    if gp_groups:
+        gp_buffers = read_instances_by_object(depsgraph, [g[0] for g in gp_groups])
+    evaluated = [
+        (obj, bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph)))
+        for obj in mesh_objs
+    ]
+    restore_detail(proxy_saved)
+
+    mod_count = 0
+    applied = []
+    cleanup_objects = []
+    replaced_meshes = []
+    for obj, new_mesh in evaluated:
+        if new_mesh is None or len(new_mesh.vertices) == 0:
+            if new_mesh is not None:
+                bpy.data.meshes.remove(new_mesh)
+            continue
+        count, curves, old_mesh = _swap_in_evaluated_mesh(obj, new_mesh)
+        replaced_meshes.append(old_mesh)
+        mod_count += count
+        cleanup_objects.extend(c for c in curves if c not in cleanup_objects)
+        applied.append(obj)
+
+    for i, group in enumerate(gp_groups):
+        if group[0] not in gp_buffers:
+            for mod, shown in suspended.get(i, ()):
+                mod.show_viewport = shown
+    converted = _convert_gp_objects(gp_groups, gp_buffers, {})
+
+    _remove_array_sources(cleanup_objects)
+    track_replaced_meshes(*replaced_meshes)
+    return applied, converted, mod_count
 
 
 class GPTOOLS_OT_apply_all_modifiers(bpy.types.Operator):
-    """Apply all modifiers on the active object. For Grease Pencil objects
-    with geometry-changing modifiers, converts to mesh."""
+    """Apply all modifiers on the selected objects (or the active collection).
+    Grease Pencil objects with geometry-changing modifiers are converted to
+    mesh. Everything is evaluated from a single depsgraph pass."""
 
     bl_idname = "gptools.apply_all_modifiers"
     bl_label = "Apply All Modifiers"
     bl_options = {"REGISTER", "UNDO"}
 
+    scope: bpy.props.EnumProperty(
+        name="Scope",
+        items=[
+            ('SELECTED', "Selected", "Active and selected objects"),
+            ('COLLECTION', "Collection", "Every object in the active collection and its children"),
+        ],
+        default='SELECTED',
+        options={'SKIP_SAVE'},
+    )
+
     @classmethod
-    def _find_target(cls, context):
-        """Return the object to apply modifiers on.
-        Prefers active object, falls back to first selected with modifiers."""
-        obj = context.active_object
-        if obj and obj.type in {"MESH", "GREASEPENCIL"} and len(obj.modifiers) > 0:
-            return obj
-        for obj in context.selected_objects:
-            if obj.type in {"MESH", "GREASEPENCIL"} and len(obj.modifiers) > 0:
-                return obj
-        return None
+    def _find_targets(cls, context, scope='SELECTED'):
+        """Return the objects to apply modifiers on, active object first."""
+        if scope == 'COLLECTION':
+            candidates = list(context.collection.all_objects)
+        else:
+            candidates = list(context.selected_objects)
+            active = context.active_object
+            if active is not None and active not in candidates:
+                candidates.insert(0, active)
+        return [obj for obj in candidates if _has_modifiers(obj)]
 
     @classmethod
     def poll(cls, context):
-        return cls._find_target(context) is not None
+        # Cheap check only: the collection scope is resolved in execute
+        obj = context.active_object
+        if obj and _has_modifiers(obj):
+            return True
+        return any(_has_modifiers(o) for o in context.selected_objects)
 
     def execute(self, context):
-        obj = self._find_target(context)
-
-        if obj.type == "GREASEPENCIL":
-            name = obj.name
-            new_obj = _apply_gp_modifiers(context, obj)
-            if new_obj is None:
-                self.report({"ERROR"}, "No mesh geometry produced by modifiers.")
-                return {"CANCELLED"}
-            self.report(
-                {"INFO"},
-                f"Converted '{name}' to mesh ({len(new_obj.data.vertices)} verts).",
-            )
-            return {"FINISHED"}
+        targets = self._find_targets(context, self.scope)
+        if not targets:
+            self.report({"ERROR"}, "No objects with modifiers found.")
+            return {"CANCELLED"}
 
-        # Apply all modifiers by evaluating the final mesh from depsgraph.
-        # Using bpy.ops.object.modifier_apply() in a loop creates nested
-        # undo steps that break Ctrl+Z, so we use the low-level approach.
-        depsgraph = context.evaluated_depsgraph_get()
-        eval_obj = obj.evaluated_get(depsgraph)
-        new_mesh = bpy.data.meshes.new_from_object(eval_obj)
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        if new_mesh is None or len(new_mesh.vertices) == 0:
+        applied, converted, mod_count = apply_modifiers(targets, context.evaluated_depsgraph_get())
+
+        if not applied and not converted:
             self.report({"ERROR"}, "No mesh geometry produced by modifiers.")
             return {"CANCELLED"}
 
-        old_mesh = obj.data
-        new_mesh.name = old_mesh.name
-        obj.data = new_mesh
-        # Don't remove old_mesh — bpy.data.meshes.remove() bypasses undo.
-        # The orphaned mesh is auto-cleaned on file save.
-
-        # Collect curve objects referenced by Array GN modifiers (from Array on Pencil)
-        cleanup_objects = []
-        for mod in obj.modifiers:
-            if mod.type == 'NODES' and mod.node_group and mod.node_group.name == 'Array':
-                curve_obj = mod.get("Socket_27")
-                if curve_obj and isinstance(curve_obj, bpy.types.Object) and curve_obj.type == 'CURVE':
-                    cleanup_objects.append(curve_obj)
-
-        count = len(obj.modifiers)
-        for mod in list(obj.modifiers):
-            obj.modifiers.remove(mod)
-
-        # Remove curve objects and their hidden source GP objects
-        for curve_obj in cleanup_objects:
-            # Find the matching hidden GP (name without "_Curve" suffix)
-            gp_name = curve_obj.name.removesuffix("_Curve")
-            gp_obj = bpy.data.objects.get(gp_name)
-            if gp_obj and gp_obj.type == 'GREASEPENCIL':
-                bpy.data.objects.remove(gp_obj, do_unlink=True)
-            bpy.data.objects.remove(curve_obj, do_unlink=True)
-
-        self.report({"INFO"}, f"Applied {count} modifier(s)")
+        result_objs = applied + [new_obj for _, new_obj in converted]
+        for obj in result_objs:
+            obj.select_set(True)
+        context.view_layer.objects.active = result_objs[0]
+
+        if len(targets) == 1 and converted:
+            name, new_obj = converted[0]
+            self.report(
+                {"INFO"},
+                f"Converted '{name}' to mesh ({len(new_obj.data.vertices)} verts).",
+            )
+        elif len(targets) == 1:
+            self.report({"INFO"}, f"Applied {mod_count} modifier(s)")
+        else:
+            self.report(
+                {"INFO"},
+                f"Applied {mod_count} modifier(s) on {len(applied)} mesh object(s), "
+                f"converted {len(converted)} Grease Pencil object(s) to mesh.",
+            )
         return {"FINISHED"}
 
 
@@ -1,59 +1,143 @@
 import bpy
-from ..utils.modifier_io import set_input, set_menu
-from mathutils import Vector
+from ..utils.modifier_io import set_input
+from ..utils.bake import add_bake_node
+from ..utils.node_groups import (
+    finish_node_group, is_current, register_node_group, reset_node_group, unregister_node_group,
+)
+
+NODE_GROUP_NAME = "GreaseMesh_ArrayOnStroke"
+NODE_GROUP_VERSION = 1
+MODIFIER_NAME = "ArrayOnStroke"
+
+
+# ---------------------------------------------------------------------------
+# Geometry Nodes graph — instance the mesh along the GP strokes.
+#
+#   Object Info (GP, Relative)
+#     → GP to Curves → Curve to Points (Length = Spacing)
+#     → Instance on Points(Instance = the mesh's own geometry,
+#                          Rotation = stroke tangent frame when aligned)
+#     → (Realize Instances when asked) → Output
+#
+# The strokes are read live from the GP object, so editing them moves the
+# copies. Instances stay unrealized: thousands of copies cost one mesh.
+# ---------------------------------------------------------------------------
+
+
+def _build_interface(ng):
+    """Create the modifier panel sockets."""
+    ng.interface.new_socket(
+        name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry',
+    )
+
+    ng.interface.new_socket(
+        name="Grease Pencil", in_out='INPUT', socket_type='NodeSocketObject',
+    )
+
+    s = ng.interface.new_socket(
+        name="Spacing", in_out='INPUT', socket_type='NodeSocketFloat',
+    )
+    s.default_value, s.min_value, s.max_value = 1.0, 0.001, 1000.0
+    s.subtype = 'DISTANCE'
+
+    s = ng.interface.new_socket(
+        name="Align to Stroke", in_out='INPUT', socket_type='NodeSocketBool',
+    )
+    s.default_value = True
+
+    s = ng.interface.new_socket(
+        name="Instance Scale", in_out='INPUT', socket_type='NodeSocketFloat',
+    )
+    s.default_value, s.min_value, s.max_value = 1.0, 0.0, 100.0
+
+    s = ng.interface.new_socket(
+        name="Realize Instances", in_out='INPUT', socket_type='NodeSocketBool',
+    )
+    s.default_value = False
+
+    ng.interface.new_socket(
+        name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry',
+    )
+
+
+def get_or_create_array_on_stroke_node_group():
+    """Get existing or build the ArrayOnStroke geometry node group."""
+    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
+        return ng
+
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
+    _build_interface(ng)
+
+    link = ng.links.new
+    nodes = ng.nodes
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-800, 0)
+
+    # GP strokes in the mesh object's space
+    obj_info = nodes.new('GeometryNodeObjectInfo'); obj_info.location = (-600, -200)
+    obj_info.transform_space = 'RELATIVE'
+    link(group_in.outputs['Grease Pencil'], obj_info.inputs['Object'])
+
+    gp_to_curves = nodes.new('GeometryNodeGreasePencilToCurves'); gp_to_curves.location = (-400, -200)
+    gp_to_curves.inputs['Layers as Instances'].default_value = False
+    link(obj_info.outputs['Geometry'], gp_to_curves.inputs['Grease Pencil'])
+
+    to_points = nodes.new('GeometryNodeCurveToPoints'); to_points.location = (-200, -200)
+    to_points.mode = 'LENGTH'
+    link(gp_to_curves.outputs['Curves'], to_points.inputs['Curve'])
+    link(group_in.outputs['Spacing'], to_points.inputs['Length'])
+
+    # Identity rotation unless aligned to the stroke tangent frame
+    align = nodes.new('GeometryNodeSwitch'); align.location = (0, -350)
+    align.input_type = 'ROTATION'
+    link(group_in.outputs['Align to Stroke'], align.inputs['Switch'])
+    link(to_points.outputs['Rotation'], align.inputs['True'])
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints'); instance.location = (200, 0)
+    link(to_points.outputs['Points'], instance.inputs['Points'])
+    link(group_in.outputs['Geometry'], instance.inputs['Instance'])
+    link(align.outputs['Output'], instance.inputs['Rotation'])
+    link(group_in.outputs['Instance Scale'], instance.inputs['Scale'])
+
+    realize = nodes.new('GeometryNodeRealizeInstances'); realize.location = (400, -150)
+    link(instance.outputs['Instances'], realize.inputs['Geometry'])
+
+    realize_switch = nodes.new('GeometryNodeSwitch'); realize_switch.location = (600, 0)
+    realize_switch.input_type = 'GEOMETRY'
+    link(group_in.outputs['Realize Instances'], realize_switch.inputs['Switch'])
+    link(instance.outputs['Instances'], realize_switch.inputs['False'])
+    link(realize.outputs['Geometry'], realize_switch.inputs['True'])
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (800, 0)
+    link(add_bake_node(ng, realize_switch.outputs['Output'], x=600, y=-300), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
+
+
+def _local_x_extent(mesh_obj):
+    """Size of the mesh along its local X axis (the array direction)."""
+    xs = [corner[0] for corner in mesh_obj.bound_box]
+    return max(xs) - min(xs)
 
 
-def _gp_to_curve(gp_obj):
-    """Convert a Grease Pencil object to a Curve object.
+def add_array_on_stroke_modifier(mesh_obj, gp_obj, spacing):
+    """Add the ArrayOnStroke modifier to mesh_obj, reading strokes from gp_obj."""
+    mod = mesh_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = get_or_create_array_on_stroke_node_group()
 
-    bpy.ops.object.convert(target='CURVE') silently fails on GP v3
-    in Blender 5.0, so we build the curve manually from stroke data.
-
-    Spline points are stored in local space relative to the first point.
-    The curve object's origin is placed at that first point in world space.
-    """
-    gp_data = gp_obj.data
-    matrix = gp_obj.matrix_world
-
-    # Collect all world-space points per stroke
-    all_strokes = []
-    for layer in gp_data.layers:
-        for frame in layer.frames:
-            for stroke in frame.drawing.strokes:
-                n = len(stroke.points)
-                if n < 2:
-                    continue
-                pts = []
-                for i in range(n):
-                    pts.append(Vector(matrix @ stroke.points[i].position))
-                all_strokes.append(pts)
-
-    if not all_strokes:
-        return None
-
-    # Use the first point of the first stroke as curve origin
-    origin = all_strokes[0][0].copy()
-
-    curve_data = bpy.data.curves.new(gp_obj.name + "_Curve", type='CURVE')
-    curve_data.dimensions = '3D'
-
-    for pts in all_strokes:
-        spline = curve_data.splines.new('POLY')
-        spline.points.add(len(pts) - 1)
-        for i, world_pos in enumerate(pts):
-            local_pos = world_pos - origin
-            spline.points[i].co = (local_pos.x, local_pos.y, local_pos.z, 1.0)
-
-    curve_obj = bpy.data.objects.new(gp_obj.name + "_Curve", curve_data)
-    curve_obj.location = origin
-    for col in gp_obj.users_collection:
-        col.objects.link(curve_obj)
-
-    return curve_obj
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) != 'INPUT':
+            continue
+        if item.name == 'Grease Pencil':
+            set_input(mod, item.identifier, gp_obj)
+        elif item.name == 'Spacing':
+            set_input(mod, item.identifier, spacing)
+    return mod
 
 
 class GPTOOLS_OT_array_on_curve(bpy.types.Operator):
-    """Convert GP to curve, add built-in Array modifier to mesh"""
+    """Instance the selected mesh along Grease Pencil strokes with a live Geometry Nodes modifier"""
 
     bl_idname = "gptools.array_on_curve"
     bl_label = "Array on Curve"
@@ -79,40 +163,25 @@ class GPTOOLS_OT_array_on_curve(bpy.types.Operator):
             self.report({"ERROR"}, "Select a Grease Pencil and a mesh object")
             return {"CANCELLED"}
 
-        # Convert GP to curve manually
-        curve_obj = _gp_to_curve(gp_obj)
-        if not curve_obj:
+        if not any(
+            len(stroke.points) >= 2
+            for layer in gp_obj.data.layers
+            for frame in layer.frames
+            for stroke in frame.drawing.strokes
+        ):
             self.report({"ERROR"}, "No strokes found in Grease Pencil")
             return {"CANCELLED"}
 
-        context.view_layer.update()
-
-        # Hide original GP
-        gp_obj.hide_set(True)
+        # Copies touch end to end by default, like the Array modifier's
+        # relative offset
+        spacing = max(_local_x_extent(mesh_obj), 0.01)
+        add_array_on_stroke_modifier(mesh_obj, gp_obj, spacing)
 
-        # Select mesh so modifier_add_node_group targets it
         for obj in context.selected_objects:
             obj.select_set(False)
         mesh_obj.select_set(True)
         context.view_layer.objects.active = mesh_obj
 
-        # Add Blender 5.0 built-in Array GN modifier
-        bpy.ops.object.modifier_add_node_group(
-            asset_library_type='ESSENTIALS',
-            asset_library_identifier="",
-            relative_asset_identifier="nodes/geometry_nodes_essentials.blend/NodeTree/Array",
-        )
-
-        mod = mesh_obj.modifiers.get("Array")
-        if not mod:
-            self.report({"ERROR"}, "Failed to add Array modifier")
-            return {"CANCELLED"}
-
-        # Configure: Shape = Curve, Count Method = Distance, Curve Object = converted GP
-        set_menu(mod, "Socket_2", "Curve", legacy_value=2)       # Shape: Curve
-        set_menu(mod, "Socket_33", "Distance", legacy_value=1)   # Count Method: Distance
-        set_input(mod, "Socket_27", curve_obj)                   # Curve Object
-
         # Switch Properties panel to Modifier tab
         try:
             for area in context.screen.areas:
@@ -125,7 +194,7 @@ class GPTOOLS_OT_array_on_curve(bpy.types.Operator):
         except TypeError:
             pass
 
-        self.report({"INFO"}, f"Array on Curve added to '{mesh_obj.name}'")
+        self.report({"INFO"}, f"Array on Pencil added to '{mesh_obj.name}'")
         return {"FINISHED"}
 
 
@@ -137,9 +206,11 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_array_on_stroke_node_group)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
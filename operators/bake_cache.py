@@ -0,0 +1,87 @@
+import bpy
+from ..utils.bake import configure_bake, greasemesh_modifiers, top_level_bakes
+
+
+class GPTOOLS_OT_bake_greasemesh(bpy.types.Operator):
+    """Bake the GreaseMesh modifiers of the selected objects to a disk cache
+    next to the .blend file, or free their bakes"""
+
+    bl_idname = "gptools.bake_greasemesh"
+    bl_label = "Bake GreaseMesh"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('BAKE', "Bake", "Write the results to disk (replaces an existing bake)"),
+            ('FREE', "Free", "Delete the baked data and evaluate live again"),
+        ],
+        default='BAKE',
+        options={'SKIP_SAVE'},
+    )
+    animation: bpy.props.BoolProperty(
+        name="Frame Range",
+        default=False,
+        description="Bake every frame of the range instead of only the current frame",
+    )
+    frame_start: bpy.props.IntProperty(name="Start", default=1)
+    frame_end: bpy.props.IntProperty(name="End", default=250)
+
+    @classmethod
+    def poll(cls, context):
+        return any(greasemesh_modifiers(o) for o in context.selected_objects)
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return self.execute(context)
+
+    def execute(self, context):
+        if self.action == 'BAKE' and not bpy.data.filepath:
+            self.report({"ERROR"}, "Save the file first; the cache is stored next to it")
+            return {"CANCELLED"}
+        if self.animation and self.frame_end < self.frame_start:
+            self.report({"ERROR"}, "Frame range end is before its start")
+            return {"CANCELLED"}
+
+        count = 0
+        for obj in context.selected_objects:
+            for mod in greasemesh_modifiers(obj):
+                for bake in top_level_bakes(mod):
+                    if self.action == 'BAKE':
+                        configure_bake(obj, mod, bake, self.animation, self.frame_start, self.frame_end)
+                        result = bpy.ops.object.geometry_node_bake_single(
+                            session_uid=obj.session_uid, modifier_name=mod.name, bake_id=bake.bake_id,
+                        )
+                    else:
+                        result = bpy.ops.object.geometry_node_bake_delete_single(
+                            session_uid=obj.session_uid, modifier_name=mod.name, bake_id=bake.bake_id,
+                        )
+                    if 'FINISHED' in result:
+                        count += 1
+
+        if count == 0:
+            self.report({"WARNING"}, "Nothing to bake. Recreate older modifiers to get a Bake node.")
+            return {"CANCELLED"}
+
+        verb = "Baked" if self.action == 'BAKE' else "Freed"
+        self.report({"INFO"}, f"{verb} {count} GreaseMesh modifier(s).")
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_bake_greasemesh,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
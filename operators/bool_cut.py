@@ -2,10 +2,23 @@ import bpy
 from ..utils.conversion import (
     get_active_grease_pencil,
     clean_gp_for_cutter,
+    frame_at,
+    scoped_drawings,
     remove_cleanup_duplicate,
     walk_strokes_into_loop,
 )
 from ..utils.modifier_io import set_input
+from ..utils.mesh_transfer import read_object_instances, mesh_from_buffers
+from ..utils.resample import resample_polyline
+from ..utils.orphans import track_replaced_meshes
+from ..utils.viewport_proxy import FACTOR_SOCKET, add_proxy_sockets, proxy_count
+from ..utils.topology import (
+    OPTIMIZE_SOCKET,
+    add_topology_sockets,
+    dissolve_straight_points,
+    optimized_fill,
+    triangulate_output,
+)
 
 BOOL_CUTTER_NODE_GROUP = "GreaseMesh_BoolCutter"
 
@@ -40,6 +53,11 @@ def get_or_create_bool_cutter_node_group():
 
         ng.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
 
+    if FACTOR_SOCKET not in ng.interface.items_tree:
+        add_proxy_sockets(ng.interface)
+    if OPTIMIZE_SOCKET not in ng.interface.items_tree:
+        add_topology_sockets(ng.interface)
+
     # --- Nodes ---
     x = -1600
     group_in = ng.nodes.new('NodeGroupInput')
@@ -107,8 +125,7 @@ def get_or_create_bool_cutter_node_group():
     resample.location = (x, 0)
 
     x += 200
-    fill_curve = ng.nodes.new('GeometryNodeFillCurve')
-    fill_curve.location = (x, 0)
+    fill_x = x
 
     x += 200
     merge = ng.nodes.new('GeometryNodeMergeByDistance')
@@ -181,10 +198,9 @@ def get_or_create_bool_cutter_node_group():
     link(merge_join.outputs['Geometry'], mesh_to_curve.inputs['Mesh'])
     link(mesh_to_curve.outputs['Curve'], set_cyclic.inputs['Curve'])
     link(set_cyclic.outputs['Curve'], resample.inputs['Curve'])
-    link(group_in.outputs['Resolution'], resample.inputs['Count'])
-    link(resample.outputs['Curve'], fill_curve.inputs['Curve'])
-
-    link(fill_curve.outputs['Mesh'], merge.inputs['Geometry'])
+    link(proxy_count(ng, group_in, 'Resolution', minimum=3), resample.inputs['Count'])
+    outline = dissolve_straight_points(ng, group_in, resample.outputs['Curve'], x=fill_x - 200, y=-700)
+    link(optimized_fill(ng, group_in, outline, x=fill_x, y=0), merge.inputs['Geometry'])
 
     # Offset: Normal * (-Thickness / 2)
     link(group_in.outputs['Thickness'], negate_half.inputs[0])
@@ -201,19 +217,12 @@ def get_or_create_bool_cutter_node_group():
     link(extrude.outputs['Mesh'], join.inputs['Geometry'])
     link(flip.outputs['Mesh'], join.inputs['Geometry'])
     link(join.outputs['Geometry'], merge_final.inputs['Geometry'])
-    link(merge_final.outputs['Geometry'], group_out.inputs['Geometry'])
+    link(triangulate_output(ng, group_in, merge_final.outputs['Geometry'], x=group_out.location.x, y=-300),
+         group_out.inputs['Geometry'])
 
     return ng
 
 
-def _find_target_mesh(context, gp_obj):
-    """Find a selected mesh object that isn't the active GP."""
-    for obj in context.selected_objects:
-        if obj != gp_obj and obj.type == 'MESH':
-            return obj
-    return None
-
-
 def _orient_cutter_to_target(cutter_obj, target, pivot=None):
     """Rotate cutter around `pivot` (default: cutter centroid) so its primary
     extrude axis points INTO the target mesh.
@@ -296,12 +305,11 @@ def _gp_stroke_centroid_world(gp_obj):
     total = mathutils.Vector()
     n = 0
     mw = gp_obj.matrix_world
-    for layer in gp_obj.data.layers:
-        for frame in layer.frames:
-            for stroke in frame.drawing.strokes:
-                for p in stroke.points:
-                    total += mw @ p.position
-                    n += 1
+    for _, drawing in scoped_drawings(gp_obj):
+        for stroke in drawing.strokes:
+            for p in stroke.points:
+                total += mw @ p.position
+                n += 1
     if n == 0:
         return None
     return total / n
@@ -355,37 +363,52 @@ def _pca_plane(points):
     return centroid, best_normal
 
 
-def _build_cutter_from_strokes(context, gp_obj, target, thickness):
-    """Build a cutter mesh directly from cleaned GP strokes.
+def _cutter_loop(gp_obj, frame, resolution=0):
+    """World-space outline of the cleaned strokes shown at ``frame``.
 
-    The node-group approach can't preserve the doorway shape when strokes are
-    drawn on a curved surface (fill_curve flattens to an axis-aligned bbox
-    cap). This builds a doorway-shaped tube whose extrude axis is the PCA
-    plane normal of the strokes — naturally aligned with the surface normal
-    when strokes are drawn flat against a wall.
+    GP strokes are cleaned (stubs dropped, open shapes closed) on a throwaway
+    duplicate and walked into one ordered loop. When resolution > 0 the loop
+    is resampled to that many points (corners kept) so side-wall density
+    doesn't depend on how fast the stroke was drawn; 0 keeps the points as
+    drawn.
     """
     import mathutils
-    import bmesh
 
-    cleaned_gp = clean_gp_for_cutter(gp_obj)
+    cleaned_gp = clean_gp_for_cutter(gp_obj, frame=frame)
     try:
         # Walk strokes into a single ordered loop in world space
         strokes_pts = []
         mw = cleaned_gp.matrix_world
-        for layer in cleaned_gp.data.layers:
-            for frame in layer.frames:
-                for s in frame.drawing.strokes:
-                    if len(s.points) >= 2:
-                        strokes_pts.append([mw @ p.position for p in s.points])
-                break  # first frame
-            break  # first layer
+        shown = frame_at(cleaned_gp.data.layers[0], frame) \
+            if len(cleaned_gp.data.layers) else None
+        if shown is not None:
+            for s in shown.drawing.strokes:
+                if len(s.points) >= 2:
+                    strokes_pts.append([mw @ p.position for p in s.points])
 
         loop = walk_strokes_into_loop([list(s) for s in strokes_pts])
     finally:
         remove_cleanup_duplicate(cleaned_gp)
 
-    if len(loop) < 3:
-        return None
+    if resolution > 0 and len(loop) >= 3:
+        loop = [
+            mathutils.Vector(p)
+            for p in resample_polyline(loop, resolution, cyclic=True, preserve_corners=True)
+        ]
+    return loop
+
+
+def _build_cutter_from_loop(gp_obj, loop, target, thickness):
+    """Build a cutter mesh from the outline loop of the GP strokes.
+
+    The node-group approach can't preserve the doorway shape when strokes are
+    drawn on a curved surface (fill_curve flattens to an axis-aligned bbox
+    cap). This builds a doorway-shaped tube whose extrude axis is the PCA
+    plane normal of the strokes — naturally aligned with the surface normal
+    when strokes are drawn flat against a wall.
+    """
+    import mathutils
+    import bmesh
 
     centroid, normal = _pca_plane(loop)
 
@@ -453,32 +476,23 @@ def _extract_cutter_mesh(context, gp_obj, thickness, resolution):
         mod.node_group = node_group
         set_input(mod, mod.node_group.interface.items_tree['Thickness'].identifier, thickness)
         set_input(mod, mod.node_group.interface.items_tree['Resolution'].identifier, resolution)
+        # Fewer cutter faces make the boolean cheaper
+        set_input(mod, mod.node_group.interface.items_tree[OPTIMIZE_SOCKET].identifier, True)
 
         # Force depsgraph to pick up the new modifier
         context.view_layer.update()
         depsgraph = context.evaluated_depsgraph_get()
 
         # Extract mesh data from depsgraph instances
-        verts = []
-        faces = []
-        for inst in depsgraph.object_instances:
-            if inst.object.original == cleaned_gp and inst.is_instance:
-                mesh_data = inst.object.to_mesh()
-                if mesh_data and len(mesh_data.vertices) > 0:
-                    verts = [v.co[:] for v in mesh_data.vertices]
-                    faces = [list(p.vertices) for p in mesh_data.polygons]
-                inst.object.to_mesh_clear()
-                break
+        data = read_object_instances(depsgraph, cleaned_gp)
     finally:
         remove_cleanup_duplicate(cleaned_gp)
 
-    if not verts:
+    if data is None:
         return None
 
     # Build cutter mesh object
-    cutter_mesh = bpy.data.meshes.new("_BoolCutter")
-    cutter_mesh.from_pydata(verts, [], faces)
-    cutter_mesh.update()
+    cutter_mesh = mesh_from_buffers("_BoolCutter", data)
 
     cutter_obj = bpy.data.objects.new("_BoolCutter", cutter_mesh)
     for col in gp_obj.users_collection:
@@ -488,8 +502,64 @@ def _extract_cutter_mesh(context, gp_obj, thickness, resolution):
     return cutter_obj
 
 
+def bool_cut_targets(gp_obj, targets, depsgraph, frame, thickness=10.0, resolution=0):
+    """Cut the outline drawn in ``gp_obj`` at ``frame`` out of every target mesh.
+
+    Each target gets its own cutter facing into it; all booleans are
+    evaluated in one depsgraph update and applied without bpy.ops, so Ctrl+Z
+    keeps working. ``gp_obj`` and the cutters are deleted afterwards. Raises
+    ValueError, leaving everything unchanged, when the strokes give no outline
+    or a boolean empties its target. Returns the targets.
+    """
+    loop = _cutter_loop(gp_obj, frame, resolution)
+    if len(loop) < 3:
+        raise ValueError("Could not create cutter mesh from GP strokes")
+
+    cuts = []
+    for target in targets:
+        cutter = _build_cutter_from_loop(gp_obj, loop, target, thickness)
+        bool_mod = target.modifiers.new(name="BoolCut", type='BOOLEAN')
+        bool_mod.operation = 'DIFFERENCE'
+        bool_mod.solver = 'EXACT'
+        bool_mod.object = cutter
+        cuts.append((target, cutter, bool_mod))
+
+    # Apply the boolean modifiers via depsgraph (avoids nested undo steps
+    # that break Ctrl+Z when using bpy.ops.object.modifier_apply).
+    depsgraph.update()
+    new_meshes = []
+    error = None
+    for target, _, _ in cuts:
+        new_mesh = bpy.data.meshes.new_from_object(target.evaluated_get(depsgraph))
+        new_meshes.append(new_mesh)
+        if len(new_mesh.polygons) == 0:
+            error = f"Boolean produced empty geometry on '{target.name}' — try adjusting Cut Depth"
+            break
+
+    for target, _, bool_mod in cuts:
+        target.modifiers.remove(bool_mod)
+    cutter_meshes = [cutter.data for _, cutter, _ in cuts]
+    for _, cutter, _ in cuts:
+        bpy.data.objects.remove(cutter, do_unlink=True)
+    if error is not None:
+        for mesh in new_meshes + cutter_meshes:
+            bpy.data.meshes.remove(mesh)
+        raise ValueError(error)
+
+    old_meshes = []
+    for (target, _, _), new_mesh in zip(cuts, new_meshes):
+        old_meshes.append(target.data)
+        new_mesh.name = target.data.name
+        target.data = new_mesh
+    # Don't remove the old meshes here — bypasses undo system. They are
+    # handed to the orphan registry, which purges them later.
+    bpy.data.objects.remove(gp_obj, do_unlink=True)
+    track_replaced_meshes(*old_meshes, *cutter_meshes)
+    return list(targets)
+
+
 class GPTOOLS_OT_bool_cut(bpy.types.Operator):
-    """Boolean-cut a shape drawn with Grease Pencil from a target mesh"""
+    """Boolean-cut a shape drawn with Grease Pencil from the selected meshes"""
 
     bl_idname = "gptools.bool_cut"
     bl_label = "Bool Cut"
@@ -504,10 +574,10 @@ class GPTOOLS_OT_bool_cut(bpy.types.Operator):
     )
     resolution: bpy.props.IntProperty(
         name="Resolution",
-        default=64,
-        min=8,
+        default=0,
+        min=0,
         max=512,
-        description="Number of points to resample the cut shape",
+        description="Number of points to resample the cut shape (0 = use the strokes as drawn)",
     )
 
     @classmethod
@@ -524,64 +594,32 @@ class GPTOOLS_OT_bool_cut(bpy.types.Operator):
 
     def execute(self, context):
         gp_obj = get_active_grease_pencil(context)
-        target = _find_target_mesh(context, gp_obj)
-
-        if not target:
+        targets = [
+            obj for obj in context.selected_objects
+            if obj != gp_obj and obj.type == 'MESH'
+        ]
+        if not targets:
             self.report({"ERROR"}, "No selected mesh object found as cut target")
             return {"CANCELLED"}
 
-        # Build cutter mesh directly from cleaned GP strokes (PCA-aligned).
-        cutter = _build_cutter_from_strokes(context, gp_obj, target, self.cut_depth)
-        if not cutter:
-            self.report({"ERROR"}, "Could not create cutter mesh from GP strokes")
-            return {"CANCELLED"}
-
-        # Ensure cutter is visible to the boolean modifier
-        context.view_layer.update()
-
-        # Add boolean modifier to target mesh
-        bool_mod = target.modifiers.new(name="BoolCut", type='BOOLEAN')
-        bool_mod.operation = 'DIFFERENCE'
-        bool_mod.solver = 'EXACT'
-        bool_mod.object = cutter
-
-        # Hide cutter from viewport (boolean still uses it)
-        cutter.hide_set(True)
-
-        # Apply the boolean modifier via depsgraph (avoids nested undo steps
-        # that break Ctrl+Z when using bpy.ops.object.modifier_apply).
-        context.view_layer.objects.active = target
         try:
-            depsgraph = context.evaluated_depsgraph_get()
-            eval_target = target.evaluated_get(depsgraph)
-            new_mesh = bpy.data.meshes.new_from_object(eval_target)
-            if new_mesh is None or len(new_mesh.vertices) == 0:
-                raise RuntimeError("Boolean produced no geometry")
-            old_mesh = target.data
-            new_mesh.name = old_mesh.name
-            target.data = new_mesh
-            # Don't remove old_mesh — bypasses undo system.
-            target.modifiers.remove(bool_mod)
-        except Exception as e:
-            self.report({"ERROR"}, f"Boolean failed: {e}")
-            bpy.data.objects.remove(cutter, do_unlink=True)
-            return {"CANCELLED"}
-
-        # Verify the boolean didn't destroy the target
-        if len(target.data.polygons) == 0:
-            self.report({"ERROR"}, "Boolean produced empty geometry — try adjusting Cut Depth")
-            bpy.data.objects.remove(cutter, do_unlink=True)
+            bool_cut_targets(
+                gp_obj, targets, context.evaluated_depsgraph_get(),
+                context.scene.frame_current, self.cut_depth, self.resolution,
+            )
+        except ValueError as err:
+            self.report({"ERROR"}, str(err))
             return {"CANCELLED"}
 
-        # Cleanup: delete GP object and cutter
-        bpy.data.objects.remove(gp_obj, do_unlink=True)
-        bpy.data.objects.remove(cutter, do_unlink=True)
-
-        # Leave target selected and active
-        target.select_set(True)
-        context.view_layer.objects.active = target
+        # Leave the targets selected, the first one active
+        for target in targets:
+            target.select_set(True)
+        context.view_layer.objects.active = targets[0]
 
-        self.report({"INFO"}, f"Bool cut applied to '{target.name}'")
+        if len(targets) == 1:
+            self.report({"INFO"}, f"Bool cut applied to '{targets[0].name}'")
+        else:
+            self.report({"INFO"}, f"Bool cut applied to {len(targets)} meshes")
         return {"FINISHED"}
 
 
@@ -0,0 +1,300 @@
+import os
+import shutil
+import subprocess
+import tempfile
+
+import bpy
+from ..utils.bake import cache_directory, greasemesh_modifiers
+from ..utils.frame_cache import buffers_key, finished_frames, load_frame, split_frame_range
+from ..utils.freeze import is_frozen
+from ..utils.mesh_transfer import mesh_from_buffers
+from ..utils.modifier_io import set_input
+from ..utils.viewport_proxy import force_full_detail, restore_detail
+
+NODE_GROUP_NAME = "GreaseMesh_FrameSequence"
+MODIFIER_NAME = "FrameSequence"
+
+_WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "frame_worker.py",
+)
+
+
+# ---------------------------------------------------------------------------
+# Geometry Nodes graph — play back one baked mesh per frame.
+#
+#   Collection Info (one object per frame, in name order)
+#     → Instance on Points(single point, Pick Instance,
+#                          index = clamp(frame − Start Frame))
+#     → Realize Instances → Output
+# ---------------------------------------------------------------------------
+
+
+def get_or_create_frame_sequence_node_group():
+    """Get existing or build the FrameSequence geometry node group."""
+    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if ng is not None:
+        return ng
+
+    ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    iface = ng.interface
+    iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    iface.new_socket(name="Frames", in_out='INPUT', socket_type='NodeSocketCollection')
+    iface.new_socket(name="Start Frame", in_out='INPUT', socket_type='NodeSocketInt')
+    iface.new_socket(name="End Frame", in_out='INPUT', socket_type='NodeSocketInt')
+    iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    link = ng.links.new
+    nodes = ng.nodes
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-1000, 0)
+
+    frames = nodes.new('GeometryNodeCollectionInfo'); frames.location = (-600, 200)
+    frames.transform_space = 'ORIGINAL'
+    frames.inputs['Separate Children'].default_value = True
+    frames.inputs['Reset Children'].default_value = True
+    link(group_in.outputs['Frames'], frames.inputs['Collection'])
+
+    time = nodes.new('GeometryNodeInputSceneTime'); time.location = (-1000, -300)
+    floor = nodes.new('ShaderNodeMath'); floor.location = (-800, -300)
+    floor.operation = 'FLOOR'
+    link(time.outputs['Frame'], floor.inputs[0])
+    offset = nodes.new('ShaderNodeMath'); offset.location = (-600, -300)
+    offset.operation = 'SUBTRACT'
+    link(floor.outputs['Value'], offset.inputs[0])
+    link(group_in.outputs['Start Frame'], offset.inputs[1])
+    last = nodes.new('ShaderNodeMath'); last.location = (-600, -450)
+    last.operation = 'SUBTRACT'
+    link(group_in.outputs['End Frame'], last.inputs[0])
+    link(group_in.outputs['Start Frame'], last.inputs[1])
+    index = nodes.new('ShaderNodeClamp'); index.location = (-400, -300)
+    link(offset.outputs['Value'], index.inputs['Value'])
+    index.inputs['Min'].default_value = 0.0
+    link(last.outputs['Value'], index.inputs['Max'])
+
+    point = nodes.new('GeometryNodePoints'); point.location = (-600, 0)
+    point.inputs['Count'].default_value = 1
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints'); instance.location = (-200, 0)
+    instance.inputs['Pick Instance'].default_value = True
+    link(point.outputs['Points'], instance.inputs['Points'])
+    link(frames.outputs['Instances'], instance.inputs['Instance'])
+    link(index.outputs['Result'], instance.inputs['Instance Index'])
+
+    realize = nodes.new('GeometryNodeRealizeInstances'); realize.location = (0, 0)
+    link(instance.outputs['Instances'], realize.inputs['Geometry'])
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (200, 0)
+    link(realize.outputs['Geometry'], group_out.inputs['Geometry'])
+    return ng
+
+
+def build_frame_sequence(gp_obj, directory, frame_start, frame_end):
+    """Merge the per-frame buffers into a mesh object that plays them back.
+
+    Frames with identical geometry (held drawings) share one mesh. The frame
+    objects live in a collection that isn't linked to the scene; the returned
+    object instances the current frame's one through FrameSequence.
+    """
+    frames = bpy.data.collections.new(f"{gp_obj.name}_Frames")
+    meshes = {}
+    materials = list(gp_obj.data.materials)
+    for frame in range(frame_start, frame_end + 1):
+        data = load_frame(directory, frame)
+        key = buffers_key(data)
+        mesh = meshes.get(key)
+        if mesh is None:
+            name = f"{gp_obj.name}_F{frame:05d}"
+            mesh = mesh_from_buffers(name, data) if data is not None else bpy.data.meshes.new(name)
+            for mat in materials:
+                mesh.materials.append(mat)
+            meshes[key] = mesh
+        # Zero padding keeps the collection's name order equal to frame order
+        frames.objects.link(bpy.data.objects.new(f"{gp_obj.name}_F{frame:05d}", mesh))
+
+    result = bpy.data.objects.new(f"{gp_obj.name}_Baked", bpy.data.meshes.new(f"{gp_obj.name}_Baked"))
+    for col in gp_obj.users_collection:
+        col.objects.link(result)
+    result.matrix_world = gp_obj.matrix_world.copy()
+
+    mod = result.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = get_or_create_frame_sequence_node_group()
+    values = {"Frames": frames, "Start Frame": frame_start, "End Frame": frame_end}
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) == 'INPUT' and item.name in values:
+            set_input(mod, item.identifier, values[item.name])
+    return result, len(meshes)
+
+
+def _last_line(path):
+    """Last non-empty line of a worker log, for reporting a failure."""
+    try:
+        with open(path, "rb") as log:
+            lines = log.read().decode(errors="replace").strip().splitlines()
+    except OSError:
+        return "no log"
+    return lines[-1] if lines else "no output"
+
+
+class GPTOOLS_OT_bake_frames_parallel(bpy.types.Operator):
+    """Bake an animated GreaseMesh object frame by frame in background
+    Blender processes, then merge the frames into a mesh sequence object"""
+
+    bl_idname = "gptools.bake_frames_parallel"
+    bl_label = "Bake Frames in Background"
+    bl_options = {"REGISTER", "UNDO"}
+
+    workers: bpy.props.IntProperty(
+        name="Workers",
+        default=max(1, (os.cpu_count() or 2) // 2),
+        min=1,
+        max=64,
+        description="Number of background Blender processes",
+    )
+    frame_start: bpy.props.IntProperty(name="Start", default=1)
+    frame_end: bpy.props.IntProperty(name="End", default=250)
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'GREASEPENCIL' and bool(greasemesh_modifiers(obj))
+
+    def invoke(self, context, event):
+        self.frame_start = context.scene.frame_start
+        self.frame_end = context.scene.frame_end
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        obj = context.active_object
+        if self.frame_end < self.frame_start:
+            self.report({"ERROR"}, "Frame range end is before its start")
+            return {"CANCELLED"}
+        if is_frozen(obj):
+            self.report({"ERROR"}, f"'{obj.name}' is frozen; unfreeze it first")
+            return {"CANCELLED"}
+
+        # Unsaved files bake into a temporary folder, removed when done
+        self._temporary = not bpy.data.filepath
+        if self._temporary:
+            self._directory = tempfile.mkdtemp(prefix="greasemesh_frames_")
+        else:
+            self._directory = bpy.path.abspath(cache_directory(obj) + "frames")
+        os.makedirs(self._directory, exist_ok=True)
+        for name in os.listdir(self._directory):
+            if name.endswith((".npz", ".part", ".log")):
+                os.remove(os.path.join(self._directory, name))
+
+        # Workers evaluate a saved copy at full (render) detail
+        self._source = source = os.path.join(self._directory, "source.blend")
+        saved = force_full_detail([obj])
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=source, copy=True)
+        finally:
+            restore_detail(saved)
+
+        chunks = split_frame_range(self.frame_start, self.frame_end, self.workers)
+        threads = max(1, (os.cpu_count() or 1) // len(chunks))
+        self._processes = []
+        self._logs = []
+        for start, end in chunks:
+            cmd = [
+                bpy.app.binary_path, "-b", "--factory-startup", "-t", str(threads),
+                source, "--python", _WORKER_SCRIPT, "--",
+                "--object", obj.name, "--start", str(start), "--end", str(end),
+                "--output", self._directory,
+            ]
+            log = os.path.join(self._directory, f"worker_{start:06d}.log")
+            with open(log, "wb") as out:
+                self._processes.append(subprocess.Popen(cmd, stdout=out, stderr=subprocess.STDOUT))
+            self._logs.append(log)
+
+        self._object_name = obj.name
+        self._total = self.frame_end - self.frame_start + 1
+        wm = context.window_manager
+        wm.progress_begin(0, self._total)
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({"INFO"}, f"Baking {self._total} frames in {len(chunks)} worker(s)…")
+        return {"RUNNING_MODAL"}
+
+    def _finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        if self._temporary:
+            shutil.rmtree(self._directory, ignore_errors=True)
+        elif os.path.exists(self._source):
+            os.remove(self._source)
+
+    def _stop_workers(self):
+        for proc in self._processes:
+            if proc.poll() is None:
+                proc.terminate()
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._stop_workers()
+            self._finish(context)
+            self.report({"WARNING"}, "Background bake cancelled.")
+            return {"CANCELLED"}
+        if event.type != 'TIMER':
+            return {"PASS_THROUGH"}
+
+        done = finished_frames(self._directory, self.frame_start, self.frame_end)
+        context.window_manager.progress_update(done)
+        context.workspace.status_text_set(
+            f"GreaseMesh: baked {done}/{self._total} frames (Esc to cancel)"
+        )
+
+        failed = [log for p, log in zip(self._processes, self._logs) if p.poll() not in (None, 0)]
+        if failed:
+            self._stop_workers()
+            if self._temporary:
+                message = f"A bake worker failed: {_last_line(failed[0])}"
+            else:
+                message = f"A bake worker failed; see {failed[0]}"
+            self._finish(context)
+            self.report({"ERROR"}, message)
+            return {"CANCELLED"}
+        if any(p.poll() is None for p in self._processes):
+            return {"PASS_THROUGH"}
+
+        obj = bpy.data.objects.get(self._object_name)
+        if obj is None or done < self._total:
+            self._finish(context)
+            self.report({"ERROR"}, f"Workers finished with {done}/{self._total} frames written.")
+            return {"CANCELLED"}
+
+        try:
+            result, unique = build_frame_sequence(obj, self._directory, self.frame_start, self.frame_end)
+        finally:
+            self._finish(context)
+        obj.hide_set(True)
+        obj.hide_render = True
+        for o in context.selected_objects:
+            o.select_set(False)
+        result.select_set(True)
+        context.view_layer.objects.active = result
+        self.report(
+            {"INFO"},
+            f"Baked {self._total} frames ({unique} unique) into '{result.name}'.",
+        )
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_bake_frames_parallel,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
@@ -0,0 +1,82 @@
+import bpy
+from ..utils.freeze import freeze_objects, is_animated, is_frozen, unfreeze_object, unfreeze_on_change
+
+
+class GPTOOLS_OT_freeze_greasemesh(bpy.types.Operator):
+    """Freeze the selected Grease Pencil objects into a cached mesh, or bring
+    them back to their live modifiers. Frozen objects unfreeze on their own
+    once their strokes or modifier inputs change"""
+
+    bl_idname = "gptools.freeze_greasemesh"
+    bl_label = "Freeze GreaseMesh"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('FREEZE', "Freeze", "Replace the modifier stack with its cached result"),
+            ('UNFREEZE', "Unfreeze", "Evaluate the modifier stack live again"),
+        ],
+        default='FREEZE',
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return any(o.type == 'GREASEPENCIL' for o in context.selected_objects)
+
+    def execute(self, context):
+        objects = [o for o in context.selected_objects if o.type == 'GREASEPENCIL']
+
+        if self.action == 'UNFREEZE':
+            count = sum(unfreeze_object(obj) for obj in objects)
+            if count == 0:
+                self.report({"INFO"}, "No frozen objects selected.")
+                return {"CANCELLED"}
+            self.report({"INFO"}, f"Unfroze {count} object(s).")
+            return {"FINISHED"}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        already = sum(is_frozen(obj) for obj in objects)
+        animated = [obj.name for obj in objects if not is_frozen(obj) and is_animated(obj, context.scene)]
+        frozen = freeze_objects(objects, context.evaluated_depsgraph_get())
+        if not frozen:
+            if animated:
+                self.report({"ERROR"}, f"Frame-by-frame drawings can't be frozen: {', '.join(animated)}")
+            elif already:
+                self.report({"INFO"}, "Selected objects are already frozen.")
+            else:
+                self.report({"ERROR"}, "No mesh geometry produced by modifiers.")
+            return {"CANCELLED"}
+
+        if animated:
+            self.report(
+                {"WARNING"},
+                f"Froze {len(frozen)} object(s); left frame-by-frame drawings live: {', '.join(animated)}",
+            )
+        else:
+            self.report({"INFO"}, f"Froze {len(frozen)} object(s).")
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_freeze_greasemesh,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    if unfreeze_on_change not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(unfreeze_on_change)
+
+
+def unregister():
+    if unfreeze_on_change in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(unfreeze_on_change)
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
@@ -1,17 +1,41 @@
 import bpy
-from ..utils.conversion import get_active_grease_pencil
-from ..utils.modifier_io import set_input
+import numpy as np
+from ..utils.conversion import get_active_grease_pencil, scoped_drawings
+from ..utils.budget import check_budget
+from ..utils.viewport_proxy import (
+    add_proxy_sockets,
+    apply_viewport_proxy,
+    proxy_count,
+    proxy_noise,
+)
+from ..utils.topology import (
+    add_topology_sockets,
+    dissolve_straight_points,
+    optimized_fill,
+    triangulate_output,
+)
 from .gn_solid_mesh import (
-    _pca_plane,
     _viewport_camera_position,
-    _sign_correct_outward,
-    _build_basis,
+    fit_oriented_basis,
+    set_basis_inputs,
     _add_dot,
     _add_scale,
     _add_vec_op,
 )
+from ..utils.bake import add_bake_node
+from ..utils.fill_extrude import BLOCKS_DEFAULTS, blocks_buffers, read_strokes, resolve_settings
+from ..utils.frame_basis import (
+    add_basis_table_socket,
+    basis_inputs,
+    stroke_points,
+    update_basis_table,
+)
+from ..utils.node_groups import (
+    finish_node_group, register_node_group, reset_node_group, unregister_node_group,
+)
 
 NODE_GROUP_NAME = "GreaseMesh_Blocks"
+NODE_GROUP_VERSION = 1
 MODIFIER_NAME = "BlocksMesh"
 PAINT_LAYER_NAME = "Paint"
 
@@ -20,17 +44,16 @@ def _layer_has_strokes(layer):
     return any(len(f.drawing.strokes) > 0 for f in layer.frames)
 
 
-def _gather_path_points_local(gp_obj):
+def _gather_path_points_local(gp_obj, frame=None):
     """Path strokes are anything NOT on the Paint layer — typically the GP's
     default 'Layer'. Collected for the PCA basis fit."""
     pts = []
-    for layer in gp_obj.data.layers:
+    for layer, drawing in scoped_drawings(gp_obj, frame):
         if layer.name == PAINT_LAYER_NAME:
             continue
-        for frame in layer.frames:
-            for s in frame.drawing.strokes:
-                for p in s.points:
-                    pts.append(p.position.copy())
+        for s in drawing.strokes:
+            for p in s.points:
+                pts.append(p.position.copy())
     return pts
 
 
@@ -56,7 +79,7 @@ def _show_properties_tab(context, tab):
                     if space.type == 'PROPERTIES':
                         space.context = tab
                         return
-    except TypeError:
+    except (AttributeError, TypeError):
         pass
 
 
@@ -78,13 +101,7 @@ def _show_properties_tab(context, tab):
 
 
 def get_or_create_blocks_node_group():
-    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
-    if ng is not None:
-        ng.nodes.clear()
-        for item in list(ng.interface.items_tree):
-            ng.interface.remove(item)
-    else:
-        ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
 
     iface = ng.interface
     iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
@@ -137,6 +154,10 @@ def get_or_create_blocks_node_group():
         s = iface.new_socket(name=hidden_name, in_out='INPUT', socket_type='NodeSocketVector')
         s.default_value = default
         s.hide_in_modifier = True
+    add_basis_table_socket(iface)
+
+    add_proxy_sockets(iface, noise=True)
+    add_topology_sockets(iface)
 
     iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
 
@@ -144,6 +165,7 @@ def get_or_create_blocks_node_group():
     nodes = ng.nodes
 
     group_in = nodes.new('NodeGroupInput'); group_in.location = (-2400, 0)
+    basis = basis_inputs(ng, group_in, x=-2400, y=1200)
 
     # Filter input GP to the Paint layer only — Path layer is operator-side basis source.
     paint_sel = nodes.new('GeometryNodeInputNamedLayerSelection'); paint_sel.location = (-2300, -150)
@@ -159,7 +181,7 @@ def get_or_create_blocks_node_group():
     fillet.inputs['Mode'].default_value = 'Poly'
     link(gp_to_curves.outputs['Curves'], fillet.inputs['Curve'])
     link(group_in.outputs['Corner Radius'], fillet.inputs['Radius'])
-    link(group_in.outputs['Corner Resolution'], fillet.inputs['Count'])
+    link(proxy_count(ng, group_in, 'Corner Resolution', minimum=1), fillet.inputs['Count'])
 
     curve_to_mesh = nodes.new('GeometryNodeCurveToMesh'); curve_to_mesh.location = (-1700, 0)
     link(fillet.outputs['Curve'], curve_to_mesh.inputs['Curve'])
@@ -168,11 +190,11 @@ def get_or_create_blocks_node_group():
     pos1 = nodes.new('GeometryNodeInputPosition'); pos1.location = (-1600, 300)
     rel1 = nodes.new('ShaderNodeVectorMath'); rel1.location = (-1400, 300); rel1.operation = 'SUBTRACT'
     link(pos1.outputs['Position'], rel1.inputs[0])
-    link(group_in.outputs['Center'], rel1.inputs[1])
+    link(basis['Center'], rel1.inputs[1])
 
-    dot_u = _add_dot(ng, "rel·U", rel1.outputs['Vector'], group_in.outputs['U'])
-    dot_v = _add_dot(ng, "rel·V", rel1.outputs['Vector'], group_in.outputs['V'])
-    dot_n = _add_dot(ng, "rel·N", rel1.outputs['Vector'], group_in.outputs['Normal'])
+    dot_u = _add_dot(ng, "rel·U", rel1.outputs['Vector'], basis['U'])
+    dot_v = _add_dot(ng, "rel·V", rel1.outputs['Vector'], basis['V'])
+    dot_n = _add_dot(ng, "rel·N", rel1.outputs['Vector'], basis['Normal'])
 
     combine_uvn = nodes.new('ShaderNodeCombineXYZ'); combine_uvn.location = (-800, 300)
     link(dot_u, combine_uvn.inputs['X'])
@@ -199,10 +221,10 @@ def get_or_create_blocks_node_group():
 
     resample = nodes.new('GeometryNodeResampleCurve'); resample.location = (400, 0)
     link(set_cyclic.outputs['Curve'], resample.inputs['Curve'])
-    link(group_in.outputs['Resolution'], resample.inputs['Count'])
+    link(proxy_count(ng, group_in, 'Resolution', minimum=3), resample.inputs['Count'])
 
-    fill = nodes.new('GeometryNodeFillCurve'); fill.location = (600, 0)
-    link(resample.outputs['Curve'], fill.inputs['Curve'])
+    outline = dissolve_straight_points(ng, group_in, resample.outputs['Curve'], x=400, y=-700)
+    fill_mesh = optimized_fill(ng, group_in, outline, x=600, y=0)
 
     # ── Per-block jitter ────────────────────────────────────────────────────
     # Each Paint stroke fills as a disjoint mesh island. Mesh Island Index is
@@ -213,7 +235,7 @@ def get_or_create_blocks_node_group():
     # CaptureAttribute(domain=FACE) was tried first but in this Blender build
     # its value field is evaluated per-vertex regardless of the domain knob,
     # so per-face Index/Position came back as per-vertex values.
-    captured_geom = fill.outputs['Mesh']
+    captured_geom = fill_mesh
 
     isl = nodes.new('GeometryNodeInputMeshIsland'); isl.location = (700, -360)
     block_id_field = isl.outputs['Island Index']
@@ -313,10 +335,10 @@ def get_or_create_blocks_node_group():
     sep_pos = nodes.new('ShaderNodeSeparateXYZ'); sep_pos.location = (3000, 300)
     link(pos2.outputs['Position'], sep_pos.inputs[0])
 
-    u_scaled = _add_scale(ng, group_in.outputs['U'], sep_pos.outputs['X'])
-    v_scaled = _add_scale(ng, group_in.outputs['V'], sep_pos.outputs['Y'])
+    u_scaled = _add_scale(ng, basis['U'], sep_pos.outputs['X'])
+    v_scaled = _add_scale(ng, basis['V'], sep_pos.outputs['Y'])
     uv_sum = _add_vec_op(ng, 'ADD', u_scaled, v_scaled)
-    world_back = _add_vec_op(ng, 'ADD', uv_sum, group_in.outputs['Center'])
+    world_back = _add_vec_op(ng, 'ADD', uv_sum, basis['Center'])
 
     set_pos_back = nodes.new('GeometryNodeSetPosition'); set_pos_back.location = (3500, 0)
     link(set_pos_jitter.outputs['Geometry'], set_pos_back.inputs['Geometry'])
@@ -336,7 +358,7 @@ def get_or_create_blocks_node_group():
     extrude = nodes.new('GeometryNodeExtrudeMesh'); extrude.location = (3900, 0)
     extrude.inputs['Individual'].default_value = False
     link(merge_pre_extrude.outputs['Geometry'], extrude.inputs['Mesh'])
-    link(group_in.outputs['Normal'], extrude.inputs['Offset'])
+    link(basis['Normal'], extrude.inputs['Offset'])
     link(extrude_scale_field.outputs['Value'], extrude.inputs['Offset Scale'])
 
     flip = nodes.new('GeometryNodeFlipFaces'); flip.location = (2200, -200)
@@ -370,7 +392,7 @@ def get_or_create_blocks_node_group():
     noise_tex.noise_dimensions = '3D'
     link(seed_add.outputs['Vector'], noise_tex.inputs['Vector'])
     link(group_in.outputs['Noise Scale'], noise_tex.inputs['Scale'])
-    link(group_in.outputs['Noise Detail'], noise_tex.inputs['Detail'])
+    link(proxy_noise(ng, group_in, 'Noise Detail'), noise_tex.inputs['Detail'])
 
     noise_center = nodes.new('ShaderNodeVectorMath'); noise_center.location = (3200, -300); noise_center.operation = 'SUBTRACT'
     noise_center.inputs[1].default_value = (0.5, 0.5, 0.5)
@@ -384,10 +406,12 @@ def get_or_create_blocks_node_group():
     link(merge_post_extrude.outputs['Geometry'], noise_set_pos.inputs['Geometry'])
     link(noise_scale.outputs['Vector'], noise_set_pos.inputs['Offset'])
 
-    group_out = nodes.new('NodeGroupOutput'); group_out.location = (3800, 0)
-    link(noise_set_pos.outputs['Geometry'], group_out.inputs['Geometry'])
+    result = triangulate_output(ng, group_in, noise_set_pos.outputs['Geometry'], x=3800, y=0)
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (4200, 0)
+    link(add_bake_node(ng, result, x=4000, y=-300), group_out.inputs['Geometry'])
 
-    return ng
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
 
 
 # ---------------------------------------------------------------------------
@@ -395,6 +419,55 @@ def get_or_create_blocks_node_group():
 # ---------------------------------------------------------------------------
 
 
+def add_blocks_modifier(gp_obj, scene, depsgraph, view_position=None):
+    """Add (or refit) the BlocksMesh modifier on ``gp_obj``.
+
+    Creates the 'Paint' layer if needed. The plane is fitted to the strokes on
+    the other layers at the scene's current frame, its normal turned toward
+    ``view_position`` (ray casts when None). Raises ValueError when those
+    layers have too few points. Returns the modifier.
+    """
+    ensure_gp_layers(gp_obj)
+
+    path_pts = _gather_path_points_local(gp_obj, scene.frame_current)
+    if len(path_pts) < 3:
+        raise ValueError("Draw a line on any non-'Paint' layer first, then click Blocks again.")
+
+    center, u, v, normal = fit_oriented_basis(gp_obj, path_pts, scene, depsgraph, view_position)
+
+    node_group = get_or_create_blocks_node_group()
+
+    mod = gp_obj.modifiers.get(MODIFIER_NAME)
+    if mod is None or mod.type != 'NODES':
+        mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = node_group
+    apply_viewport_proxy(mod, scene.greasemesh)
+
+    set_basis_inputs(mod, center, u, v, normal)
+    update_basis_table(mod, gp_obj, scene, normal, skip_layers=(PAINT_LAYER_NAME,))
+
+    gp_obj.update_tag()
+    return mod
+
+
+def build_blocks_data(gp_obj, scene, depsgraph, view_position=None, **params):
+    """The BlocksMesh result at the scene's current frame, built straight
+    from the strokes without a modifier (see utils.fill_extrude).
+
+    ``params`` are named as the modifier inputs. Raises ValueError when the
+    non-Paint layers have too few points or Noise Strength is set. Returns
+    mesh buffers in local space, or None when no Paint stroke fills.
+    """
+    settings = resolve_settings(BLOCKS_DEFAULTS, params)
+    path_pts = stroke_points(gp_obj, scene.frame_current, skip_layers=(PAINT_LAYER_NAME,))
+    if len(path_pts) < 3:
+        raise ValueError("Draw a line on any non-'Paint' layer first, then click Blocks again.")
+
+    basis = fit_oriented_basis(gp_obj, path_pts, scene, depsgraph, view_position)
+    strokes = read_strokes(gp_obj, scene.frame_current, layers=(PAINT_LAYER_NAME,))
+    return blocks_buffers(strokes, [np.array(b) for b in basis], settings)
+
+
 class GPTOOLS_OT_gn_blocks_mesh(bpy.types.Operator):
     """Add a Geometry Nodes modifier on the Grease Pencil that turns each
     closed stroke on the 'Paint' layer into its own extruded solid, oriented
@@ -414,54 +487,21 @@ class GPTOOLS_OT_gn_blocks_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        ensure_gp_layers(gp_obj)
-
-        path_pts = _gather_path_points_local(gp_obj)
-        if len(path_pts) < 3:
+        try:
+            mod = add_blocks_modifier(
+                gp_obj, context.scene, context.evaluated_depsgraph_get(),
+                _viewport_camera_position(context),
+            )
+        except ValueError as err:
             # Activate the first non-Paint layer so the user can draw on it
             for layer in gp_obj.data.layers:
                 if layer.name != PAINT_LAYER_NAME:
                     gp_obj.data.layers.active = layer
                     break
             _show_properties_tab(context, 'DATA')
-            self.report(
-                {"WARNING"},
-                "Draw a line on any non-'Paint' layer first, then click Blocks again.",
-            )
+            self.report({"WARNING"}, str(err))
             return {"CANCELLED"}
-
-        centroid_local, normal_local = _pca_plane(path_pts)
-
-        mw = gp_obj.matrix_world
-        centroid_world = mw @ centroid_local
-        normal_world = (mw.to_3x3() @ normal_local).normalized()
-        oriented = _sign_correct_outward(centroid_world, normal_world, gp_obj, context)
-        if (oriented - normal_world).length > 1e-6:
-            normal_local = -normal_local
-        normal_local.normalize()
-
-        u_local, v_local = _build_basis(normal_local)
-
-        node_group = get_or_create_blocks_node_group()
-
-        mod = gp_obj.modifiers.get(MODIFIER_NAME)
-        if mod is None or mod.type != 'NODES':
-            mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
-        mod.node_group = node_group
-
-        socket_values = {
-            'Center': (centroid_local.x, centroid_local.y, centroid_local.z),
-            'U':      (u_local.x, u_local.y, u_local.z),
-            'V':      (v_local.x, v_local.y, v_local.z),
-            'Normal': (normal_local.x, normal_local.y, normal_local.z),
-        }
-        for item in node_group.interface.items_tree:
-            if getattr(item, 'in_out', None) != 'INPUT':
-                continue
-            if item.name in socket_values:
-                set_input(mod, item.identifier, socket_values[item.name])
-
-        gp_obj.update_tag()
+        check_budget(self, context, gp_obj, mod)
 
         for o in context.view_layer.objects:
             if o.select_get():
@@ -493,9 +533,11 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_blocks_node_group)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
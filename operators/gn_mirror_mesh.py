@@ -1,8 +1,16 @@
 import bpy
 from ..utils.conversion import get_active_grease_pencil
 from .gn_solid_mesh import get_or_create_solid_node_group
+from ..utils.budget import check_budget
+from ..utils.viewport_proxy import FACTOR_SOCKET, add_proxy_sockets, apply_viewport_proxy
+from ..utils.topology import add_topology_sockets, link_topology_inputs
+from ..utils.bake import add_bake_node
+from ..utils.node_groups import (
+    finish_node_group, is_current, register_node_group, reset_node_group, unregister_node_group,
+)
 
 NODE_GROUP_NAME = "GreaseMesh_Mirror"
+NODE_GROUP_VERSION = 1
 
 AXIS_NAMES = ["Mirror X", "Mirror Y", "Mirror Z"]
 AXIS_SCALES = [(-1, 1, 1), (1, -1, 1), (1, 1, -1)]
@@ -35,6 +43,9 @@ def _build_interface(ng):
     )
     s.default_value, s.min_value, s.max_value = 0.001, 0.0, 1.0
 
+    add_proxy_sockets(ng.interface)
+    add_topology_sockets(ng.interface)
+
     ng.interface.new_socket(
         name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry',
     )
@@ -132,11 +143,11 @@ def get_or_create_mirror_node_group():
         → Set Shade Smooth → Group Output
     """
     ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
-    if ng is not None:
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
         return ng
 
     solid_ng = get_or_create_solid_node_group()
-    ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
     _build_interface(ng)
 
     link = ng.links.new
@@ -154,6 +165,8 @@ def get_or_create_mirror_node_group():
     link(group_in.outputs['Geometry'], solid_group.inputs['Geometry'])
     link(group_in.outputs['Resolution'], solid_group.inputs['Resolution'])
     link(group_in.outputs['Thickness'], solid_group.inputs['Thickness'])
+    link(group_in.outputs[FACTOR_SOCKET], solid_group.inputs[FACTOR_SOCKET])
+    link_topology_inputs(ng, group_in, solid_group)
 
     # Shift so bbox min is at origin (mirror seam)
     x += 200
@@ -174,9 +187,17 @@ def get_or_create_mirror_node_group():
     group_out = ng.nodes.new('NodeGroupOutput')
     group_out.location = (x + 200, 0)
 
-    link(prev, group_out.inputs['Geometry'])
+    link(add_bake_node(ng, prev, x=x, y=-300), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
+
 
-    return ng
+def add_mirror_modifier(gp_obj, scene):
+    """Add a MirrorMesh modifier on ``gp_obj``. Returns the modifier."""
+    mod = gp_obj.modifiers.new(name="MirrorMesh", type='NODES')
+    mod.node_group = get_or_create_mirror_node_group()
+    apply_viewport_proxy(mod, scene.greasemesh)
+    return mod
 
 
 class GPTOOLS_OT_gn_mirror_mesh(bpy.types.Operator):
@@ -196,8 +217,8 @@ class GPTOOLS_OT_gn_mirror_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        mod = gp_obj.modifiers.new(name="MirrorMesh", type='NODES')
-        mod.node_group = get_or_create_mirror_node_group()
+        mod = add_mirror_modifier(gp_obj, context.scene)
+        check_budget(self, context, gp_obj, mod)
 
         context.view_layer.objects.active = gp_obj
         gp_obj.select_set(True)
@@ -210,7 +231,7 @@ class GPTOOLS_OT_gn_mirror_mesh(bpy.types.Operator):
                             space.context = 'MODIFIER'
                             break
                     break
-        except TypeError:
+        except (AttributeError, TypeError):
             pass
 
         self.report({"INFO"}, "Mirror mesh GN modifier added.")
@@ -223,9 +244,11 @@ classes = [GPTOOLS_OT_gn_mirror_mesh]
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_mirror_node_group)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
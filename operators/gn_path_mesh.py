@@ -1,8 +1,21 @@
 import bpy
 from ..utils.conversion import get_active_grease_pencil
 from ..utils.modifier_io import set_menu
+from ..utils.budget import check_budget
+from ..utils.viewport_proxy import (
+    add_proxy_sockets,
+    apply_viewport_proxy,
+    proxy_count,
+    proxy_noise,
+)
+from ..utils.topology import add_topology_sockets, dissolve_straight_points, triangulate_output
+from ..utils.bake import add_bake_node
+from ..utils.node_groups import (
+    finish_node_group, is_current, register_node_group, reset_node_group, unregister_node_group,
+)
 
 NODE_GROUP_NAME = "GreaseMesh_Path"
+NODE_GROUP_VERSION = 1
 
 PROFILE_LAYER_NAME = "Profile"
 PATH_LAYER_NAME = "Path"
@@ -102,6 +115,9 @@ def _build_interface(ng):
     )
     s.default_value, s.min_value, s.max_value = 0, 0, 10000
 
+    add_proxy_sockets(ng.interface, noise=True)
+    add_topology_sockets(ng.interface)
+
     ng.interface.new_socket(
         name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry',
     )
@@ -123,7 +139,7 @@ def _add_gp_branch(ng, link, group_in, layer_name, res_socket_name, cyclic, x, y
     link(group_in.outputs['Geometry'], gp_to_curves.inputs['Grease Pencil'])
     link(sel.outputs['Selection'], gp_to_curves.inputs['Selection'])
     link(gp_to_curves.outputs['Curves'], resample.inputs['Curve'])
-    link(group_in.outputs[res_socket_name], resample.inputs['Count'])
+    link(proxy_count(ng, group_in, res_socket_name, minimum=3), resample.inputs['Count'])
 
     out = resample.outputs['Curve']
 
@@ -310,10 +326,10 @@ def get_or_create_path_node_group():
       Curve to Mesh(path, centered_profile, Fill Caps) → Output
     """
     ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
-    if ng is not None:
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
         return ng
 
-    ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
     _build_interface(ng)
 
     link = ng.links.new
@@ -326,6 +342,7 @@ def get_or_create_path_node_group():
         ng, link, group_in, PROFILE_LAYER_NAME, 'Profile Resolution',
         cyclic=True, x=-800, y=200,
     )
+    profile_out = dissolve_straight_points(ng, group_in, profile_out, x=-800, y=900)
     centered_profile = _add_center_offset(ng, link, profile_out, x=0, y=200)
     flattened_profile = _add_flatten_profile(ng, link, centered_profile, x=1100, y=200)
 
@@ -372,10 +389,11 @@ def get_or_create_path_node_group():
     link(merge.outputs['Geometry'], edges_to_curve.inputs['Mesh'])
     link(edges_to_curve.outputs['Curve'], fillet.inputs['Curve'])
     link(group_in.outputs['Corner Radius'], fillet.inputs['Radius'])
-    link(group_in.outputs['Corner Resolution'], fillet.inputs['Count'])
+    link(proxy_count(ng, group_in, 'Corner Resolution', minimum=1), fillet.inputs['Count'])
     link(fillet.outputs['Curve'], path_resample.inputs['Curve'])
-    link(group_in.outputs['Path Resolution'], path_resample.inputs['Count'])
-    link(path_resample.outputs['Curve'], set_normal.inputs['Curve'])
+    link(proxy_count(ng, group_in, 'Path Resolution', minimum=2), path_resample.inputs['Count'])
+    path_curve = dissolve_straight_points(ng, group_in, path_resample.outputs['Curve'], x=path_x + 1200, y=path_y - 700)
+    link(path_curve, set_normal.inputs['Curve'])
     link(group_in.outputs['Normal Mode'], set_normal.inputs['Mode'])
     path_out = set_normal.outputs['Curve']
 
@@ -437,7 +455,7 @@ def get_or_create_path_node_group():
     link(seed_combine.outputs['Vector'], seed_add.inputs[1])
     link(seed_add.outputs['Vector'], noise_tex.inputs['Vector'])
     link(group_in.outputs['Noise Scale'], noise_tex.inputs['Scale'])
-    link(group_in.outputs['Noise Detail'], noise_tex.inputs['Detail'])
+    link(proxy_noise(ng, group_in, 'Noise Detail'), noise_tex.inputs['Detail'])
     link(noise_tex.outputs['Color'], noise_center.inputs[0])
     link(noise_center.outputs['Vector'], noise_scale.inputs[0])
     link(group_in.outputs['Noise Strength'], noise_scale.inputs['Scale'])
@@ -445,9 +463,10 @@ def get_or_create_path_node_group():
     # shade_flat → noise_set_pos → group_out
     link(shade_flat.outputs['Mesh'], noise_set_pos.inputs['Geometry'])
     link(noise_scale.outputs['Vector'], noise_set_pos.inputs['Offset'])
-    link(noise_set_pos.outputs['Geometry'], group_out.inputs['Geometry'])
+    result = triangulate_output(ng, group_in, noise_set_pos.outputs['Geometry'], x=3200, y=-300)
+    link(add_bake_node(ng, result, x=3400, y=-300), group_out.inputs['Geometry'])
 
-    return ng
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
 
 
 def _show_properties_tab(context, tab):
@@ -459,11 +478,52 @@ def _show_properties_tab(context, tab):
                     if space.type == 'PROPERTIES':
                         space.context = tab
                         return
-    except TypeError:
+    except (AttributeError, TypeError):
         pass
 
 
 
+_MISSING_MESSAGES = {
+    PROFILE_LAYER_NAME: "Draw the profile shape, then click Path Mesh again.",
+    PATH_LAYER_NAME: "No strokes on 'Path' layer. Draw your sweep line there.",
+}
+
+
+def _missing_layers(gp_obj):
+    """Names of the Profile/Path layers that have no strokes yet."""
+    layers = gp_obj.data.layers
+    return [
+        name for name in (PROFILE_LAYER_NAME, PATH_LAYER_NAME)
+        if not (layers.get(name) and _layer_has_strokes(layers.get(name)))
+    ]
+
+
+def add_path_modifier(gp_obj, scene):
+    """Add a PathMesh modifier on ``gp_obj``.
+
+    Creates the 'Profile' and 'Path' layers if needed and raises ValueError
+    while either of them is empty. Returns the modifier.
+    """
+    ensure_gp_layers(gp_obj)
+    missing = _missing_layers(gp_obj)
+    if len(missing) == 2:
+        raise ValueError("Draw a line first, then click Path Mesh again.")
+    if missing:
+        raise ValueError(_MISSING_MESSAGES[missing[0]])
+
+    mod = gp_obj.modifiers.new(name="PathMesh", type='NODES')
+    mod.node_group = get_or_create_path_node_group()
+    apply_viewport_proxy(mod, scene.greasemesh)
+
+    # Set Normal Mode default to Minimum Twist
+    for item in mod.node_group.interface.items_tree:
+        if item.name == 'Normal Mode' and item.socket_type == 'NodeSocketMenu':
+            set_menu(mod, item.identifier, 'Minimum Twist',
+                     legacy_value=0, legacy_menu='Minimum Twist')
+            break
+    return mod
+
+
 class GPTOOLS_OT_gn_path_mesh(bpy.types.Operator):
     """Add Geometry Nodes modifier to sweep a profile along a path from Grease Pencil layers"""
 
@@ -481,42 +541,16 @@ class GPTOOLS_OT_gn_path_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        ensure_gp_layers(gp_obj)
-
-        gp_data = gp_obj.data
-        profile = gp_data.layers.get(PROFILE_LAYER_NAME)
-        path = gp_data.layers.get(PATH_LAYER_NAME)
-        has_profile = profile and _layer_has_strokes(profile)
-        has_path = path and _layer_has_strokes(path)
-
-        if not has_profile and not has_path:
-            self.report({"WARNING"}, "Draw a line first, then click Path Mesh again.")
-            return {"CANCELLED"}
-
-        if not has_profile:
-            _show_properties_tab(context, 'DATA')
-            gp_data.layers.active = profile
-            self.report(
-                {"WARNING"},
-                "Draw the profile shape, then click Path Mesh again.",
-            )
-            return {"CANCELLED"}
-
-        if not has_path:
-            _show_properties_tab(context, 'DATA')
-            gp_data.layers.active = path
-            self.report({"WARNING"}, "No strokes on 'Path' layer. Draw your sweep line there.")
+        try:
+            mod = add_path_modifier(gp_obj, context.scene)
+        except ValueError as err:
+            missing = _missing_layers(gp_obj)
+            if len(missing) == 1:
+                _show_properties_tab(context, 'DATA')
+                gp_obj.data.layers.active = gp_obj.data.layers.get(missing[0])
+            self.report({"WARNING"}, str(err))
             return {"CANCELLED"}
-
-        mod = gp_obj.modifiers.new(name="PathMesh", type='NODES')
-        mod.node_group = get_or_create_path_node_group()
-
-        # Set Normal Mode default to Minimum Twist
-        for item in mod.node_group.interface.items_tree:
-            if item.name == 'Normal Mode' and item.socket_type == 'NodeSocketMenu':
-                set_menu(mod, item.identifier, 'Minimum Twist',
-                         legacy_value=0, legacy_menu='Minimum Twist')
-                break
+        check_budget(self, context, gp_obj, mod)
 
         context.view_layer.objects.active = gp_obj
         gp_obj.select_set(True)
@@ -533,9 +567,11 @@ classes = [GPTOOLS_OT_gn_path_mesh]
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_path_node_group)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
@@ -0,0 +1,275 @@
+import bpy
+import math
+from ..utils.modifier_io import set_input
+from .gn_solid_mesh import _add_dot, _add_scale, _add_vec_op
+from ..utils.bake import add_bake_node
+from ..utils.node_groups import finish_node_group, is_current, reset_node_group
+
+NODE_GROUP_NAME = "GreaseMesh_Screw"
+MODIFIER_NAME = "ScrewMesh"
+NODE_GROUP_VERSION = 1
+
+RH_ATTR = "_gm_screw_rh"
+ANGLE_ATTR = "_gm_screw_angle"
+
+
+# ---------------------------------------------------------------------------
+# Geometry Nodes graph — lathe around a precomputed axis.
+#
+#   strokes (3D)
+#     → GP→Curves → Resample
+#     → Store (r, h)              r = distance from axis, h = height along it
+#   Curve Circle (Resolution = adaptive steps, from max r and the tolerance)
+#     → Store angle               atan2 on the unit circle
+#   Curve to Mesh(circle, profile) gives the ring × profile topology, then
+#     → Set Position              Center + Axis·h + (Radial·cos a + Depth·sin a)·r
+#
+# Positions are rebuilt from the stored attributes, so the result doesn't
+# depend on Curve to Mesh's frame conventions.
+# ---------------------------------------------------------------------------
+
+
+def _add_math(ng, op, a, b=None, default_b=None):
+    n = ng.nodes.new('ShaderNodeMath')
+    n.operation = op
+    ng.links.new(a, n.inputs[0])
+    if b is not None:
+        ng.links.new(b, n.inputs[1])
+    elif default_b is not None:
+        n.inputs[1].default_value = default_b
+    return n.outputs['Value']
+
+
+def get_or_create_screw_node_group():
+    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
+        return ng
+
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
+
+    iface = ng.interface
+    iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+
+    res = iface.new_socket(name="Profile Resolution", in_out='INPUT', socket_type='NodeSocketInt')
+    res.default_value, res.min_value, res.max_value = 64, 2, 1024
+
+    tol = iface.new_socket(name="Tolerance", in_out='INPUT', socket_type='NodeSocketFloat')
+    tol.default_value, tol.min_value, tol.max_value = 0.01, 0.0001, 10.0
+    tol.subtype = 'DISTANCE'
+
+    rtol = iface.new_socket(name="Render Tolerance", in_out='INPUT', socket_type='NodeSocketFloat')
+    rtol.default_value, rtol.min_value, rtol.max_value = 0.002, 0.0001, 10.0
+    rtol.subtype = 'DISTANCE'
+
+    smin = iface.new_socket(name="Min Steps", in_out='INPUT', socket_type='NodeSocketInt')
+    smin.default_value, smin.min_value, smin.max_value = 8, 3, 1024
+
+    smax = iface.new_socket(name="Max Steps", in_out='INPUT', socket_type='NodeSocketInt')
+    smax.default_value, smax.min_value, smax.max_value = 512, 3, 4096
+
+    angle = iface.new_socket(name="Smooth Angle", in_out='INPUT', socket_type='NodeSocketFloat')
+    angle.default_value, angle.min_value, angle.max_value = math.radians(30.0), 0.0, math.pi
+    angle.subtype = 'ANGLE'
+
+    iface.new_socket(name="Flip Normals", in_out='INPUT', socket_type='NodeSocketBool')
+
+    for hidden_name, default in (
+        ("Center", (0.0, 0.0, 0.0)),
+        ("Axis", (0.0, 0.0, 1.0)),
+        ("Radial", (1.0, 0.0, 0.0)),
+        ("Depth", (0.0, 1.0, 0.0)),
+    ):
+        s = iface.new_socket(name=hidden_name, in_out='INPUT', socket_type='NodeSocketVector')
+        s.default_value = default
+        s.hide_in_modifier = True
+
+    iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    link = ng.links.new
+    nodes = ng.nodes
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-2000, 0)
+
+    gp_to_curves = nodes.new('GeometryNodeGreasePencilToCurves'); gp_to_curves.location = (-1800, 0)
+    gp_to_curves.inputs['Layers as Instances'].default_value = False
+    link(group_in.outputs['Geometry'], gp_to_curves.inputs['Grease Pencil'])
+
+    resample = nodes.new('GeometryNodeResampleCurve'); resample.location = (-1600, 0)
+    link(gp_to_curves.outputs['Curves'], resample.inputs['Curve'])
+    link(group_in.outputs['Profile Resolution'], resample.inputs['Count'])
+
+    # Profile coordinates relative to the axis: h = rel·Axis, r = |rel − Axis·h|
+    pos1 = nodes.new('GeometryNodeInputPosition'); pos1.location = (-1600, 300)
+    rel = _add_vec_op(ng, 'SUBTRACT', pos1.outputs['Position'], group_in.outputs['Center'])
+    height = _add_dot(ng, "rel·Axis", rel, group_in.outputs['Axis'])
+    along = _add_scale(ng, group_in.outputs['Axis'], height)
+    radial_vec = _add_vec_op(ng, 'SUBTRACT', rel, along)
+    radius_len = nodes.new('ShaderNodeVectorMath'); radius_len.location = (-1000, 300)
+    radius_len.operation = 'LENGTH'
+    link(radial_vec, radius_len.inputs[0])
+    radius = radius_len.outputs['Value']
+
+    rh = nodes.new('ShaderNodeCombineXYZ'); rh.location = (-800, 300)
+    link(radius, rh.inputs['X'])
+    link(height, rh.inputs['Y'])
+
+    store_rh = nodes.new('GeometryNodeStoreNamedAttribute'); store_rh.location = (-600, 0)
+    store_rh.data_type = 'FLOAT_VECTOR'
+    store_rh.domain = 'POINT'
+    store_rh.inputs['Name'].default_value = RH_ATTR
+    link(resample.outputs['Curve'], store_rh.inputs['Geometry'])
+    link(rh.outputs['Vector'], store_rh.inputs['Value'])
+
+    # Adaptive step count: fewest steps whose sagitta r·(1 − cos(π/n)) at the
+    # widest profile point stays within the (viewport or render) tolerance.
+    r_stat = nodes.new('GeometryNodeAttributeStatistic'); r_stat.location = (-600, -300)
+    r_stat.data_type = 'FLOAT'
+    r_stat.domain = 'POINT'
+    link(resample.outputs['Curve'], r_stat.inputs['Geometry'])
+    link(radius, r_stat.inputs['Attribute'])
+
+    is_viewport = nodes.new('GeometryNodeIsViewport'); is_viewport.location = (-600, -500)
+    tol_switch = nodes.new('GeometryNodeSwitch'); tol_switch.location = (-400, -500)
+    tol_switch.input_type = 'FLOAT'
+    link(is_viewport.outputs['Is Viewport'], tol_switch.inputs['Switch'])
+    link(group_in.outputs['Render Tolerance'], tol_switch.inputs['False'])
+    link(group_in.outputs['Tolerance'], tol_switch.inputs['True'])
+
+    r_max = _add_math(ng, 'MAXIMUM', r_stat.outputs['Max'], default_b=1e-6)
+    ratio = _add_math(ng, 'DIVIDE', tol_switch.outputs['Output'], r_max)
+    one_minus = nodes.new('ShaderNodeMath'); one_minus.location = (-200, -400)
+    one_minus.operation = 'SUBTRACT'
+    one_minus.inputs[0].default_value = 1.0
+    link(ratio, one_minus.inputs[1])
+    half_angle = _add_math(ng, 'ARCCOSINE', one_minus.outputs['Value'])
+    pi_over = nodes.new('ShaderNodeMath'); pi_over.location = (0, -400)
+    pi_over.operation = 'DIVIDE'
+    pi_over.inputs[0].default_value = math.pi
+    link(half_angle, pi_over.inputs[1])
+    steps_ceil = _add_math(ng, 'CEIL', pi_over.outputs['Value'])
+
+    steps = nodes.new('ShaderNodeClamp'); steps.location = (200, -400)
+    link(steps_ceil, steps.inputs['Value'])
+    link(group_in.outputs['Min Steps'], steps.inputs['Min'])
+    link(group_in.outputs['Max Steps'], steps.inputs['Max'])
+
+    circle = nodes.new('GeometryNodeCurvePrimitiveCircle'); circle.location = (400, -400)
+    circle.mode = 'RADIUS'
+    circle.inputs['Radius'].default_value = 1.0
+    link(steps.outputs['Result'], circle.inputs['Resolution'])
+
+    circle_pos = nodes.new('GeometryNodeInputPosition'); circle_pos.location = (400, -600)
+    circle_xyz = nodes.new('ShaderNodeSeparateXYZ'); circle_xyz.location = (600, -600)
+    link(circle_pos.outputs['Position'], circle_xyz.inputs[0])
+    ring_angle = nodes.new('ShaderNodeMath'); ring_angle.location = (800, -600)
+    ring_angle.operation = 'ARCTAN2'
+    link(circle_xyz.outputs['Y'], ring_angle.inputs[0])
+    link(circle_xyz.outputs['X'], ring_angle.inputs[1])
+
+    store_angle = nodes.new('GeometryNodeStoreNamedAttribute'); store_angle.location = (800, -400)
+    store_angle.data_type = 'FLOAT'
+    store_angle.domain = 'POINT'
+    store_angle.inputs['Name'].default_value = ANGLE_ATTR
+    link(circle.outputs['Curve'], store_angle.inputs['Geometry'])
+    link(ring_angle.outputs['Value'], store_angle.inputs['Value'])
+
+    sweep = nodes.new('GeometryNodeCurveToMesh'); sweep.location = (1000, 0)
+    link(store_angle.outputs['Geometry'], sweep.inputs['Curve'])
+    link(store_rh.outputs['Geometry'], sweep.inputs['Profile Curve'])
+
+    # Rebuild positions: Center + Axis·h + (Radial·cos a + Depth·sin a)·r
+    read_rh = nodes.new('GeometryNodeInputNamedAttribute'); read_rh.location = (1000, 400)
+    read_rh.data_type = 'FLOAT_VECTOR'
+    read_rh.inputs['Name'].default_value = RH_ATTR
+    rh_xyz = nodes.new('ShaderNodeSeparateXYZ'); rh_xyz.location = (1200, 400)
+    link(read_rh.outputs['Attribute'], rh_xyz.inputs[0])
+
+    read_angle = nodes.new('GeometryNodeInputNamedAttribute'); read_angle.location = (1000, 600)
+    read_angle.data_type = 'FLOAT'
+    read_angle.inputs['Name'].default_value = ANGLE_ATTR
+    cos_a = _add_math(ng, 'COSINE', read_angle.outputs['Attribute'])
+    sin_a = _add_math(ng, 'SINE', read_angle.outputs['Attribute'])
+
+    ring_dir = _add_vec_op(
+        ng, 'ADD',
+        _add_scale(ng, group_in.outputs['Radial'], cos_a),
+        _add_scale(ng, group_in.outputs['Depth'], sin_a),
+    )
+    ring_off = _add_scale(ng, ring_dir, rh_xyz.outputs['X'])
+    axis_off = _add_scale(ng, group_in.outputs['Axis'], rh_xyz.outputs['Y'])
+    world = _add_vec_op(ng, 'ADD', _add_vec_op(ng, 'ADD', ring_off, axis_off), group_in.outputs['Center'])
+
+    set_pos = nodes.new('GeometryNodeSetPosition'); set_pos.location = (1800, 0)
+    link(sweep.outputs['Mesh'], set_pos.inputs['Geometry'])
+    link(world, set_pos.inputs['Position'])
+
+    remove_rh = nodes.new('GeometryNodeRemoveAttribute'); remove_rh.location = (2000, 0)
+    remove_rh.inputs['Name'].default_value = RH_ATTR
+    link(set_pos.outputs['Geometry'], remove_rh.inputs['Geometry'])
+
+    remove_angle = nodes.new('GeometryNodeRemoveAttribute'); remove_angle.location = (2200, 0)
+    remove_angle.inputs['Name'].default_value = ANGLE_ATTR
+    link(remove_rh.outputs['Geometry'], remove_angle.inputs['Geometry'])
+
+    # Profile points on the axis collapse into one vertex per ring
+    merge = nodes.new('GeometryNodeMergeByDistance'); merge.location = (2400, 0)
+    merge.inputs['Distance'].default_value = 0.0001
+    link(remove_angle.outputs['Geometry'], merge.inputs['Geometry'])
+
+    flip = nodes.new('GeometryNodeFlipFaces'); flip.location = (2600, 0)
+    link(merge.outputs['Geometry'], flip.inputs['Mesh'])
+    link(group_in.outputs['Flip Normals'], flip.inputs['Selection'])
+
+    # Smooth by angle: smooth faces, then mark edges sharper than Smooth Angle
+    smooth = nodes.new('GeometryNodeSetShadeSmooth'); smooth.location = (2800, 0)
+    smooth.domain = 'FACE'
+    smooth.inputs['Shade Smooth'].default_value = True
+    link(flip.outputs['Mesh'], smooth.inputs['Mesh'])
+
+    edge_angle = nodes.new('GeometryNodeInputMeshEdgeAngle'); edge_angle.location = (2800, -200)
+    is_sharp = nodes.new('FunctionNodeCompare'); is_sharp.location = (3000, -200)
+    is_sharp.data_type = 'FLOAT'
+    is_sharp.operation = 'GREATER_THAN'
+    link(edge_angle.outputs['Unsigned Angle'], is_sharp.inputs['A'])
+    link(group_in.outputs['Smooth Angle'], is_sharp.inputs['B'])
+
+    sharp = nodes.new('GeometryNodeSetShadeSmooth'); sharp.location = (3000, 0)
+    sharp.domain = 'EDGE'
+    sharp.inputs['Shade Smooth'].default_value = False
+    link(smooth.outputs['Mesh'], sharp.inputs['Mesh'])
+    link(is_sharp.outputs['Result'], sharp.inputs['Selection'])
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (3200, 0)
+    link(add_bake_node(ng, sharp.outputs['Mesh'], x=3000, y=-300), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
+
+
+def add_screw_modifier(gp_obj, center, axis, radial):
+    """Add (or update) the GreaseMesh_Screw modifier on a GP object.
+
+    ``center`` is a point on the revolution axis and ``axis`` / ``radial``
+    are unit vectors, all in the GP object's local space.
+    """
+    node_group = get_or_create_screw_node_group()
+
+    mod = gp_obj.modifiers.get(MODIFIER_NAME)
+    if mod is None or mod.type != 'NODES':
+        mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = node_group
+
+    depth = axis.cross(radial).normalized()
+    socket_values = {
+        'Center': tuple(center),
+        'Axis':   tuple(axis),
+        'Radial': tuple(radial),
+        'Depth':  tuple(depth),
+    }
+    for item in node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) != 'INPUT':
+            continue
+        if item.name in socket_values:
+            set_input(mod, item.identifier, socket_values[item.name])
+
+    gp_obj.update_tag()
+    return mod
@@ -1,9 +1,32 @@
 import bpy
 import mathutils
-from ..utils.conversion import get_active_grease_pencil
-from ..utils.modifier_io import set_input
+import numpy as np
+from ..utils.conversion import get_active_grease_pencil, scoped_drawings
+from ..utils.modifier_io import get_inputs, set_input
+from ..utils.budget import check_budget
+from ..utils.viewport_proxy import (
+    FACTOR_SOCKET, add_proxy_sockets, apply_viewport_proxy, proxy_count, proxy_settings,
+)
+from ..utils.topology import (
+    add_topology_sockets,
+    dissolve_straight_points,
+    optimized_fill,
+    triangulate_output,
+)
+from ..utils.bake import add_bake_node
+from ..utils.fill_extrude import (
+    SOLID_DEFAULTS, mesh_buffers, read_strokes, resolve_settings, solid_buffers, solid_regions,
+)
+from ..utils.frame_basis import BASIS_NAMES, add_basis_table_socket, basis_inputs, update_basis_table
+from ..utils.regions import (
+    add_regions_socket, register_builder, regions_or, unregister_builder, update_regions,
+)
+from ..utils.node_groups import (
+    finish_node_group, register_node_group, reset_node_group, unregister_node_group,
+)
 
 NODE_GROUP_NAME = "GreaseMesh_Solid"
+NODE_GROUP_VERSION = 1
 MODIFIER_NAME = "SolidMesh"
 
 
@@ -15,42 +38,29 @@ MODIFIER_NAME = "SolidMesh"
 # ---------------------------------------------------------------------------
 
 
-def _gather_stroke_points_local(gp_obj):
+def _gather_stroke_points_local(gp_obj, frame=None):
     pts = []
-    for layer in gp_obj.data.layers:
-        for frame in layer.frames:
-            for s in frame.drawing.strokes:
-                for p in s.points:
-                    pts.append(p.position.copy())
+    for _, drawing in scoped_drawings(gp_obj, frame):
+        for s in drawing.strokes:
+            for p in s.points:
+                pts.append(p.position.copy())
     return pts
 
 
 def _pca_plane(pts):
-    """PCA on a Vector list → (centroid, smallest-eigenvector unit normal)."""
-    n = len(pts)
-    cx = sum(p.x for p in pts) / n
-    cy = sum(p.y for p in pts) / n
-    cz = sum(p.z for p in pts) / n
-    centroid = mathutils.Vector((cx, cy, cz))
-
-    cxx = cxy = cxz = cyy = cyz = czz = 0.0
-    for p in pts:
-        dx, dy, dz = p.x - cx, p.y - cy, p.z - cz
-        cxx += dx * dx; cxy += dx * dy; cxz += dx * dz
-        cyy += dy * dy; cyz += dy * dz; czz += dz * dz
-
-    try:
-        import numpy as np
-        cov = np.array([[cxx, cxy, cxz], [cxy, cyy, cyz], [cxz, cyz, czz]])
-        _, eigvecs = np.linalg.eigh(cov)
-        normal = mathutils.Vector(eigvecs[:, 0]).normalized()
-    except Exception:
-        normal = mathutils.Vector((0.0, 0.0, 1.0))
-    return centroid, normal
+    """PCA on stroke points (Vectors or an (N, 3) array) → (centroid,
+    smallest-eigenvector unit normal)."""
+    pts = np.asarray(pts, dtype=np.float64)
+    centroid = pts.mean(axis=0)
+    rel = pts - centroid
+    _, eigvecs = np.linalg.eigh(rel.T @ rel)
+    return mathutils.Vector(centroid), mathutils.Vector(eigvecs[:, 0]).normalized()
 
 
 def _viewport_camera_position(context):
     """Return the active 3D viewport's camera/eye world position, or None."""
+    if context.screen is None:
+        return None
     for area in context.screen.areas:
         if area.type != 'VIEW_3D':
             continue
@@ -65,18 +75,16 @@ def _viewport_camera_position(context):
     return None
 
 
-def _sign_correct_outward(centroid_world, normal_world, exclude_obj, context):
-    """Flip the normal so it points TOWARD the viewport camera. Falls back to
-    raycast (point away from nearby geometry) when no viewport is available."""
-    cam_pos = _viewport_camera_position(context)
-    if cam_pos is not None:
-        to_cam = (cam_pos - centroid_world).normalized()
+def _sign_correct_outward(centroid_world, normal_world, exclude_obj, scene, depsgraph, view_position=None):
+    """Flip the normal so it points TOWARD the viewer at ``view_position``.
+    Falls back to raycast (point away from nearby geometry) without one."""
+    if view_position is not None:
+        to_cam = (view_position - centroid_world).normalized()
         if normal_world.dot(to_cam) < 0:
             return -normal_world
         return normal_world
 
-    deps = bpy.context.evaluated_depsgraph_get()
-    scene = bpy.context.scene
+    deps = depsgraph
     eps = 1e-3
 
     def hit_distance(direction):
@@ -106,6 +114,37 @@ def _build_basis(normal):
     return u, v
 
 
+def fit_oriented_basis(gp_obj, pts, scene, depsgraph, view_position=None):
+    """PCA plane through local stroke points, its normal facing the viewer.
+
+    Returns (center, U, V, normal) in the object's local space.
+    """
+    centroid_local, normal_local = _pca_plane(pts)
+
+    mw = gp_obj.matrix_world
+    centroid_world = mw @ centroid_local
+    normal_world = (mw.to_3x3() @ normal_local).normalized()
+    oriented = _sign_correct_outward(
+        centroid_world, normal_world, gp_obj, scene, depsgraph, view_position,
+    )
+    if (oriented - normal_world).length > 1e-6:
+        normal_local = -normal_local
+    normal_local.normalize()
+
+    u_local, v_local = _build_basis(normal_local)
+    return centroid_local, u_local, v_local, normal_local
+
+
+def set_basis_inputs(mod, center, u, v, normal):
+    """Write a (center, U, V, normal) basis into the modifier's static inputs."""
+    socket_values = {'Center': center, 'U': u, 'V': v, 'Normal': normal}
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) != 'INPUT':
+            continue
+        if item.name in socket_values:
+            set_input(mod, item.identifier, tuple(socket_values[item.name]))
+
+
 # ---------------------------------------------------------------------------
 # Geometry Nodes graph — basis-change pipeline.
 #
@@ -147,13 +186,7 @@ def _add_vec_op(ng, op, a, b):
 
 
 def get_or_create_solid_node_group():
-    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
-    if ng is not None:
-        ng.nodes.clear()
-        for item in list(ng.interface.items_tree):
-            ng.interface.remove(item)
-    else:
-        ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
 
     iface = ng.interface
     iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
@@ -173,6 +206,11 @@ def get_or_create_solid_node_group():
         s = iface.new_socket(name=hidden_name, in_out='INPUT', socket_type='NodeSocketVector')
         s.default_value = default
         s.hide_in_modifier = True
+    add_basis_table_socket(iface)
+    add_regions_socket(iface)
+
+    add_proxy_sockets(iface)
+    add_topology_sockets(iface)
 
     iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
 
@@ -180,6 +218,7 @@ def get_or_create_solid_node_group():
     nodes = ng.nodes
 
     group_in = nodes.new('NodeGroupInput'); group_in.location = (-2200, 0)
+    basis = basis_inputs(ng, group_in, x=-2200, y=1200)
 
     gp_to_curves = nodes.new('GeometryNodeGreasePencilToCurves'); gp_to_curves.location = (-2000, 0)
     gp_to_curves.inputs['Layers as Instances'].default_value = False
@@ -192,11 +231,11 @@ def get_or_create_solid_node_group():
     pos1 = nodes.new('GeometryNodeInputPosition'); pos1.location = (-1700, 300)
     rel1 = nodes.new('ShaderNodeVectorMath'); rel1.location = (-1500, 300); rel1.operation = 'SUBTRACT'
     link(pos1.outputs['Position'], rel1.inputs[0])
-    link(group_in.outputs['Center'], rel1.inputs[1])
+    link(basis['Center'], rel1.inputs[1])
 
-    dot_u = _add_dot(ng, "rel·U", rel1.outputs['Vector'], group_in.outputs['U'])
-    dot_v = _add_dot(ng, "rel·V", rel1.outputs['Vector'], group_in.outputs['V'])
-    dot_n = _add_dot(ng, "rel·N", rel1.outputs['Vector'], group_in.outputs['Normal'])
+    dot_u = _add_dot(ng, "rel·U", rel1.outputs['Vector'], basis['U'])
+    dot_v = _add_dot(ng, "rel·V", rel1.outputs['Vector'], basis['V'])
+    dot_n = _add_dot(ng, "rel·N", rel1.outputs['Vector'], basis['Normal'])
 
     combine_uvn = nodes.new('ShaderNodeCombineXYZ'); combine_uvn.location = (-900, 300)
     link(dot_u, combine_uvn.inputs['X'])
@@ -247,23 +286,25 @@ def get_or_create_solid_node_group():
 
     resample = nodes.new('GeometryNodeResampleCurve'); resample.location = (300, 0)
     link(set_cyclic.outputs['Curve'], resample.inputs['Curve'])
-    link(group_in.outputs['Resolution'], resample.inputs['Count'])
+    link(proxy_count(ng, group_in, 'Resolution', minimum=3), resample.inputs['Count'])
 
-    fill = nodes.new('GeometryNodeFillCurve'); fill.location = (500, 0)
-    link(resample.outputs['Curve'], fill.inputs['Curve'])
+    outline = dissolve_straight_points(ng, group_in, resample.outputs['Curve'], x=300, y=-700)
+    fill_mesh = optimized_fill(ng, group_in, outline, x=500, y=0)
+    # Overlaps and holes arranged in Python (utils.regions) for static drawings
+    fill_mesh = regions_or(ng, group_in, fill_mesh, x=900, y=-600)
 
     # Reverse basis change on filled mesh: world = Center + p.x·U + p.y·V (Z=0 from Fill)
     pos2 = nodes.new('GeometryNodeInputPosition'); pos2.location = (600, 300)
     sep_pos = nodes.new('ShaderNodeSeparateXYZ'); sep_pos.location = (800, 300)
     link(pos2.outputs['Position'], sep_pos.inputs[0])
 
-    u_scaled = _add_scale(ng, group_in.outputs['U'], sep_pos.outputs['X'])
-    v_scaled = _add_scale(ng, group_in.outputs['V'], sep_pos.outputs['Y'])
+    u_scaled = _add_scale(ng, basis['U'], sep_pos.outputs['X'])
+    v_scaled = _add_scale(ng, basis['V'], sep_pos.outputs['Y'])
     uv_sum = _add_vec_op(ng, 'ADD', u_scaled, v_scaled)
-    world_back = _add_vec_op(ng, 'ADD', uv_sum, group_in.outputs['Center'])
+    world_back = _add_vec_op(ng, 'ADD', uv_sum, basis['Center'])
 
     set_pos_back = nodes.new('GeometryNodeSetPosition'); set_pos_back.location = (1700, 0)
-    link(fill.outputs['Mesh'], set_pos_back.inputs['Geometry'])
+    link(fill_mesh, set_pos_back.inputs['Geometry'])
     link(world_back, set_pos_back.inputs['Position'])
 
     merge_pre_extrude = nodes.new('GeometryNodeMergeByDistance'); merge_pre_extrude.location = (1900, 0)
@@ -273,7 +314,7 @@ def get_or_create_solid_node_group():
     extrude = nodes.new('GeometryNodeExtrudeMesh'); extrude.location = (2100, 0)
     extrude.inputs['Individual'].default_value = False
     link(merge_pre_extrude.outputs['Geometry'], extrude.inputs['Mesh'])
-    link(group_in.outputs['Normal'], extrude.inputs['Offset'])
+    link(basis['Normal'], extrude.inputs['Offset'])
     link(group_in.outputs['Thickness'], extrude.inputs['Offset Scale'])
 
     flip = nodes.new('GeometryNodeFlipFaces'); flip.location = (2100, -200)
@@ -287,10 +328,12 @@ def get_or_create_solid_node_group():
     merge_final.inputs['Distance'].default_value = 0.001
     link(join.outputs['Geometry'], merge_final.inputs['Geometry'])
 
-    group_out = nodes.new('NodeGroupOutput'); group_out.location = (2700, 0)
-    link(merge_final.outputs['Geometry'], group_out.inputs['Geometry'])
+    result = triangulate_output(ng, group_in, merge_final.outputs['Geometry'], x=2700, y=0)
 
-    return ng
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (3100, 0)
+    link(add_bake_node(ng, result, x=2900, y=-300), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
 
 
 # ---------------------------------------------------------------------------
@@ -298,6 +341,67 @@ def get_or_create_solid_node_group():
 # ---------------------------------------------------------------------------
 
 
+def add_solid_modifier(gp_obj, scene, depsgraph, view_position=None):
+    """Add (or refit) the SolidMesh modifier on ``gp_obj``.
+
+    The plane is fitted to the drawing at the scene's current frame and its
+    normal turned toward ``view_position`` (ray casts when None). Raises
+    ValueError when there are too few stroke points. Returns (modifier,
+    number of keyframes with their own fitted plane, 0 for a static basis).
+    """
+    pts = _gather_stroke_points_local(gp_obj, scene.frame_current)
+    if len(pts) < 3:
+        raise ValueError("Need at least 3 stroke points")
+
+    center, u, v, normal = fit_oriented_basis(gp_obj, pts, scene, depsgraph, view_position)
+
+    node_group = get_or_create_solid_node_group()
+
+    mod = gp_obj.modifiers.get(MODIFIER_NAME)
+    if mod is None or mod.type != 'NODES':
+        mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = node_group
+    apply_viewport_proxy(mod, scene.greasemesh)
+
+    set_basis_inputs(mod, center, u, v, normal)
+    keyframes = update_basis_table(mod, gp_obj, scene, normal)
+    update_regions(mod, gp_obj, scene)
+
+    gp_obj.update_tag()
+    return mod, keyframes
+
+
+def build_solid_data(gp_obj, scene, depsgraph, view_position=None, **params):
+    """The SolidMesh result at the scene's current frame, built straight from
+    the strokes without a modifier (see utils.fill_extrude).
+
+    ``params`` are named as the modifier inputs. Raises ValueError when there
+    are too few stroke points. Returns mesh buffers in local space, or None
+    when the strokes enclose nothing.
+    """
+    settings = resolve_settings(SOLID_DEFAULTS, params)
+    strokes = read_strokes(gp_obj, scene.frame_current)
+    if sum(len(pts) for pts, _ in strokes) < 3:
+        raise ValueError("Need at least 3 stroke points")
+
+    pts = np.concatenate([pts for pts, _ in strokes])
+    basis = fit_oriented_basis(gp_obj, pts, scene, depsgraph, view_position)
+    return solid_buffers(strokes, [np.array(b) for b in basis], settings)
+
+
+def build_solid_regions(mod, gp_obj, frame):
+    """Regions builder: the arranged cap in basis coordinates (x, y, 0),
+    where the graph's Fill Curve puts it, at the viewport proxy resolution."""
+    inputs = get_inputs(mod, {**dict.fromkeys(BASIS_NAMES), **SOLID_DEFAULTS, FACTOR_SOCKET: 1.0})
+    inputs = proxy_settings(inputs, inputs[FACTOR_SOCKET], {"Resolution": 3})
+    basis = [np.array(inputs[name], dtype=np.float64) for name in BASIS_NAMES]
+    cap = solid_regions(read_strokes(gp_obj, frame), basis, inputs)
+    if cap is None:
+        return None
+    co2, corners, sizes = cap
+    return mesh_buffers(np.column_stack((co2, np.zeros(len(co2)))), corners, sizes)
+
+
 class GPTOOLS_OT_gn_solid_mesh(bpy.types.Operator):
     """Add a Geometry Nodes modifier on the Grease Pencil that renders its
     strokes as a solid extruded shape. Live-linked to the GP — editing strokes
@@ -317,43 +421,15 @@ class GPTOOLS_OT_gn_solid_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        pts = _gather_stroke_points_local(gp_obj)
-        if len(pts) < 3:
-            self.report({"ERROR"}, "Need at least 3 stroke points")
+        try:
+            mod, keyframes = add_solid_modifier(
+                gp_obj, context.scene, context.evaluated_depsgraph_get(),
+                _viewport_camera_position(context),
+            )
+        except ValueError as err:
+            self.report({"ERROR"}, str(err))
             return {"CANCELLED"}
-
-        centroid_local, normal_local = _pca_plane(pts)
-
-        mw = gp_obj.matrix_world
-        centroid_world = mw @ centroid_local
-        normal_world = (mw.to_3x3() @ normal_local).normalized()
-        oriented = _sign_correct_outward(centroid_world, normal_world, gp_obj, context)
-        if (oriented - normal_world).length > 1e-6:
-            normal_local = -normal_local
-        normal_local.normalize()
-
-        u_local, v_local = _build_basis(normal_local)
-
-        node_group = get_or_create_solid_node_group()
-
-        mod = gp_obj.modifiers.get(MODIFIER_NAME)
-        if mod is None or mod.type != 'NODES':
-            mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
-        mod.node_group = node_group
-
-        socket_values = {
-            'Center': (centroid_local.x, centroid_local.y, centroid_local.z),
-            'U':      (u_local.x, u_local.y, u_local.z),
-            'V':      (v_local.x, v_local.y, v_local.z),
-            'Normal': (normal_local.x, normal_local.y, normal_local.z),
-        }
-        for item in node_group.interface.items_tree:
-            if getattr(item, 'in_out', None) != 'INPUT':
-                continue
-            if item.name in socket_values:
-                set_input(mod, item.identifier, socket_values[item.name])
-
-        gp_obj.update_tag()
+        check_budget(self, context, gp_obj, mod)
 
         for o in context.view_layer.objects:
             if o.select_get():
@@ -369,9 +445,15 @@ class GPTOOLS_OT_gn_solid_mesh(bpy.types.Operator):
                             space.context = 'MODIFIER'
                             break
                     break
-        except TypeError:
+        except (AttributeError, TypeError):
             pass
 
+        if keyframes:
+            self.report(
+                {"INFO"},
+                f"Solid mesh modifier added with a fitted plane for each of {keyframes} keyframes.",
+            )
+            return {"FINISHED"}
         self.report(
             {"INFO"},
             "Solid mesh modifier added. Edit strokes to reshape; adjust Thickness for depth.",
@@ -387,9 +469,13 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_solid_node_group)
+    register_builder(NODE_GROUP_NAME, build_solid_regions)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
+    unregister_builder(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
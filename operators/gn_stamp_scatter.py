@@ -0,0 +1,261 @@
+import bpy
+from ..utils.conversion import get_active_grease_pencil
+from ..utils.modifier_io import set_input
+from ..utils.bake import add_bake_node
+from ..utils.node_groups import (
+    finish_node_group, is_current, register_node_group, reset_node_group, unregister_node_group,
+)
+
+NODE_GROUP_NAME = "GreaseMesh_StampScatter"
+NODE_GROUP_VERSION = 1
+MODIFIER_NAME = "StampScatter"
+
+# Upper bound of the random pick index; Instance on Points wraps it by the
+# number of assets, so any collection size gets an even spread.
+_PICK_RANGE = 1 << 20
+
+
+# ---------------------------------------------------------------------------
+# Geometry Nodes graph — instance collection assets on GP marks.
+#
+#   strokes → GP to Curves → Curve to Points (Length = Point Spacing)
+#     → Set ID                    hash of the point's position on its stroke
+#     → Set Position              nearest point on the target surface
+#   Target (Object Info, Relative) feeds Geometry Proximity and
+#     Sample Nearest Surface(Normal) for the surface rotation
+#   Collection Info (separate children)
+#     → Instance on Points(Pick Instance, index = Random(ID, Seed))
+#
+# Proximity and sampling build their BVH once per evaluation, the random pick
+# depends only on point ID and seed, and instances are never realized — so
+# thousands of stamps stay interactive and reproducible. The ID comes from
+# where the point lies on the drawing rather than its index, so drawing or
+# erasing a stroke doesn't reshuffle the stamps on every other stroke.
+# ---------------------------------------------------------------------------
+
+
+def _build_interface(ng):
+    """Create the modifier panel sockets."""
+    ng.interface.new_socket(
+        name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry',
+    )
+
+    ng.interface.new_socket(
+        name="Target", in_out='INPUT', socket_type='NodeSocketObject',
+    )
+
+    ng.interface.new_socket(
+        name="Asset Collection", in_out='INPUT', socket_type='NodeSocketCollection',
+    )
+
+    s = ng.interface.new_socket(
+        name="Scale", in_out='INPUT', socket_type='NodeSocketFloat',
+    )
+    s.default_value, s.min_value, s.max_value = 1.0, 0.0, 100.0
+
+    s = ng.interface.new_socket(
+        name="Point Spacing", in_out='INPUT', socket_type='NodeSocketFloat',
+    )
+    s.default_value, s.min_value, s.max_value = 0.5, 0.001, 1000.0
+    s.subtype = 'DISTANCE'
+
+    s = ng.interface.new_socket(
+        name="Random Seed", in_out='INPUT', socket_type='NodeSocketInt',
+    )
+    s.default_value, s.min_value, s.max_value = 0, 0, 10000
+
+    s = ng.interface.new_socket(
+        name="Align to Surface", in_out='INPUT', socket_type='NodeSocketBool',
+    )
+    s.default_value = True
+
+    ng.interface.new_socket(
+        name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry',
+    )
+
+
+def get_or_create_stamp_scatter_node_group():
+    """Get existing or build the StampScatter geometry node group."""
+    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
+        return ng
+
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
+    _build_interface(ng)
+
+    link = ng.links.new
+    nodes = ng.nodes
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-1000, 0)
+
+    # Marks → evenly spaced points
+    gp_to_curves = nodes.new('GeometryNodeGreasePencilToCurves'); gp_to_curves.location = (-800, 200)
+    gp_to_curves.inputs['Layers as Instances'].default_value = False
+    link(group_in.outputs['Geometry'], gp_to_curves.inputs['Grease Pencil'])
+
+    to_points = nodes.new('GeometryNodeCurveToPoints'); to_points.location = (-600, 200)
+    to_points.mode = 'LENGTH'
+    link(gp_to_curves.outputs['Curves'], to_points.inputs['Curve'])
+    link(group_in.outputs['Point Spacing'], to_points.inputs['Length'])
+
+    # Stable ID per point: white noise of its unsnapped position
+    position = nodes.new('GeometryNodeInputPosition'); position.location = (-800, 450)
+    noise = nodes.new('ShaderNodeTexWhiteNoise'); noise.location = (-600, 450)
+    noise.noise_dimensions = '3D'
+    link(position.outputs['Position'], noise.inputs['Vector'])
+    scale_id = nodes.new('ShaderNodeMath'); scale_id.location = (-400, 450)
+    scale_id.operation = 'MULTIPLY'
+    scale_id.inputs[1].default_value = _PICK_RANGE
+    link(noise.outputs['Value'], scale_id.inputs[0])
+    to_int = nodes.new('FunctionNodeFloatToInt'); to_int.location = (-200, 450)
+    to_int.rounding_mode = 'FLOOR'
+    link(scale_id.outputs['Value'], to_int.inputs['Float'])
+
+    set_id = nodes.new('GeometryNodeSetID'); set_id.location = (-400, 200)
+    link(to_points.outputs['Points'], set_id.inputs['Geometry'])
+    link(to_int.outputs['Integer'], set_id.inputs['ID'])
+
+    # Target surface in the GP object's space
+    target = nodes.new('GeometryNodeObjectInfo'); target.location = (-800, -200)
+    target.transform_space = 'RELATIVE'
+    link(group_in.outputs['Target'], target.inputs['Object'])
+
+    # Snap to the nearest surface point; points without a target stay put
+    proximity = nodes.new('GeometryNodeProximity'); proximity.location = (-400, -100)
+    proximity.target_element = 'FACES'
+    link(target.outputs['Geometry'], proximity.inputs[0])
+
+    snap = nodes.new('GeometryNodeSetPosition'); snap.location = (-200, 200)
+    link(set_id.outputs['Geometry'], snap.inputs['Geometry'])
+    link(proximity.outputs['Is Valid'], snap.inputs['Selection'])
+    link(proximity.outputs['Position'], snap.inputs['Position'])
+
+    # Surface normal at the snapped points → rotation
+    normal = nodes.new('GeometryNodeInputNormal'); normal.location = (-400, -350)
+    sample = nodes.new('GeometryNodeSampleNearestSurface'); sample.location = (-200, -250)
+    sample.data_type = 'FLOAT_VECTOR'
+    link(target.outputs['Geometry'], sample.inputs['Mesh'])
+    link(normal.outputs['Normal'], sample.inputs['Value'])
+
+    align = nodes.new('FunctionNodeAlignRotationToVector'); align.location = (0, -250)
+    align.axis = 'Z'
+    link(sample.outputs['Value'], align.inputs['Vector'])
+
+    rotation = nodes.new('GeometryNodeSwitch'); rotation.location = (200, -250)
+    rotation.input_type = 'ROTATION'
+    link(group_in.outputs['Align to Surface'], rotation.inputs['Switch'])
+    link(align.outputs['Rotation'], rotation.inputs['True'])
+
+    # Deterministic pick: depends only on point ID and the seed
+    pick = nodes.new('FunctionNodeRandomValue'); pick.location = (0, -50)
+    pick.data_type = 'INT'
+    pick.inputs[5].default_value = _PICK_RANGE            # Max (int)
+    link(group_in.outputs['Random Seed'], pick.inputs['Seed'])
+
+    assets = nodes.new('GeometryNodeCollectionInfo'); assets.location = (0, 100)
+    assets.transform_space = 'ORIGINAL'
+    assets.inputs['Separate Children'].default_value = True
+    assets.inputs['Reset Children'].default_value = True
+    link(group_in.outputs['Asset Collection'], assets.inputs['Collection'])
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints'); instance.location = (400, 100)
+    instance.inputs['Pick Instance'].default_value = True
+    link(snap.outputs['Geometry'], instance.inputs['Points'])
+    link(assets.outputs['Instances'], instance.inputs['Instance'])
+    link(pick.outputs[2], instance.inputs['Instance Index'])  # Value (int)
+    link(rotation.outputs['Output'], instance.inputs['Rotation'])
+    link(group_in.outputs['Scale'], instance.inputs['Scale'])
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (600, 100)
+    link(add_bake_node(ng, instance.outputs['Instances'], x=400, y=-300), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
+
+
+def add_stamp_scatter_modifier(gp_obj, target_obj, collection):
+    """Add the StampScatter modifier to gp_obj."""
+    mod = gp_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    mod.node_group = get_or_create_stamp_scatter_node_group()
+
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) != 'INPUT':
+            continue
+        if item.name == 'Target':
+            set_input(mod, item.identifier, target_obj)
+        elif item.name == 'Asset Collection':
+            set_input(mod, item.identifier, collection)
+    return mod
+
+
+class GPTOOLS_OT_stamp_scatter(bpy.types.Operator):
+    """Scatter assets from a collection on the selected mesh at Grease Pencil marks"""
+
+    bl_idname = "gptools.stamp_scatter"
+    bl_label = "Scatter on Surface"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        if get_active_grease_pencil(context) is None:
+            return False
+        return any(o.type == 'MESH' for o in context.selected_objects)
+
+    def execute(self, context):
+        gp_obj = get_active_grease_pencil(context)
+        target_obj = next((o for o in context.selected_objects if o.type == 'MESH'), None)
+        if not gp_obj or not target_obj:
+            self.report({"ERROR"}, "Select the target mesh and an active Grease Pencil")
+            return {"CANCELLED"}
+
+        collection = context.scene.greasemesh.scatter_collection
+        if collection is None:
+            self.report({"ERROR"}, "Pick an Asset Collection in the GMesh panel")
+            return {"CANCELLED"}
+        if not collection.all_objects:
+            self.report({"ERROR"}, f"Collection '{collection.name}' has no objects")
+            return {"CANCELLED"}
+
+        add_stamp_scatter_modifier(gp_obj, target_obj, collection)
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        gp_obj.select_set(True)
+        context.view_layer.objects.active = gp_obj
+
+        # Switch Properties panel to Modifier tab
+        try:
+            for area in context.screen.areas:
+                if area.type == 'PROPERTIES':
+                    for space in area.spaces:
+                        if space.type == 'PROPERTIES':
+                            space.context = 'MODIFIER'
+                            break
+                    break
+        except TypeError:
+            pass
+
+        self.report(
+            {"INFO"},
+            f"Stamp Scatter added: '{collection.name}' on '{target_obj.name}'",
+        )
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_stamp_scatter,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_stamp_scatter_node_group)
+
+
+def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
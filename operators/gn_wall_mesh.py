@@ -1,7 +1,23 @@
 import bpy
 from ..utils.conversion import get_active_grease_pencil
+from ..utils.budget import check_budget
+from ..utils.viewport_proxy import (
+    FACTOR_SOCKET, add_proxy_sockets, apply_viewport_proxy, proxy_count, proxy_settings,
+)
+from ..utils.topology import add_topology_sockets, dissolve_straight_points, triangulate_output
+from ..utils.bake import add_bake_node
+from ..utils.fill_extrude import read_strokes, resolve_settings
+from ..utils.modifier_io import get_inputs
+from ..utils.regions import (
+    add_regions_socket, register_builder, regions_or, unregister_builder, update_regions,
+)
+from ..utils.walls import WALL_DEFAULTS, wall_buffers
+from ..utils.node_groups import (
+    finish_node_group, is_current, register_node_group, reset_node_group, unregister_node_group,
+)
 
 NODE_GROUP_NAME = "GreaseMesh_Wall"
+NODE_GROUP_VERSION = 2
 
 
 def get_or_create_wall_node_group():
@@ -10,19 +26,23 @@ def get_or_create_wall_node_group():
     Pipeline:
       GP (floor plan strokes) → Curves → Curve to Mesh (edges only)
         → Merge by Distance (weld nearby stroke endpoints into continuous path)
-        → Mesh to Curve → Resample → Set Cyclic
+        → Mesh to Curve → Resample
         → Rectangle profile (Thickness × Height), offset up by Height/2
         → Curve to Mesh (sweep profile along floor plan, fill caps)
         → Shade Smooth → Output
 
     The Merge by Distance step handles floor plans drawn as multiple
     strokes — their endpoints get welded into a single continuous curve.
+    A plan whose ends meet comes back from Mesh to Curve as a closed loop;
+    open plans stay open walls, as in the Python-built walls.
+    Static drawings replace the sweep with the junction-aware walls built
+    in Python (utils.walls), read from the hidden Regions object.
     """
     ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
-    if ng is not None:
+    if ng is not None and is_current(ng, NODE_GROUP_VERSION):
         return ng
 
-    ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng, saved = reset_node_group(NODE_GROUP_NAME)
 
     # Interface sockets
     ng.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
@@ -69,6 +89,10 @@ def get_or_create_wall_node_group():
     corner_res.min_value = 1
     corner_res.max_value = 32
 
+    add_regions_socket(ng.interface)
+    add_proxy_sockets(ng.interface)
+    add_topology_sockets(ng.interface)
+
     ng.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
 
     # --- Nodes ---
@@ -108,12 +132,6 @@ def get_or_create_wall_node_group():
     resample = ng.nodes.new('GeometryNodeResampleCurve')
     resample.location = (x, 0)
 
-    # Close the curve (floor plan loop)
-    x += 200
-    set_cyclic = ng.nodes.new('GeometryNodeSetSplineCyclic')
-    set_cyclic.location = (x, 0)
-    set_cyclic.inputs['Cyclic'].default_value = True
-
     # Force curve normal to Z-up so walls stay vertical
     x += 200
     set_normal = ng.nodes.new('GeometryNodeSetCurveNormal')
@@ -167,14 +185,14 @@ def get_or_create_wall_node_group():
     link(group_in.outputs['Merge Distance'], merge.inputs['Distance'])
     link(merge.outputs['Geometry'], mesh_to_curve.inputs['Mesh'])
 
-    # Mesh to Curve → Fillet → Resample → Cyclic
+    # Mesh to Curve → Fillet → Resample
     link(mesh_to_curve.outputs['Curve'], fillet.inputs['Curve'])
     link(group_in.outputs['Corner Radius'], fillet.inputs['Radius'])
-    link(group_in.outputs['Corner Resolution'], fillet.inputs['Count'])
+    link(proxy_count(ng, group_in, 'Corner Resolution', minimum=1), fillet.inputs['Count'])
     link(fillet.outputs['Curve'], resample.inputs['Curve'])
-    link(group_in.outputs['Resolution'], resample.inputs['Count'])
-    link(resample.outputs['Curve'], set_cyclic.inputs['Curve'])
-    link(set_cyclic.outputs['Curve'], set_normal.inputs['Curve'])
+    link(proxy_count(ng, group_in, 'Resolution', minimum=3), resample.inputs['Count'])
+    plan = dissolve_straight_points(ng, group_in, resample.outputs['Curve'], x=resample.location.x, y=-700)
+    link(plan, set_normal.inputs['Curve'])
 
     # Rectangle profile: Width = Thickness, Height = Height
     link(group_in.outputs['Thickness'], quad.inputs['Width'])
@@ -191,9 +209,39 @@ def get_or_create_wall_node_group():
     link(set_pos.outputs['Geometry'], curve_to_mesh.inputs['Profile Curve'])
 
     link(curve_to_mesh.outputs['Mesh'], shade_flat.inputs['Mesh'])
-    link(shade_flat.outputs['Mesh'], group_out.inputs['Geometry'])
+    walls = regions_or(ng, group_in, shade_flat.outputs['Mesh'], x=shade_flat.location.x, y=-900)
+    result = triangulate_output(ng, group_in, walls, x=group_out.location.x, y=-300)
+    link(add_bake_node(ng, result, x=group_out.location.x, y=-500), group_out.inputs['Geometry'])
+
+    return finish_node_group(ng, NODE_GROUP_VERSION, saved)
+
+
+def add_wall_modifier(gp_obj, scene):
+    """Add a WallMesh modifier on ``gp_obj``. Returns the modifier."""
+    mod = gp_obj.modifiers.new(name="WallMesh", type='NODES')
+    mod.node_group = get_or_create_wall_node_group()
+    apply_viewport_proxy(mod, scene.greasemesh)
+    update_regions(mod, gp_obj, scene)
+    return mod
 
-    return ng
+
+def build_wall_regions(mod, gp_obj, frame):
+    """Regions builder: the finished walls in object space, at the viewport
+    proxy resolution."""
+    inputs = get_inputs(mod, {**WALL_DEFAULTS, FACTOR_SOCKET: 1.0})
+    inputs = proxy_settings(inputs, inputs[FACTOR_SOCKET], {"Resolution": 3, "Corner Resolution": 1})
+    return wall_buffers(read_strokes(gp_obj, frame), inputs)
+
+
+def build_wall_data(gp_obj, scene, **params):
+    """The WallMesh result at the scene's current frame, built straight from
+    the strokes without a modifier (see utils.walls).
+
+    ``params`` are named as the modifier inputs. Returns mesh buffers in
+    local space, or None when no wall remains.
+    """
+    settings = resolve_settings(WALL_DEFAULTS, params)
+    return wall_buffers(read_strokes(gp_obj, scene.frame_current), settings)
 
 
 class GPTOOLS_OT_gn_wall_mesh(bpy.types.Operator):
@@ -213,10 +261,8 @@ class GPTOOLS_OT_gn_wall_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        node_group = get_or_create_wall_node_group()
-
-        mod = gp_obj.modifiers.new(name="WallMesh", type='NODES')
-        mod.node_group = node_group
+        mod = add_wall_modifier(gp_obj, context.scene)
+        check_budget(self, context, gp_obj, mod)
 
         context.view_layer.objects.active = gp_obj
         gp_obj.select_set(True)
@@ -229,7 +275,7 @@ class GPTOOLS_OT_gn_wall_mesh(bpy.types.Operator):
                             space.context = 'MODIFIER'
                             break
                     break
-        except TypeError:
+        except (AttributeError, TypeError):
             pass
 
         self.report({"INFO"}, "Wall mesh GN modifier added.")
@@ -244,9 +290,13 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_wall_node_group)
+    register_builder(NODE_GROUP_NAME, build_wall_regions)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
+    unregister_builder(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
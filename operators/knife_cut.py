@@ -1,91 +1,56 @@
 import bpy
-from mathutils import Vector
+import numpy as np
 from ..utils.conversion import (
     get_active_grease_pencil,
-    clean_gp_for_cutter,
-    remove_cleanup_duplicate,
-    walk_strokes_into_loop,
+    gather_world_strokes,
+    group_strokes_into_outlines,
 )
+from ..utils.resample import resample_polyline
 
 
-def _resample_loop(pts, count):
-    """Resample a closed polyline (list of Vectors) to *count* evenly spaced points."""
-    if count <= 0 or len(pts) < 2:
-        return pts
-    if count >= len(pts):
-        return pts
-
-    dists = [0.0]
-    for i in range(1, len(pts)):
-        dists.append(dists[-1] + (pts[i] - pts[i - 1]).length)
-    total = dists[-1]
-    if total < 1e-8:
-        return pts[:count]
-
-    step = total / count  # cyclic — divide by count, not count-1
-    resampled = []
-    seg = 0
-    for i in range(count):
-        target_d = i * step
-        while seg < len(dists) - 2 and dists[seg + 1] < target_d:
-            seg += 1
-        seg_len = dists[seg + 1] - dists[seg]
-        t = (target_d - dists[seg]) / seg_len if seg_len > 1e-8 else 0.0
-        resampled.append(pts[seg].lerp(pts[seg + 1], t))
-    return resampled
-
-
-def _gp_to_cutter_curve(gp_obj, resolution=0):
-    """Convert a Grease Pencil object to a single cyclic curve for knife projection.
-
-    Strokes are first cleaned (stubs dropped, open endpoints bridged) on a
-    throwaway duplicate so the user's drawing isn't mutated. Remaining strokes
-    are walked into one ordered loop, which becomes a single cyclic POLY spline.
-    This makes multi-stroke shapes (e.g. a doorway drawn as arch + sides + floor)
-    project as one connected outline rather than several independent loops.
+def _gp_to_cutter_curve(gp_obj, resolution=0, preserve_corners=True):
+    """Convert a Grease Pencil object to a curve with one spline per outline.
+
+    Strokes from every layer are grouped into independent outlines: strokes
+    whose endpoints meet are walked into one ordered chain (so a doorway drawn
+    as arch + sides + floor still projects as one connected loop), while
+    separate shapes become separate splines. Closed outlines become cyclic
+    POLY splines, open ones (e.g. a single panel line) stay open. Everything
+    lands in one curve object so knife_project cuts all outlines in one pass.
+
+    Returns (curve_obj, outline_count), or (None, 0) when nothing is usable.
     """
-    cleaned_gp = clean_gp_for_cutter(gp_obj)
-    try:
-        strokes_pts = []
-        mw = cleaned_gp.matrix_world
-        for layer in cleaned_gp.data.layers:
-            for frame in layer.frames:
-                for stroke in frame.drawing.strokes:
-                    if len(stroke.points) < 2:
-                        continue
-                    strokes_pts.append([Vector(mw @ p.position) for p in stroke.points])
-                break  # first frame only
-            break  # first layer only
-
-        loop = walk_strokes_into_loop([list(s) for s in strokes_pts])
-    finally:
-        remove_cleanup_duplicate(cleaned_gp)
-
-    if len(loop) < 3:
-        return None
-
-    loop = [Vector(p) for p in loop]
-    if resolution > 0:
-        loop = _resample_loop(loop, resolution)
-
-    origin = loop[0].copy()
+    outlines = group_strokes_into_outlines(gather_world_strokes(gp_obj))
+    if not outlines:
+        return None, 0
+
+    chains = []
+    for chain, cyclic in outlines:
+        arr = np.asarray(chain, dtype=np.float64)
+        # Only ever downsample — upsampling would just add collinear cuts.
+        if 0 < resolution < len(arr):
+            arr = resample_polyline(arr, resolution, cyclic, preserve_corners)
+        chains.append((arr, cyclic))
+
+    origin = chains[0][0][0].copy()
 
     curve_data = bpy.data.curves.new(gp_obj.name + "_KnifeCurve", type='CURVE')
     curve_data.dimensions = '3D'
 
-    spline = curve_data.splines.new('POLY')
-    spline.points.add(len(loop) - 1)
-    for i, world_pos in enumerate(loop):
-        local_pos = world_pos - origin
-        spline.points[i].co = (local_pos.x, local_pos.y, local_pos.z, 1.0)
-    spline.use_cyclic_u = True
+    for arr, cyclic in chains:
+        spline = curve_data.splines.new('POLY')
+        spline.points.add(len(arr) - 1)
+        co = np.ones((len(arr), 4), dtype=np.float32)
+        co[:, :3] = arr - origin
+        spline.points.foreach_set("co", co.ravel())
+        spline.use_cyclic_u = cyclic
 
     curve_obj = bpy.data.objects.new(gp_obj.name + "_KnifeCurve", curve_data)
-    curve_obj.location = origin
+    curve_obj.location = origin.tolist()
     for col in gp_obj.users_collection:
         col.objects.link(curve_obj)
 
-    return curve_obj
+    return curve_obj, len(outlines)
 
 
 def _find_target_mesh(context, gp_obj):
@@ -113,7 +78,12 @@ class GPTOOLS_OT_knife_cut(bpy.types.Operator):
         default=0,
         min=0,
         max=512,
-        description="Resample the combined loop to this many points (0 = use original points)",
+        description="Resample each outline to this many points (0 = use original points)",
+    )
+    preserve_corners: bpy.props.BoolProperty(
+        name="Preserve Corners",
+        default=True,
+        description="Keep sharp corners exactly when resampling",
     )
 
     @classmethod
@@ -136,7 +106,9 @@ class GPTOOLS_OT_knife_cut(bpy.types.Operator):
             self.report({"ERROR"}, "No selected mesh object found as cut target")
             return {"CANCELLED"}
 
-        cutter = _gp_to_cutter_curve(gp_obj, self.resolution)
+        cutter, outline_count = _gp_to_cutter_curve(
+            gp_obj, self.resolution, self.preserve_corners,
+        )
         if not cutter:
             self.report({"ERROR"}, "No usable strokes found in Grease Pencil")
             return {"CANCELLED"}
@@ -193,7 +165,10 @@ class GPTOOLS_OT_knife_cut(bpy.types.Operator):
         target.select_set(True)
         context.view_layer.objects.active = target
 
-        self.report({"INFO"}, f"Knife cut applied to '{target.name}' — enter Edit mode to see the cut")
+        self.report(
+            {"INFO"},
+            f"Knife cut {outline_count} outline(s) into '{target.name}' — enter Edit mode to see the cut",
+        )
         return {"FINISHED"}
 
 
@@ -0,0 +1,233 @@
+import hashlib
+
+import bpy
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+# target name → (geometry hash, BVHTree). Rebuilt only when the target's
+# evaluated mesh or transform changes, so repeated wraps onto the same
+# column reuse one tree. Entries of removed objects are dropped on the next
+# build, and the whole cache on file load.
+_bvh_cache = {}
+
+
+def _world_coords(mesh, matrix):
+    """(N, 3) float64 world-space vertex positions via foreach_get."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    m = np.array(matrix, dtype=np.float64)
+    return co.reshape(-1, 3) @ m[:3, :3].T + m[:3, 3]
+
+
+def target_bvh(depsgraph, target):
+    """World-space BVHTree of the target's evaluated mesh, cached."""
+    eval_obj = target.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    try:
+        coords = _world_coords(mesh, target.matrix_world)
+        loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        h = hashlib.blake2b(digest_size=16)
+        for buf in (coords, loop_total, loop_verts):
+            h.update(buf.tobytes())
+        key = h.digest()
+        cached = _bvh_cache.get(target.name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        polygons = np.split(loop_verts, np.cumsum(loop_total)[:-1])
+        bvh = BVHTree.FromPolygons(coords.tolist(), [p.tolist() for p in polygons])
+    finally:
+        eval_obj.to_mesh_clear()
+
+    for name in [n for n in _bvh_cache if n not in bpy.data.objects]:
+        del _bvh_cache[name]
+    _bvh_cache[target.name] = (key, bvh)
+    return bvh
+
+
+@bpy.app.handlers.persistent
+def _clear_bvh_cache(*_args):
+    _bvh_cache.clear()
+
+
+def _nearest(bvh, points):
+    """Nearest surface point and normal for (N, 3) points.
+
+    Returns (locations, normals, found); rows without a hit are zero.
+    """
+    locations = np.zeros((len(points), 3))
+    normals = np.zeros((len(points), 3))
+    found = np.zeros(len(points), dtype=bool)
+    # BVHTree has no batch query; plain tuples keep the per-call cost down
+    for i, p in enumerate(points.tolist()):
+        loc, normal, _, _ = bvh.find_nearest(p)
+        if loc is not None:
+            locations[i], normals[i], found[i] = loc, normal, True
+    return locations, normals, found
+
+
+def fit_lattice(coords, resolution, padding=0.02):
+    """Fit an axis-aligned lattice to world-space vertices.
+
+    Returns (center, size, points_per_axis, depth_axis). The longest side
+    gets ``resolution`` points and the others proportionally fewer (at least
+    2); the shortest side is the depth axis the wrap projects along.
+    """
+    lo = coords.min(axis=0)
+    hi = coords.max(axis=0)
+    extent = hi - lo
+    longest = max(float(extent.max()), 1e-6)
+    size = np.maximum(extent, longest * 0.01) + longest * padding
+    points = np.maximum(2, np.round(resolution * extent / longest)).astype(int)
+    return (lo + hi) / 2, size, points, int(np.argmin(extent))
+
+
+def wrap_lattice_points(rest, center, size, depth_axis, points, bvh, offset=0.0):
+    """Deformed lattice coordinates that lay the lattice onto the target.
+
+    ``rest`` is (N, 3) lattice-local rest positions in point order. Every
+    column of points along the depth axis is moved by the displacement that
+    takes its point on the contact side onto the surface, so the source
+    keeps its thickness and sits ``offset`` above the target. The contact
+    side is the end layer whose center lies nearer the surface.
+    """
+    world = center + rest * size
+    grid = world.reshape(points[2], points[1], points[0], 3)     # w, v, u
+    axis = 2 - depth_axis                                         # grid axis of depth
+    columns = np.moveaxis(grid, axis, -2)                         # (..., depth, 3)
+
+    first = columns[..., 0, :].reshape(-1, 3)
+    last = columns[..., -1, :].reshape(-1, 3)
+    ends, _, found = _nearest(bvh, np.array([first.mean(axis=0), last.mean(axis=0)]))
+    first_dist = np.linalg.norm(ends[0] - first.mean(axis=0)) if found[0] else np.inf
+    last_dist = np.linalg.norm(ends[1] - last.mean(axis=0)) if found[1] else np.inf
+    contact = first if first_dist <= last_dist else last
+
+    locations, normals, found = _nearest(bvh, contact)
+    shift = np.where(found[:, None], locations + normals * offset - contact, 0.0)
+
+    moved = columns + shift.reshape(columns.shape[:-2] + (1, 3))
+    moved = np.moveaxis(moved, -2, axis).reshape(-1, 3)
+    return (moved - center) / size
+
+
+def build_wrap_lattice(source, bvh, resolution, offset):
+    """Create a lattice around ``source``, wrap it and add the Lattice modifier."""
+    coords = _world_coords(source.data, source.matrix_world)
+    center, size, points, depth_axis = fit_lattice(coords, resolution)
+
+    lattice = bpy.data.lattices.new(name=source.name + "_Lattice")
+    lattice.points_u, lattice.points_v, lattice.points_w = (int(p) for p in points)
+    lattice_obj = bpy.data.objects.new(name=source.name + "_Lattice", object_data=lattice)
+    for col in source.users_collection:
+        col.objects.link(lattice_obj)
+    lattice_obj.location = Vector(center)
+    lattice_obj.scale = Vector(size)
+
+    rest = np.empty(len(lattice.points) * 3, dtype=np.float32)
+    lattice.points.foreach_get("co", rest)
+    deformed = wrap_lattice_points(
+        rest.reshape(-1, 3), center, size, depth_axis, points, bvh, offset,
+    )
+    lattice.points.foreach_set("co_deform", deformed.astype(np.float32).ravel())
+
+    mod = source.modifiers.new(name="LatticeWrap", type='LATTICE')
+    mod.object = lattice_obj
+    return lattice_obj
+
+
+def wrap_objects(sources, target, depsgraph, resolution=6, offset=0.0):
+    """Wrap every source mesh onto ``target``; one BVH serves the whole batch.
+
+    Returns the new lattice objects.
+    """
+    bvh = target_bvh(depsgraph, target)
+    return [
+        build_wrap_lattice(source, bvh, resolution, offset)
+        for source in sources
+    ]
+
+
+class GPTOOLS_OT_lattice_wrap(bpy.types.Operator):
+    """Wrap the selected meshes onto the active mesh with fitted lattices"""
+
+    bl_idname = "gptools.lattice_wrap"
+    bl_label = "Lattice Wrap"
+    bl_options = {"REGISTER", "UNDO"}
+
+    resolution: bpy.props.IntProperty(
+        name="Resolution",
+        default=6,
+        min=2,
+        max=64,
+        description="Lattice points along the longest side of each source; other sides scale to match",
+    )
+    offset: bpy.props.FloatProperty(
+        name="Offset",
+        default=0.0,
+        min=-10.0,
+        max=10.0,
+        subtype='DISTANCE',
+        description="Distance kept between the wrapped mesh and the target surface",
+    )
+
+    @classmethod
+    def poll(cls, context):
+        target = context.active_object
+        if not target or target.type != 'MESH':
+            return False
+        return any(o.type == 'MESH' and o != target for o in context.selected_objects)
+
+    def execute(self, context):
+        target = context.active_object
+        sources = [
+            o for o in context.selected_objects
+            if o.type == 'MESH' and o != target and len(o.data.vertices) > 0
+        ]
+        if not target or target.type != 'MESH' or not sources:
+            self.report({"ERROR"}, "Select the meshes to wrap, then the target mesh last (active)")
+            return {"CANCELLED"}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        lattices = wrap_objects(
+            sources, target, context.evaluated_depsgraph_get(), self.resolution, self.offset,
+        )
+
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for lattice_obj in lattices:
+            lattice_obj.select_set(True)
+        context.view_layer.objects.active = lattices[0]
+
+        self.report({"INFO"}, f"Wrapped {len(sources)} mesh(es) onto '{target.name}'")
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_lattice_wrap,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    if _clear_bvh_cache not in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.append(_clear_bvh_cache)
+
+
+def unregister():
+    if _clear_bvh_cache in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_clear_bvh_cache)
+    _bvh_cache.clear()
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
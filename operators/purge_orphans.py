@@ -0,0 +1,42 @@
+import bpy
+from ..utils.orphans import purge_orphans, register_handlers, unregister_handlers
+
+
+class GPTOOLS_OT_purge_orphans(bpy.types.Operator):
+    """Free meshes left behind by Apply All Modifiers and Bool Cut.
+    Undo brings them back"""
+
+    bl_idname = "gptools.purge_orphans"
+    bl_label = "Purge Replaced Meshes"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        removed, freed = purge_orphans()
+        if removed == 0:
+            self.report({"INFO"}, "No replaced meshes to purge.")
+            return {"CANCELLED"}
+        self.report(
+            {"INFO"},
+            f"Purged {removed} replaced mesh(es), freed ~{freed / (1024 * 1024):.1f} MB.",
+        )
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_purge_orphans,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    register_handlers()
+
+
+def unregister():
+    unregister_handlers()
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
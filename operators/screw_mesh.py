@@ -1,93 +1,217 @@
 import bpy
 import math
+import numpy as np
 from mathutils import Vector
-from ..utils.conversion import get_active_grease_pencil
+from ..utils.conversion import get_active_grease_pencil, group_strokes_by_ends, scoped_drawings
+from ..utils.fill_extrude import read_strokes
+from ..utils.resample import resample_polyline
+from ..utils.modifier_io import set_input
+from ..utils.node_groups import register_node_group, unregister_node_group
+from .gn_screw_mesh import NODE_GROUP_NAME, NODE_GROUP_VERSION, add_screw_modifier, get_or_create_screw_node_group
+
+SMOOTH_NODE_GROUP = "GPTools_SmoothByAngle"
+SMOOTH_MODIFIER_NAME = "Smooth by Angle"
+
+
+def _stroke_endpoints(gp_obj, matrix=None):
+    """First and last point of every stroke, optionally transformed."""
+    endpoints = []
+    for _, drawing in scoped_drawings(gp_obj):
+        for stroke in drawing.strokes:
+            if len(stroke.points) < 2:
+                continue
+            first = stroke.points[0].position
+            last = stroke.points[-1].position
+            if matrix is not None:
+                first, last = matrix @ first, matrix @ last
+            endpoints.append(tuple(first))
+            endpoints.append(tuple(last))
+    return endpoints
+
+
+def fit_revolution_axes(points, profile_ids, endpoints, endpoint_ids, profile_count):
+    """Vectorized axis fit for several profiles at once.
+
+    ``points`` (N, 3) and ``endpoints`` (M, 3) carry the profile index of
+    each row in ``profile_ids`` / ``endpoint_ids``. Per profile, the largest
+    bbox span is the revolution axis, the middle one radial and the smallest
+    flat/depth. The axis runs through the inner edge (centerline) on the
+    radial axis — the side the stroke endpoints lean towards — centered on
+    the others. Profiles without endpoints use the edge nearest the origin.
+    Returns (rev_axes, radial_axes, flat_axes, origins) as NumPy arrays.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    profile_ids = np.asarray(profile_ids, dtype=np.int64)
+    rows = np.arange(profile_count)
+
+    mins = np.full((profile_count, 3), np.inf)
+    maxs = np.full((profile_count, 3), -np.inf)
+    np.minimum.at(mins, profile_ids, points)
+    np.maximum.at(maxs, profile_ids, points)
+
+    # Stable sort keeps the original X/Y/Z precedence for equal spans.
+    order = np.argsort(maxs - mins, axis=1, kind='stable')
+    flat_axes, radial_axes, rev_axes = order[:, 0], order[:, 1], order[:, 2]
+
+    radial_min = mins[rows, radial_axes]
+    radial_max = maxs[rows, radial_axes]
+
+    endpoints = np.asarray(endpoints, dtype=np.float64).reshape(-1, 3)
+    endpoint_ids = np.asarray(endpoint_ids, dtype=np.int64)
+    counts = np.bincount(endpoint_ids, minlength=profile_count)
+    sums = np.zeros(profile_count)
+    if len(endpoints):
+        np.add.at(sums, endpoint_ids, endpoints[np.arange(len(endpoints)), radial_axes[endpoint_ids]])
+    avg_endpoint = sums / np.maximum(counts, 1)
+
+    inner_by_endpoints = np.where(avg_endpoint < (radial_min + radial_max) / 2, radial_min, radial_max)
+    inner_by_origin = np.where(np.abs(radial_min) < np.abs(radial_max), radial_min, radial_max)
+    inner_edge = np.where(counts > 0, inner_by_endpoints, inner_by_origin)
+
+    origins = (mins + maxs) / 2
+    origins[rows, radial_axes] = inner_edge
+
+    return rev_axes, radial_axes, flat_axes, origins
+
+
+def fit_revolution_axis(points, endpoints):
+    """Fit a revolution axis to one profile's points.
+
+    Returns (rev_axis, radial_axis, flat_axis, origin) with axis indices 0-2;
+    see fit_revolution_axes.
+    """
+    rev, radial, flat, origins = fit_revolution_axes(
+        points, np.zeros(len(points), dtype=np.int64),
+        endpoints, np.zeros(len(endpoints), dtype=np.int64), 1,
+    )
+    return int(rev[0]), int(radial[0]), int(flat[0]), Vector(origins[0])
+
+
+def split_profiles(strokes, join_fraction=0.05):
+    """Group strokes into connected profiles.
+
+    Two strokes belong to the same profile when an endpoint of one lies
+    within join_fraction * (length of the longer stroke) of an endpoint of
+    the other (see group_strokes_by_ends). ``strokes`` is a list of
+    ((N, 3) array, cyclic); returns a list of profiles, each a list of such
+    strokes.
+    """
+    strokes = [(pts, cyclic) for pts, cyclic in strokes if len(pts) >= 2]
+    if not strokes:
+        return []
+
+    lengths = [float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum()) for pts, _ in strokes]
+    groups = group_strokes_by_ends(strokes, lengths, join_fraction)
+    return [[strokes[i] for i in members] for members in groups]
 
 
 def detect_revolution_axis(mesh_data, gp_obj):
     """Auto-detect the revolution axis from vertex spans.
-    Largest span = revolution axis, middle = radial, smallest = flat/depth.
     Also moves the origin to the inner edge (centerline) on the radial axis."""
     vertices = [tuple(v.co) for v in mesh_data.vertices]
+    endpoints = _stroke_endpoints(gp_obj, gp_obj.matrix_world)
+    rev_axis, _, _, origin_vec = fit_revolution_axis(vertices, endpoints)
 
-    xs = [v[0] for v in vertices]
-    ys = [v[1] for v in vertices]
-    zs = [v[2] for v in vertices]
-    spans = [
-        (max(xs) - min(xs), 0, "X"),
-        (max(ys) - min(ys), 1, "Y"),
-        (max(zs) - min(zs), 2, "Z"),
-    ]
-    spans.sort(key=lambda s: s[0])
+    for v in mesh_data.vertices:
+        v.co -= origin_vec
+    mesh_data.update()
 
-    flat_span, flat_axis, flat_name = spans[0]
-    radial_span, radial_axis, radial_name = spans[1]
-    rev_span, rev_axis, rev_name = spans[2]
+    return "XYZ"[rev_axis], origin_vec
 
-    # Find the inner edge using stroke endpoints (centerline detection)
-    matrix = gp_obj.matrix_world
-    endpoint_positions = []
-    for layer in gp_obj.data.layers:
-        for frame in layer.frames:
-            for stroke in frame.drawing.strokes:
-                if len(stroke.points) < 2:
-                    continue
-                endpoint_positions.append(tuple(matrix @ stroke.points[0].position))
-                endpoint_positions.append(tuple(matrix @ stroke.points[-1].position))
-
-    mins = [min(xs), min(ys), min(zs)]
-    maxs = [max(xs), max(ys), max(zs)]
-
-    if endpoint_positions:
-        avg_endpoint_radial = sum(p[radial_axis] for p in endpoint_positions) / len(endpoint_positions)
-        mid_radial = (mins[radial_axis] + maxs[radial_axis]) / 2
-        if avg_endpoint_radial < mid_radial:
-            inner_edge_pos = mins[radial_axis]
-        else:
-            inner_edge_pos = maxs[radial_axis]
-    else:
-        if abs(mins[radial_axis]) < abs(maxs[radial_axis]):
-            inner_edge_pos = mins[radial_axis]
-        else:
-            inner_edge_pos = maxs[radial_axis]
 
-    # Move origin to inner edge on radial axis, centered on other axes
-    new_origin = [0.0, 0.0, 0.0]
-    new_origin[radial_axis] = inner_edge_pos
-    new_origin[flat_axis] = (mins[flat_axis] + maxs[flat_axis]) / 2
-    new_origin[rev_axis] = (mins[rev_axis] + maxs[rev_axis]) / 2
+def add_live_screw(gp_obj, resolution=0, tolerance=0.01, render_tolerance=0.002):
+    """Fit the axis in GP local space and add the GreaseMesh_Screw modifier.
 
-    origin_vec = Vector(new_origin)
+    Returns (modifier, axis name); raises ValueError without enough points.
+    """
+    points = [
+        tuple(p.position)
+        for _, drawing in scoped_drawings(gp_obj)
+        for stroke in drawing.strokes
+        for p in stroke.points
+    ]
+    if len(points) < 2:
+        raise ValueError("Need at least 2 points in Grease Pencil")
+
+    rev_axis, radial_axis, _, origin = fit_revolution_axis(points, _stroke_endpoints(gp_obj))
+    axis = Vector((0.0, 0.0, 0.0))
+    axis[rev_axis] = 1.0
+    radial = Vector((0.0, 0.0, 0.0))
+    radial[radial_axis] = 1.0
+    mod = add_screw_modifier(gp_obj, origin, axis, radial)
+
+    socket_values = {
+        'Tolerance': tolerance,
+        'Render Tolerance': render_tolerance,
+    }
+    if resolution > 0:
+        socket_values['Profile Resolution'] = resolution
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) != 'INPUT':
+            continue
+        if item.name in socket_values:
+            set_input(mod, item.identifier, socket_values[item.name])
+    return mod, "XYZ"[rev_axis]
+
+
+def max_profile_radius(mesh_data, axis_name):
+    """Largest distance of any profile vertex from the revolution axis.
+
+    The profile has already been moved so the axis passes through the mesh
+    origin along ``axis_name``.
+    """
+    axis = "XYZ".index(axis_name)
+    best = 0.0
     for v in mesh_data.vertices:
-        v.co -= origin_vec
-    mesh_data.update()
+        co = v.co
+        r2 = sum(co[i] * co[i] for i in range(3) if i != axis)
+        if r2 > best:
+            best = r2
+    return math.sqrt(best)
+
+
+def adaptive_screw_steps(radius, tolerance, min_steps=8, max_steps=512):
+    """Fewest revolve steps whose chordal error stays within ``tolerance``.
 
-    return rev_name, origin_vec
+    A chord spanning angle 2π/n at radius r deviates from the true circle by
+    the sagitta r·(1 − cos(π/n)); solving for n gives π / acos(1 − tol/r).
+    """
+    if radius <= 1e-8 or tolerance <= 0.0:
+        return min_steps
+    if tolerance >= radius:
+        return min_steps
+    steps = math.ceil(math.pi / math.acos(1.0 - tolerance / radius))
+    return max(min_steps, min(max_steps, steps))
 
 
-def build_profile_mesh(context, gp_obj):
-    """Build edge-only profile mesh from GP strokes. Returns (mesh_obj, mesh_data) or (None, None)."""
+def build_profile_mesh(gp_obj, collection, resolution=0):
+    """Build edge-only profile mesh from GP strokes. Returns (mesh_obj, mesh_data) or (None, None).
+
+    When resolution > 0 every stroke is resampled to that many points (corners
+    kept), so the revolved surface has even spacing along the profile.
+    """
     mesh_data = bpy.data.meshes.new(name="GP_Screw_Mesh")
     mesh_obj = bpy.data.objects.new(name="GP_Screw_Mesh", object_data=mesh_data)
-    context.collection.objects.link(mesh_obj)
+    collection.objects.link(mesh_obj)
 
     vertices = []
     edges = []
     matrix = gp_obj.matrix_world
 
-    gp_data = gp_obj.data
-    for layer in gp_data.layers:
-        for frame in layer.frames:
-            for stroke in frame.drawing.strokes:
-                if len(stroke.points) < 2:
-                    continue
-                offset = len(vertices)
-                for pt in stroke.points:
-                    world_pos = matrix @ pt.position
-                    vertices.append(tuple(world_pos))
-                n = len(stroke.points)
-                for i in range(n - 1):
-                    edges.append((offset + i, offset + i + 1))
+    for _, drawing in scoped_drawings(gp_obj):
+        for stroke in drawing.strokes:
+            if len(stroke.points) < 2:
+                continue
+            stroke_pts = [matrix @ pt.position for pt in stroke.points]
+            if resolution > 0:
+                stroke_pts = resample_polyline(
+                    stroke_pts, resolution, cyclic=stroke.cyclic, preserve_corners=True,
+                )
+            offset = len(vertices)
+            vertices.extend(tuple(p) for p in stroke_pts)
+            n = len(stroke_pts)
+            for i in range(n - 1):
+                edges.append((offset + i, offset + i + 1))
 
     if len(vertices) < 2:
         bpy.data.objects.remove(mesh_obj, do_unlink=True)
@@ -99,13 +223,234 @@ def build_profile_mesh(context, gp_obj):
     return mesh_obj, mesh_data
 
 
+def _world_strokes(gp_obj, resolution=0):
+    """World-space ((N, 3) array, cyclic) for every stroke, optionally resampled."""
+    m = np.array(gp_obj.matrix_world, dtype=np.float64)
+    strokes = []
+    for pts, cyclic in read_strokes(gp_obj, bpy.context.scene.frame_current):
+        pts = pts @ m[:3, :3].T + m[:3, 3]
+        if resolution > 0:
+            pts = resample_polyline(pts, resolution, cyclic=cyclic, preserve_corners=True)
+        strokes.append((pts, cyclic))
+    return strokes
+
+
+def build_profile_objects(gp_obj, collection, resolution=0):
+    """Build one edge-mesh object per connected profile in a single pass.
+
+    Axis, centerline and radius of every profile come from one vectorized
+    fit over all points. Each object sits at its profile's axis origin.
+    Returns a list of (mesh_obj, axis_name, radius).
+    """
+    profiles = split_profiles(_world_strokes(gp_obj, resolution))
+    if not profiles:
+        return []
+
+    points = np.concatenate([s for profile in profiles for s, _ in profile])
+    profile_ids = np.repeat(
+        np.arange(len(profiles)),
+        [sum(len(s) for s, _ in profile) for profile in profiles],
+    )
+    endpoints = np.array([s[i] for profile in profiles for s, _ in profile for i in (0, -1)])
+    endpoint_ids = np.repeat(np.arange(len(profiles)), [2 * len(profile) for profile in profiles])
+
+    rev_axes, _, _, origins = fit_revolution_axes(
+        points, profile_ids, endpoints, endpoint_ids, len(profiles),
+    )
+
+    local = points - origins[profile_ids]
+    off_axis = np.arange(3)[None, :] != rev_axes[profile_ids][:, None]
+    r2 = np.where(off_axis, local * local, 0.0).sum(axis=1)
+    radii = np.zeros(len(profiles))
+    np.maximum.at(radii, profile_ids, np.sqrt(r2))
+
+    results = []
+    start = 0
+    for i, profile in enumerate(profiles):
+        count = sum(len(s) for s, _ in profile)
+        edges = []
+        offset = 0
+        for s, cyclic in profile:
+            idx = np.arange(offset, offset + len(s) - 1)
+            edges.append(np.stack([idx, idx + 1], axis=1))
+            if cyclic and len(s) > 2:
+                edges.append([[offset + len(s) - 1, offset]])
+            offset += len(s)
+        edges = np.concatenate(edges)
+
+        mesh_data = bpy.data.meshes.new(name="GP_Screw_Mesh")
+        mesh_data.vertices.add(count)
+        mesh_data.vertices.foreach_set("co", local[start:start + count].astype(np.float32).ravel())
+        mesh_data.edges.add(len(edges))
+        mesh_data.edges.foreach_set("vertices", edges.astype(np.int32).ravel())
+        mesh_data.update()
+        start += count
+
+        mesh_obj = bpy.data.objects.new(name="GP_Screw_Mesh", object_data=mesh_data)
+        collection.objects.link(mesh_obj)
+        mesh_obj.location = Vector(origins[i])
+        results.append((mesh_obj, "XYZ"[rev_axes[i]], float(radii[i])))
+
+    return results
+
+
+def add_screw_modifier_stack(mesh_obj, axis_name, radius, tolerance, render_tolerance):
+    """Add the Screw modifier used by the mesh path. Returns (steps, render_steps).
+
+    The step count comes from the widest point of the profile, so the mesh
+    comes out at the density the tolerance asks for — no Decimate pass.
+    """
+    steps = adaptive_screw_steps(radius, tolerance)
+    render_steps = adaptive_screw_steps(radius, render_tolerance)
+
+    screw = mesh_obj.modifiers.new(name="Screw", type="SCREW")
+    screw.steps = steps
+    screw.render_steps = render_steps
+    screw.axis = axis_name
+    screw.angle = math.tau
+    screw.use_merge_vertices = True
+    screw.merge_threshold = 0.0001
+    screw.use_normal_calculate = True
+    return steps, render_steps
+
+
+def get_or_create_smooth_node_group():
+    """Smooth shading with edges sharper than Angle kept sharp, like Blender's
+    Smooth by Angle, built here so no operator or asset library is needed."""
+    ng = bpy.data.node_groups.get(SMOOTH_NODE_GROUP)
+    if ng is not None:
+        return ng
+
+    ng = bpy.data.node_groups.new(name=SMOOTH_NODE_GROUP, type='GeometryNodeTree')
+    iface = ng.interface
+    iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    angle = iface.new_socket(name="Angle", in_out='INPUT', socket_type='NodeSocketFloat')
+    angle.subtype = 'ANGLE'
+    angle.default_value, angle.min_value, angle.max_value = math.radians(30.0), 0.0, math.pi
+    iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    link = ng.links.new
+    nodes = ng.nodes
+
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-600, 0)
+
+    edge_angle = nodes.new('GeometryNodeInputMeshEdgeAngle'); edge_angle.location = (-600, -200)
+    smooth_edge = nodes.new('FunctionNodeCompare'); smooth_edge.location = (-400, -200)
+    smooth_edge.data_type = 'FLOAT'
+    smooth_edge.operation = 'LESS_EQUAL'
+    link(edge_angle.outputs['Unsigned Angle'], smooth_edge.inputs['A'])
+    link(group_in.outputs['Angle'], smooth_edge.inputs['B'])
+
+    edges = nodes.new('GeometryNodeSetShadeSmooth'); edges.location = (-200, 0)
+    edges.domain = 'EDGE'
+    link(group_in.outputs['Geometry'], edges.inputs['Geometry'])
+    link(smooth_edge.outputs['Result'], edges.inputs['Shade Smooth'])
+
+    faces = nodes.new('GeometryNodeSetShadeSmooth'); faces.location = (0, 0)
+    faces.domain = 'FACE'
+    faces.inputs['Shade Smooth'].default_value = True
+    link(edges.outputs['Geometry'], faces.inputs['Geometry'])
+
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (200, 0)
+    link(faces.outputs['Geometry'], group_out.inputs['Geometry'])
+    return ng
+
+
+def add_smooth_by_angle(obj):
+    """Append the smooth-by-angle modifier (what shade_auto_smooth adds)."""
+    mod = obj.modifiers.new(name=SMOOTH_MODIFIER_NAME, type='NODES')
+    mod.node_group = get_or_create_smooth_node_group()
+    return mod
+
+
+def screw_to_mesh(gp_obj, collection, resolution=0, tolerance=0.01, render_tolerance=0.002):
+    """Replace ``gp_obj`` with a profile mesh in ``collection`` revolved by a
+    Screw modifier. Raises ValueError without enough points.
+
+    Returns (mesh object, axis name, steps, render steps).
+    """
+    mesh_obj, mesh_data = build_profile_mesh(gp_obj, collection, resolution)
+    if mesh_obj is None:
+        raise ValueError("Need at least 2 points in Grease Pencil")
+
+    # Auto-detect revolution axis and move origin to centerline
+    detected_axis, origin_vec = detect_revolution_axis(mesh_data, gp_obj)
+    mesh_obj.location = origin_vec
+
+    radius = max_profile_radius(mesh_data, detected_axis)
+    steps, render_steps = add_screw_modifier_stack(
+        mesh_obj, detected_axis, radius, tolerance, render_tolerance,
+    )
+    add_smooth_by_angle(mesh_obj)
+
+    bpy.data.objects.remove(gp_obj, do_unlink=True)
+    return mesh_obj, detected_axis, steps, render_steps
+
+
+def screw_each_profile(gp_obj, collection, resolution=0, tolerance=0.01, render_tolerance=0.002):
+    """Replace ``gp_obj`` with one revolved mesh per connected profile.
+
+    Raises ValueError without enough points. Returns the mesh objects.
+    """
+    results = build_profile_objects(gp_obj, collection, resolution)
+    if not results:
+        raise ValueError("Need at least 2 points in Grease Pencil")
+
+    for mesh_obj, axis_name, radius in results:
+        add_screw_modifier_stack(mesh_obj, axis_name, radius, tolerance, render_tolerance)
+        add_smooth_by_angle(mesh_obj)
+
+    bpy.data.objects.remove(gp_obj, do_unlink=True)
+    return [mesh_obj for mesh_obj, _, _ in results]
+
+
 class GPTOOLS_OT_screw_mesh(bpy.types.Operator):
-    """Create screw (lathe) mesh from Grease Pencil profile using Screw modifier"""
+    """Revolve a Grease Pencil profile into a lathed shape. Live mode adds a
+    Geometry Nodes modifier on the GP that follows stroke edits; otherwise a
+    mesh with a Screw modifier replaces the GP"""
 
     bl_idname = "gptools.screw_mesh"
     bl_label = "Create Screw Mesh"
     bl_options = {"REGISTER", "UNDO"}
 
+    separate_profiles: bpy.props.BoolProperty(
+        name="Separate Profiles",
+        default=False,
+        description="Revolve every connected profile into its own object around its own axis "
+                    "(creates meshes, ignores Live)",
+        options={'SKIP_SAVE'},
+    )
+    live: bpy.props.BoolProperty(
+        name="Live (Geometry Nodes)",
+        default=True,
+        description="Keep the Grease Pencil and revolve it with a Geometry Nodes modifier, "
+                    "so editing strokes updates the shape",
+    )
+
+    resolution: bpy.props.IntProperty(
+        name="Profile Resolution",
+        default=0,
+        min=0,
+        max=512,
+        description="Resample each profile stroke to this many points (0 = use original points)",
+    )
+    chord_tolerance: bpy.props.FloatProperty(
+        name="Viewport Tolerance",
+        default=0.01,
+        min=0.0001,
+        max=10.0,
+        subtype='DISTANCE',
+        description="Maximum gap between the revolved surface and a true circle in the viewport; sets the step count",
+    )
+    render_chord_tolerance: bpy.props.FloatProperty(
+        name="Render Tolerance",
+        default=0.002,
+        min=0.0001,
+        max=10.0,
+        subtype='DISTANCE',
+        description="Maximum gap between the revolved surface and a true circle at render time",
+    )
+
     @classmethod
     def poll(cls, context):
         return get_active_grease_pencil(context) is not None
@@ -116,41 +461,39 @@ class GPTOOLS_OT_screw_mesh(bpy.types.Operator):
             self.report({"ERROR"}, "No active Grease Pencil found")
             return {"CANCELLED"}
 
-        gp_name = gp_obj.name
-
-        mesh_obj, mesh_data = build_profile_mesh(context, gp_obj)
-        if mesh_obj is None:
-            self.report({"ERROR"}, "Need at least 2 points in Grease Pencil")
+        tolerances = (self.chord_tolerance, self.render_chord_tolerance)
+        try:
+            if self.separate_profiles:
+                objects = screw_each_profile(gp_obj, context.collection, self.resolution, *tolerances)
+            elif self.live:
+                mod, detected_axis = add_live_screw(gp_obj, self.resolution, *tolerances)
+            else:
+                mesh_obj, detected_axis, steps, render_steps = screw_to_mesh(
+                    gp_obj, context.collection, self.resolution, *tolerances,
+                )
+        except ValueError as err:
+            self.report({"ERROR"}, str(err))
             return {"CANCELLED"}
 
-        # Auto-detect revolution axis and move origin to centerline
-        detected_axis, origin_vec = detect_revolution_axis(mesh_data, gp_obj)
-        mesh_obj.location = origin_vec
-
-        # Add native Blender Screw modifier
-        screw = mesh_obj.modifiers.new(name="Screw", type="SCREW")
-        screw.steps = 32
-        screw.render_steps = 32
-        screw.axis = detected_axis
-        screw.angle = math.tau
-        screw.use_merge_vertices = True
-        screw.merge_threshold = 0.0001
-        screw.use_normal_calculate = True
-
-        # Decimate modifier
-        decimate = mesh_obj.modifiers.new(name="Decimate", type="DECIMATE")
-        decimate.ratio = 0.5
-
-        # Select and activate
-        context.view_layer.objects.active = mesh_obj
-        mesh_obj.select_set(True)
-
-        # Shade auto smooth (adds "Smooth by Angle" GN modifier)
-        bpy.ops.object.shade_auto_smooth()
-
-        # Delete original GP
-        if gp_name in bpy.data.objects:
-            bpy.data.objects.remove(bpy.data.objects[gp_name], do_unlink=True)
+        if self.separate_profiles:
+            for o in context.view_layer.objects:
+                if o.select_get():
+                    o.select_set(False)
+            for mesh_obj in objects:
+                mesh_obj.select_set(True)
+            context.view_layer.objects.active = objects[0]
+            self.report({"INFO"}, f"Revolved {len(objects)} profile(s) into separate objects.")
+            return {"FINISHED"}
+
+        if self.live:
+            for o in context.view_layer.objects:
+                if o.select_get():
+                    o.select_set(False)
+            gp_obj.select_set(True)
+            context.view_layer.objects.active = gp_obj
+        else:
+            context.view_layer.objects.active = mesh_obj
+            mesh_obj.select_set(True)
 
         # Switch Properties panel to Modifiers tab
         try:
@@ -161,10 +504,19 @@ class GPTOOLS_OT_screw_mesh(bpy.types.Operator):
                             space.context = 'MODIFIER'
                             break
                     break
-        except TypeError:
+        except (AttributeError, TypeError):
             pass
 
-        self.report({"INFO"}, f"Screw mesh created (axis: {detected_axis}).")
+        if self.live:
+            self.report(
+                {"INFO"},
+                f"Screw modifier added (axis: {detected_axis}). Edit strokes to reshape.",
+            )
+        else:
+            self.report(
+                {"INFO"},
+                f"Screw mesh created (axis: {detected_axis}, {steps} steps, {render_steps} render).",
+            )
         return {"FINISHED"}
 
 
@@ -176,9 +528,11 @@ classes = [
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    register_node_group(NODE_GROUP_NAME, NODE_GROUP_VERSION, get_or_create_screw_node_group)
 
 
 def unregister():
+    unregister_node_group(NODE_GROUP_NAME)
     for cls in reversed(classes):
         try:
             bpy.utils.unregister_class(cls)
@@ -0,0 +1,78 @@
+import bpy
+from ..utils.budget import fit_modifier_to_budget
+
+
+class GPTOOLS_OT_fit_triangle_budget(bpy.types.Operator):
+    """Lower GreaseMesh resolutions so each modifier's estimated triangle
+    count fits the budget"""
+
+    bl_idname = "gptools.fit_triangle_budget"
+    bl_label = "Fit to Triangle Budget"
+    bl_options = {"REGISTER", "UNDO"}
+
+    scope: bpy.props.EnumProperty(
+        name="Scope",
+        items=[
+            ('ACTIVE', "Active", "Modifiers of the active object"),
+            ('SCENE', "Scene", "Modifiers of every Grease Pencil object in the scene"),
+        ],
+        default='ACTIVE',
+    )
+    budget: bpy.props.IntProperty(
+        name="Budget",
+        default=0,
+        min=0,
+        description="Triangles allowed per modifier (0 = use the scene budget)",
+    )
+
+    def execute(self, context):
+        budget = self.budget or context.scene.greasemesh.triangle_budget
+        if budget <= 0:
+            self.report({"ERROR"}, "Set a triangle budget first")
+            return {"CANCELLED"}
+
+        if self.scope == 'SCENE':
+            objects = [o for o in context.scene.objects if o.type == 'GREASEPENCIL']
+        else:
+            obj = context.active_object
+            objects = [obj] if obj and obj.type == 'GREASEPENCIL' else []
+
+        fitted = 0
+        total_before = total_after = 0
+        for obj in objects:
+            for mod in obj.modifiers:
+                result = fit_modifier_to_budget(obj, mod, budget)
+                if result is None:
+                    continue
+                before, after = result
+                total_before += before
+                total_after += after
+                fitted += after < before
+
+        if total_before == 0:
+            self.report({"INFO"}, "No GreaseMesh modifiers to fit.")
+            return {"CANCELLED"}
+
+        self.report(
+            {"INFO"},
+            f"Fitted {fitted} modifier(s): ~{total_before:,} → ~{total_after:,} triangles.",
+        )
+        return {"FINISHED"}
+
+
+classes = [
+    GPTOOLS_OT_fit_triangle_budget,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister():
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
@@ -1,4 +1,5 @@
 import bpy
+from .utils.orphans import orphan_stats
 
 
 class GPTOOLS_PT_main(bpy.types.Panel):
@@ -15,9 +16,14 @@ class GPTOOLS_PT_main(bpy.types.Panel):
         box = layout.box()
         box.label(text="Create", icon="GREASEPENCIL")
         box.operator("gptools.add_gpencil", text="Add New Grease Pencil", icon="ADD")
-        box.operator(
+        op = box.operator(
             "gptools.apply_all_modifiers", text="Apply All Modifiers", icon="CHECKMARK"
         )
+        op.scope = 'SELECTED'
+        op = box.operator(
+            "gptools.apply_all_modifiers", text="Apply to Collection", icon="OUTLINER_COLLECTION"
+        )
+        op.scope = 'COLLECTION'
 
         # Mesh from GP Section
         box = layout.box()
@@ -33,7 +39,10 @@ class GPTOOLS_PT_main(bpy.types.Panel):
         box = layout.box()
         box.label(text="Screw Mesh", icon="MOD_SCREW")
         col = box.column(align=True)
-        col.operator("gptools.screw_mesh", text="Screw", icon="MOD_SCREW")
+        op = col.operator("gptools.screw_mesh", text="Screw", icon="MOD_SCREW")
+        op.separate_profiles = False
+        op = col.operator("gptools.screw_mesh", text="Screw Each Profile", icon="MOD_SCREW")
+        op.separate_profiles = True
 
         # Other Section
         box = layout.box()
@@ -42,6 +51,78 @@ class GPTOOLS_PT_main(bpy.types.Panel):
         grid.operator("gptools.bool_cut", text="Bool Cut", icon="MOD_BOOLEAN")
         grid.operator("gptools.array_on_curve", text="Array on Pencil", icon="MOD_ARRAY")
         grid.operator("gptools.knife_cut", text="Knife", icon="MOD_EDGESPLIT")
+        grid.operator("gptools.lattice_wrap", text="Lattice Wrap", icon="MOD_LATTICE")
+
+        # Stamp Scatter Section
+        settings = context.scene.greasemesh
+        box = layout.box()
+        box.label(text="Stamp Scatter", icon="OUTLINER_OB_POINTCLOUD")
+        box.prop(settings, "scatter_collection")
+        box.operator("gptools.stamp_scatter", text="Scatter on Surface", icon="PARTICLES")
+
+        # Viewport Detail Section
+        box = layout.box()
+        box.label(text="Viewport Detail", icon="RESTRICT_VIEW_OFF")
+        col = box.column(align=True)
+        col.prop(settings, "viewport_proxy_override")
+        sub = col.column(align=True)
+        sub.active = settings.viewport_proxy_override
+        sub.prop(settings, "viewport_resolution_factor")
+        sub.prop(settings, "viewport_noise")
+
+        # Evaluate on Idle Section
+        box = layout.box()
+        box.label(text="Drawing", icon="GREASEPENCIL")
+        col = box.column(align=True)
+        col.prop(settings, "idle_evaluation")
+        sub = col.column(align=True)
+        sub.active = settings.idle_evaluation
+        sub.prop(settings, "idle_proxy")
+        sub.prop(settings, "idle_delay")
+
+        # Triangle Budget Section
+        box = layout.box()
+        box.label(text="Triangle Budget", icon="MESH_DATA")
+        col = box.column(align=True)
+        col.prop(settings, "triangle_budget")
+        col.prop(settings, "budget_auto_fit")
+        row = box.row(align=True)
+        row.enabled = settings.triangle_budget > 0
+        row.operator("gptools.fit_triangle_budget", text="Fit Active").scope = 'ACTIVE'
+        row.operator("gptools.fit_triangle_budget", text="Fit Scene").scope = 'SCENE'
+
+        # Bake Section
+        box = layout.box()
+        box.label(text="Bake", icon="FILE_CACHE")
+        row = box.row(align=True)
+        for text, animation in (("Bake Frame", False), ("Bake Range", True)):
+            op = row.operator("gptools.bake_greasemesh", text=text)
+            op.action = 'BAKE'
+            op.animation = animation
+        box.operator("gptools.bake_greasemesh", text="Free Bake", icon="TRASH").action = 'FREE'
+        box.operator("gptools.bake_frames_parallel", text="Bake Frames in Background", icon="RENDER_ANIMATION")
+
+        # Freeze Section
+        box = layout.box()
+        box.label(text="Freeze", icon="FREEZE")
+        row = box.row(align=True)
+        row.operator("gptools.freeze_greasemesh", text="Freeze").action = 'FREEZE'
+        row.operator("gptools.freeze_greasemesh", text="Unfreeze").action = 'UNFREEZE'
+
+        # Memory Section
+        count, size = orphan_stats()
+        box = layout.box()
+        box.label(text="Memory", icon="MEMORY")
+        box.label(text=f"Replaced meshes: {count} (~{size / (1024 * 1024):.1f} MB)")
+        col = box.column(align=True)
+        col.prop(settings, "orphan_auto_purge")
+        sub = col.column(align=True)
+        sub.active = settings.orphan_auto_purge
+        sub.prop(settings, "orphan_keep_steps")
+        sub.prop(settings, "orphan_memory_limit")
+        row = box.row()
+        row.enabled = count > 0
+        row.operator("gptools.purge_orphans", text="Purge Now", icon="TRASH")
 
 
 classes = [
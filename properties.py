@@ -0,0 +1,132 @@
+import bpy
+
+from .utils.idle_eval import register_handlers, resume_all, unregister_handlers
+from .utils.viewport_proxy import sync_viewport_proxy
+
+
+def _update_viewport_proxy(self, context):
+    sync_viewport_proxy(context.scene)
+
+
+def _update_idle_evaluation(self, context):
+    if not self.idle_evaluation:
+        resume_all()
+
+
+class GreaseMeshSettings(bpy.types.PropertyGroup):
+    """Scene-wide GreaseMesh settings, shown in the GMesh panel."""
+
+    orphan_auto_purge: bpy.props.BoolProperty(
+        name="Auto Purge",
+        default=False,
+        description="Free meshes replaced by Apply / Bool Cut once they are "
+                    "older than the kept steps or exceed the memory limit",
+    )
+    orphan_keep_steps: bpy.props.IntProperty(
+        name="Keep Steps",
+        default=3,
+        min=0,
+        max=100,
+        description="Number of most recent Apply / Bool Cut operations whose "
+                    "replaced meshes stay in memory",
+    )
+    orphan_memory_limit: bpy.props.IntProperty(
+        name="Memory Limit (MB)",
+        default=1024,
+        min=0,
+        max=1048576,
+        description="Purge the oldest replaced meshes while their total size "
+                    "exceeds this limit (0 = no limit)",
+    )
+    viewport_proxy_override: bpy.props.BoolProperty(
+        name="Override Viewport Detail",
+        default=False,
+        description="Set the viewport resolution and noise factors of every "
+                    "GreaseMesh modifier in the scene; renders keep full detail",
+        update=_update_viewport_proxy,
+    )
+    viewport_resolution_factor: bpy.props.FloatProperty(
+        name="Viewport Resolution",
+        default=0.5,
+        min=0.05,
+        max=1.0,
+        subtype='FACTOR',
+        description="Fraction of the resolution / corner segments used in the viewport",
+        update=_update_viewport_proxy,
+    )
+    viewport_noise: bpy.props.FloatProperty(
+        name="Viewport Noise",
+        default=0.25,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+        description="Fraction of the noise detail used in the viewport",
+        update=_update_viewport_proxy,
+    )
+    triangle_budget: bpy.props.IntProperty(
+        name="Triangle Budget",
+        default=500000,
+        min=0,
+        description="Estimated triangles allowed per GreaseMesh modifier; new "
+                    "modifiers over it warn or are fitted (0 = no budget)",
+    )
+    budget_auto_fit: bpy.props.BoolProperty(
+        name="Auto Fit",
+        default=False,
+        description="Lower the resolution of new GreaseMesh modifiers to fit the "
+                    "budget instead of only warning",
+    )
+    idle_evaluation: bpy.props.BoolProperty(
+        name="Evaluate on Idle",
+        default=False,
+        description="While drawing or sculpting strokes, hold back the active "
+                    "object's GreaseMesh modifiers until the pen has been idle",
+        update=_update_idle_evaluation,
+    )
+    idle_proxy: bpy.props.EnumProperty(
+        name="While Drawing",
+        items=[
+            ('DISABLE', "Disabled", "Turn the modifiers off in the viewport"),
+            ('PROXY', "Low Resolution", "Evaluate at the lowest viewport resolution"),
+        ],
+        default='DISABLE',
+        description="What GreaseMesh modifiers do while strokes are being drawn",
+    )
+    idle_delay: bpy.props.FloatProperty(
+        name="Idle Delay",
+        default=0.5,
+        min=0.05,
+        max=10.0,
+        unit='TIME_ABSOLUTE',
+        description="Seconds without stroke changes before full evaluation resumes",
+    )
+    scatter_collection: bpy.props.PointerProperty(
+        name="Asset Collection",
+        type=bpy.types.Collection,
+        description="Collection whose objects Stamp Scatter places on the surface",
+    )
+
+
+classes = [
+    GreaseMeshSettings,
+]
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.greasemesh = bpy.props.PointerProperty(type=GreaseMeshSettings)
+    register_handlers()
+
+
+def unregister():
+    unregister_handlers()
+    try:
+        del bpy.types.Scene.greasemesh
+    except AttributeError:
+        pass
+    for cls in reversed(classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
@@ -0,0 +1,163 @@
+"""Planar arrangement of overlapping and nested outlines.
+
+Filling every stroke as one welded curve gives unpredictable caps when
+strokes cross or a loop is drawn inside another as a hole. Here outlines
+stay separate and are arranged instead:
+
+  - ``delaunay_2d_cdt`` inserts every outline as a constraint, splitting
+    segments where they intersect, and returns the cells of the resulting
+    planar graph, each tagged with the outlines it lies inside;
+  - each outline's nesting depth is the number of outlines containing it
+    completely, found through a bounding-box index and a vectorized
+    point-in-polygon test;
+  - a cell is filled when the deepest outline around it has an even depth.
+    Crossing outlines merge, an outline inside another cuts a hole, one
+    inside that hole is solid again, and so on. As a plain union every cell
+    inside any outline is filled instead.
+
+Faces are handled as flat arrays: ``corners`` (vertex index per face
+corner) and ``sizes`` (corners per face), always counter-clockwise.
+"""
+
+import itertools
+
+import numpy as np
+from mathutils.geometry import delaunay_2d_cdt
+
+# delaunay_2d_cdt output types
+CDT_INSIDE = 1
+CDT_INSIDE_WITH_HOLES = 3
+CDT_CONSTRAINTS_VALID_BMESH = 4
+CDT_CONSTRAINTS_VALID_BMESH_WITH_HOLES = 5
+CDT_EPSILON = 1e-6
+
+
+def _face_starts(sizes):
+    return np.cumsum(sizes) - sizes
+
+
+def _next_corner(sizes):
+    """Index of the following corner within each face, wrapping around."""
+    starts = _face_starts(sizes)
+    following = np.arange(int(sizes.sum())) + 1
+    following[starts + sizes - 1] = starts
+    return following
+
+
+def _reversed_corners(sizes):
+    """Corner order that reverses the winding of every face."""
+    starts = np.repeat(_face_starts(sizes), sizes)
+    local = np.arange(int(sizes.sum())) - starts
+    return starts + np.repeat(sizes, sizes) - 1 - local
+
+
+def face_arrays(verts, faces):
+    """CDT output → (co (V, 2), corners, sizes), clockwise faces turned around
+    and vertices no face uses dropped.
+
+    Returns None without faces.
+    """
+    if not faces:
+        return None
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    corners = np.fromiter(itertools.chain.from_iterable(faces), dtype=np.int64, count=int(sizes.sum()))
+    used, corners = np.unique(corners, return_inverse=True)
+    corners = corners.ravel()
+    co = np.array(verts, dtype=np.float64).reshape(-1, 2)[used]
+
+    # Shoelace area per face
+    following = corners[_next_corner(sizes)]
+    cross = co[corners, 0] * co[following, 1] - co[following, 0] * co[corners, 1]
+    clockwise = np.repeat(np.add.reduceat(cross, _face_starts(sizes)) < 0.0, sizes)
+    if clockwise.any():
+        corners = corners[np.where(clockwise, _reversed_corners(sizes), np.arange(len(corners)))]
+    return co, corners, sizes
+
+
+def triangulate_loops(loops, output, need_ids=False):
+    """Run the CDT with every (N, 2) loop as a constraint face.
+
+    Returns the ``delaunay_2d_cdt`` result tuple.
+    """
+    sizes = [len(loop) for loop in loops]
+    starts = np.cumsum([0] + sizes[:-1]).tolist()
+    faces = [list(range(s, s + n)) for s, n in zip(starts, sizes)]
+    return delaunay_2d_cdt(
+        np.concatenate(loops).tolist(), [], faces, output, CDT_EPSILON, need_ids=need_ids,
+    )
+
+
+def points_in_polygon(points, polygon):
+    """Even-odd test of (N, 2) points against a closed (M, 2) polygon."""
+    a = polygon
+    b = np.roll(polygon, -1, axis=0)
+    px = points[:, 0:1]
+    py = points[:, 1:2]
+    straddles = (a[:, 1] > py) != (b[:, 1] > py)
+    dy = np.where(b[:, 1] != a[:, 1], b[:, 1] - a[:, 1], 1.0)
+    x_cross = a[:, 0] + (py - a[:, 1]) * (b[:, 0] - a[:, 0]) / dy
+    return np.count_nonzero(straddles & (px < x_cross), axis=1) % 2 == 1
+
+
+def nesting_depths(loops):
+    """Number of other loops that contain each loop completely.
+
+    A loop crossing another is not contained by it.
+    """
+    lo = np.array([loop.min(axis=0) for loop in loops])
+    hi = np.array([loop.max(axis=0) for loop in loops])
+    depth = np.zeros(len(loops), dtype=np.int64)
+    for i, loop in enumerate(loops):
+        # Bounding-box index: only loops whose box holds this one's box
+        candidates = np.flatnonzero(np.all(lo <= lo[i], axis=1) & np.all(hi >= hi[i], axis=1))
+        for j in candidates:
+            if j != i and points_in_polygon(loop, loops[j]).all():
+                depth[i] += 1
+    return depth
+
+
+def arrange_loops(loops, ngons=False, union=False):
+    """Fill closed (N, 2) loops as a planar arrangement (see module docs).
+
+    With ``ngons`` every filled cell is one n-gon, otherwise triangles. With
+    ``union`` nesting is ignored and everything inside a loop is filled.
+    Returns (co, corners, sizes) or None when nothing is filled.
+    """
+    loops = [np.asarray(loop, dtype=np.float64) for loop in loops if len(loop) >= 3]
+    if not loops:
+        return None
+
+    output = CDT_CONSTRAINTS_VALID_BMESH if ngons else CDT_INSIDE
+    verts, _, faces, _, _, face_orig = triangulate_loops(loops, output, need_ids=True)
+    if union:
+        filled = [face for face, orig in zip(faces, face_orig) if orig]
+    else:
+        depth = nesting_depths(loops)
+        filled = [
+            face for face, orig in zip(faces, face_orig)
+            if orig and depth[list(orig)].max() % 2 == 0
+        ]
+    return face_arrays(verts, filled)
+
+
+def boundary_loops(co, corners, sizes):
+    """(N, 2) loops along the edges used by a single face.
+
+    With counter-clockwise faces, outer boundaries come out counter-clockwise
+    and holes clockwise. Loops shorter than 3 points are dropped.
+    """
+    n = len(co)
+    following = corners[_next_corner(sizes)]
+    outer = ~np.isin(corners * n + following, following * n + corners)
+    successor = dict(zip(corners[outer].tolist(), following[outer].tolist()))
+
+    loops = []
+    while successor:
+        start, v = successor.popitem()
+        loop = [start]
+        while v != start and v in successor:
+            loop.append(v)
+            v = successor.pop(v)
+        if len(loop) >= 3:
+            loops.append(co[loop])
+    return loops
@@ -0,0 +1,60 @@
+"""Geometry Nodes bake support for GreaseMesh modifiers.
+
+Every GreaseMesh node group ends in a Bake node. Once baked, its result is
+read from disk and the graph above it is skipped on load, on frame change
+and on depsgraph updates. Caches live next to the .blend file under
+``//greasemesh_cache/<object>/``.
+
+Node groups nested in another GreaseMesh group (Solid inside Mirror) bring
+their own Bake node along; only the outermost one is baked.
+"""
+
+import bpy
+
+GREASEMESH_PREFIX = "GreaseMesh_"
+CACHE_ROOT = "//greasemesh_cache"
+
+
+def add_bake_node(ng, geometry, x=0, y=0):
+    """Route ``geometry`` through a Bake node. Returns its geometry output."""
+    bake = ng.nodes.new('GeometryNodeBake'); bake.location = (x, y)
+    ng.links.new(geometry, bake.inputs[0])
+    return bake.outputs[0]
+
+
+def greasemesh_modifiers(obj):
+    """GN modifiers on ``obj`` that run a GreaseMesh node group."""
+    return [
+        mod for mod in obj.modifiers
+        if mod.type == 'NODES' and mod.node_group is not None
+        and mod.node_group.name.startswith(GREASEMESH_PREFIX)
+    ]
+
+
+def top_level_bakes(mod):
+    """Bake entries of ``mod`` whose Bake node sits in its own node group."""
+    bakes = []
+    for bake in getattr(mod, "bakes", ()):
+        node = getattr(bake, "node", None)
+        if node is None or node.id_data == mod.node_group:
+            bakes.append(bake)
+    return bakes
+
+
+def cache_directory(obj):
+    """Blend-relative cache folder for ``obj``."""
+    return f"{CACHE_ROOT}/{bpy.path.clean_name(obj.name)}/"
+
+
+def configure_bake(obj, mod, bake, animation, frame_start, frame_end):
+    """Point a bake at the object's disk cache for a still or a frame range."""
+    mod.bake_directory = cache_directory(obj)
+    bake.use_custom_path = False
+    if hasattr(bake, "bake_target"):
+        bake.bake_target = 'DISK'
+    bake.bake_mode = 'ANIMATION' if animation else 'STILL'
+    if animation:
+        bake.use_custom_simulation_frame_range = True
+        bake.frame_start = frame_start
+        bake.frame_end = frame_end
+
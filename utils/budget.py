@@ -0,0 +1,159 @@
+"""Triangle budget: estimate GreaseMesh output size before evaluating.
+
+Each node group resamples every stroke to a fixed point count, so its output
+triangle count follows from stroke statistics (count, cyclic flags) and the
+resolution inputs alone — no evaluation needed. Fitting scales the
+resolution inputs so the estimate lands within a target budget.
+
+Corner Resolution is left alone: every graph fillets before resampling, so
+it shapes corners without changing the output point count.
+"""
+
+import math
+
+import numpy as np
+
+from .fill_extrude import read_strokes
+from .modifier_io import get_input, set_input
+
+
+def stroke_stats(gp_obj, layer_name=None, frame=None):
+    """(stroke count, open stroke count, total length) of the drawings shown
+    at ``frame`` (the scene's current frame when None), as the modifiers
+    evaluate them.
+
+    Only layer ``layer_name`` is counted when given.
+    """
+    layers = None if layer_name is None else (layer_name,)
+    count = open_count = 0
+    length = 0.0
+    for pts, cyclic in read_strokes(gp_obj, frame, layers=layers):
+        length += float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum())
+        count += 1
+        open_count += not cyclic
+    return count, open_count, length
+
+
+def _inputs(mod):
+    """{socket name: (identifier, value)} of a GN modifier's inputs."""
+    values = {}
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) == 'INPUT' and item.socket_type != 'NodeSocketGeometry':
+            values[item.name] = (item.identifier, get_input(mod, item.identifier, getattr(item, 'default_value', None)))
+    return values
+
+
+def _value(inputs, name, default=0):
+    entry = inputs.get(name)
+    return default if entry is None or entry[1] is None else entry[1]
+
+
+# Per node group: triangles(gp_obj, inputs) and the resolution inputs to scale.
+# Filled outlines: two caps of (R − 2) triangles plus R side quads.
+
+def _solid_tris(gp_obj, inputs):
+    r = _value(inputs, 'Resolution', 64)
+    count, _, _ = stroke_stats(gp_obj)
+    return count * (4 * r - 4)
+
+
+def _mirror_tris(gp_obj, inputs):
+    copies = 2 ** sum(bool(_value(inputs, name, False)) for name in ("Mirror X", "Mirror Y", "Mirror Z"))
+    return _solid_tris(gp_obj, inputs) * copies
+
+
+def _blocks_tris(gp_obj, inputs):
+    r = _value(inputs, 'Resolution', 64)
+    count, _, _ = stroke_stats(gp_obj, "Paint")
+    return count * (4 * r - 4)
+
+
+def _wall_tris(gp_obj, inputs):
+    # Rectangle profile swept along each stroke: 4 quad strips plus end caps
+    r = _value(inputs, 'Resolution', 64)
+    count, open_count, _ = stroke_stats(gp_obj)
+    return count * 8 * r + open_count * 4
+
+
+def _path_tris(gp_obj, inputs):
+    p = _value(inputs, 'Profile Resolution', 32)
+    q = _value(inputs, 'Path Resolution', 64)
+    profiles, _, _ = stroke_stats(gp_obj, "Profile")
+    paths, _, _ = stroke_stats(gp_obj, "Path")
+    caps = 2 * (p - 2) if _value(inputs, 'Fill Caps', True) else 0
+    return profiles * paths * (2 * p * (q - 1) + caps)
+
+
+ESTIMATORS = {
+    "GreaseMesh_Solid": (_solid_tris, ("Resolution",)),
+    "GreaseMesh_Mirror": (_mirror_tris, ("Resolution",)),
+    "GreaseMesh_Blocks": (_blocks_tris, ("Resolution",)),
+    "GreaseMesh_Wall": (_wall_tris, ("Resolution",)),
+    "GreaseMesh_Path": (_path_tris, ("Profile Resolution", "Path Resolution")),
+}
+
+
+def _estimator(mod):
+    if mod.type != 'NODES' or mod.node_group is None:
+        return None
+    return ESTIMATORS.get(mod.node_group.name)
+
+
+def estimate_modifier_triangles(gp_obj, mod):
+    """Estimated full-detail triangle count of one modifier, or None if unknown."""
+    entry = _estimator(mod)
+    if entry is None:
+        return None
+    return int(entry[0](gp_obj, _inputs(mod)))
+
+
+def fit_modifier_to_budget(gp_obj, mod, budget):
+    """Lower the modifier's resolution inputs until its estimate fits ``budget``.
+
+    Resolutions only go down, never below the socket minimum. Triangles grow
+    linearly in each resolution, so with k scaled inputs each is multiplied
+    by (budget / estimate) ** (1 / k). Returns (before, after) estimates, or
+    None for modifiers without an estimator.
+    """
+    entry = _estimator(mod)
+    if entry is None:
+        return None
+    estimate, names = entry
+    inputs = _inputs(mod)
+    before = int(estimate(gp_obj, inputs))
+    if before <= budget or before == 0:
+        return before, before
+
+    scale = (budget / before) ** (1.0 / len(names))
+    items = mod.node_group.interface.items_tree
+    for name in names:
+        identifier, value = inputs[name]
+        floor = getattr(items[name], 'min_value', 2)
+        new_value = max(floor, int(math.floor(value * scale)))
+        set_input(mod, identifier, new_value)
+        inputs[name] = (identifier, new_value)
+
+    return before, int(estimate(gp_obj, inputs))
+
+
+def check_budget(operator, context, gp_obj, mod):
+    """Fit or warn right after an operator adds a modifier, before it evaluates."""
+    settings = context.scene.greasemesh
+    budget = settings.triangle_budget
+    if budget <= 0:
+        return
+    if settings.budget_auto_fit:
+        result = fit_modifier_to_budget(gp_obj, mod, budget)
+        if result and result[1] < result[0]:
+            operator.report(
+                {"INFO"},
+                f"Resolution lowered to fit the triangle budget (~{result[0]:,} → ~{result[1]:,}).",
+            )
+        return
+    estimate = estimate_modifier_triangles(gp_obj, mod)
+    if estimate is not None and estimate > budget:
+        operator.report(
+            {"WARNING"},
+            f"'{mod.name}' will produce ~{estimate:,} triangles (budget {budget:,}). "
+            "Use Fit to Budget or lower the resolution.",
+        )
@@ -10,6 +10,43 @@ def get_active_grease_pencil(context):
     return None
 
 
+def frame_at(layer, frame_number):
+    """The keyframe of ``layer`` shown at ``frame_number``, or None.
+
+    That is the last keyframe at or before the frame, as Blender evaluates it.
+    """
+    shown = None
+    for frame in layer.frames:
+        if frame.frame_number <= frame_number and (
+            shown is None or frame.frame_number > shown.frame_number
+        ):
+            shown = frame
+    return shown
+
+
+def scoped_drawings(gp_obj, frame=None, frame_range=None):
+    """Yield (layer, drawing) for the drawings in the extraction scope.
+
+    By default that is the drawing each layer shows at ``frame`` (the scene's
+    current frame when None) — what the modifiers evaluate. With
+    ``frame_range=(start, end)`` every drawing shown somewhere in the range
+    is yielded instead. Reading every keyframe of an animation would mix all
+    of its poses into one point cloud.
+    """
+    if frame is None:
+        frame = bpy.context.scene.frame_current
+    for layer in gp_obj.data.layers:
+        if frame_range is None:
+            frames = [frame_at(layer, frame)]
+        else:
+            start, end = frame_range
+            frames = [frame_at(layer, start)]
+            frames.extend(f for f in layer.frames if start < f.frame_number <= end)
+        for f in frames:
+            if f is not None and f.drawing is not None:
+                yield layer, f.drawing
+
+
 def gpencil_to_points(gp_obj):
     """Extract all points from a Grease Pencil object"""
     points = []
@@ -52,7 +89,7 @@ def stroke_length(stroke):
     return total
 
 
-def clean_gp_for_cutter(gp_obj, stub_fraction=0.10, bridge_fraction=0.25):
+def clean_gp_for_cutter(gp_obj, stub_fraction=0.10, bridge_fraction=0.25, frame=None):
     """Duplicate gp_obj and prepare it for closed-loop cutter generation.
 
     Real drawings often have stubs (accidental short strokes) and open shapes
@@ -63,6 +100,9 @@ def clean_gp_for_cutter(gp_obj, stub_fraction=0.10, bridge_fraction=0.25):
          bridge_fraction * bbox_diag), adds a synthetic stroke between them
          so the loop closes.
 
+    Only the drawings shown at ``frame`` (default: the current frame) are
+    cleaned; those are the ones the cutter is built from.
+
     Returns the duplicate object — caller is responsible for deleting it
     along with its data block.
     """
@@ -73,12 +113,13 @@ def clean_gp_for_cutter(gp_obj, stub_fraction=0.10, bridge_fraction=0.25):
     for col in gp_obj.users_collection:
         col.objects.link(new_obj)
 
+    drawings = [drawing for _, drawing in scoped_drawings(new_obj, frame)]
+
     all_pts = []
-    for layer in new_data.layers:
-        for frame in layer.frames:
-            for s in frame.drawing.strokes:
-                for p in s.points:
-                    all_pts.append(tuple(p.position))
+    for drawing in drawings:
+        for s in drawing.strokes:
+            for p in s.points:
+                all_pts.append(tuple(p.position))
     if not all_pts:
         return new_obj
 
@@ -96,48 +137,44 @@ def clean_gp_for_cutter(gp_obj, stub_fraction=0.10, bridge_fraction=0.25):
     stub_thresh = diag * stub_fraction
     bridge_thresh = diag * bridge_fraction
 
-    for layer in new_data.layers:
-        for frame in layer.frames:
-            drawing = frame.drawing
-            to_remove = [
-                i
-                for i, s in enumerate(drawing.strokes)
-                if len(s.points) < 2 or stroke_length(s) < stub_thresh
-            ]
-            if to_remove:
-                drawing.remove_strokes(indices=to_remove)
+    for drawing in drawings:
+        to_remove = [
+            i
+            for i, s in enumerate(drawing.strokes)
+            if len(s.points) < 2 or stroke_length(s) < stub_thresh
+        ]
+        if to_remove:
+            drawing.remove_strokes(indices=to_remove)
 
     bridge_thresh_sq = bridge_thresh * bridge_thresh
-    for layer in new_data.layers:
-        for frame in layer.frames:
-            drawing = frame.drawing
-            endpoints = []  # (stroke_idx, is_start, position)
-            for si, s in enumerate(drawing.strokes):
-                if len(s.points) >= 2 and not s.cyclic:
-                    endpoints.append((si, True, tuple(s.points[0].position)))
-                    endpoints.append((si, False, tuple(s.points[-1].position)))
-
-            open_eps = []
-            for i, ep in enumerate(endpoints):
-                nearest = float("inf")
-                for j, other in enumerate(endpoints):
-                    if i == j or ep[0] == other[0]:
-                        continue
-                    d2 = sum((a - b) ** 2 for a, b in zip(ep[2], other[2]))
-                    if d2 < nearest:
-                        nearest = d2
-                if nearest > bridge_thresh_sq:
-                    open_eps.append(ep)
-
-            if len(open_eps) == 2:
-                a_pos = open_eps[0][2]
-                b_pos = open_eps[1][2]
-                drawing.add_strokes([2])
-                new_stroke = drawing.strokes[-1]
-                new_stroke.points[0].position = a_pos
-                new_stroke.points[1].position = b_pos
-                new_stroke.cyclic = False
-                drawing.tag_positions_changed()
+    for drawing in drawings:
+        endpoints = []  # (stroke_idx, is_start, position)
+        for si, s in enumerate(drawing.strokes):
+            if len(s.points) >= 2 and not s.cyclic:
+                endpoints.append((si, True, tuple(s.points[0].position)))
+                endpoints.append((si, False, tuple(s.points[-1].position)))
+
+        open_eps = []
+        for i, ep in enumerate(endpoints):
+            nearest = float("inf")
+            for j, other in enumerate(endpoints):
+                if i == j or ep[0] == other[0]:
+                    continue
+                d2 = sum((a - b) ** 2 for a, b in zip(ep[2], other[2]))
+                if d2 < nearest:
+                    nearest = d2
+            if nearest > bridge_thresh_sq:
+                open_eps.append(ep)
+
+        if len(open_eps) == 2:
+            a_pos = open_eps[0][2]
+            b_pos = open_eps[1][2]
+            drawing.add_strokes([2])
+            new_stroke = drawing.strokes[-1]
+            new_stroke.points[0].position = a_pos
+            new_stroke.points[1].position = b_pos
+            new_stroke.cyclic = False
+            drawing.tag_positions_changed()
 
     return new_obj
 
@@ -150,9 +187,10 @@ def remove_cleanup_duplicate(cleaned_gp):
         bpy.data.grease_pencils.remove(cleaned_data)
 
 
-def walk_strokes_into_loop(strokes_pts):
+def walk_strokes_into_loop(strokes_pts, drop_closing=True):
     """Greedy traversal: order separate stroke point-lists into a single loop
-    by chaining nearest endpoints. Returns a flat ordered point list."""
+    by chaining nearest endpoints. Returns a flat ordered point list; with
+    ``drop_closing`` a last point repeating the first is dropped."""
     if not strokes_pts:
         return []
     remaining = list(range(1, len(strokes_pts)))
@@ -177,8 +215,134 @@ def walk_strokes_into_loop(strokes_pts):
             next_pts = next_pts[1:]
         ordered.extend(next_pts)
         remaining.remove(best_i)
-    if len(ordered) > 2 and (
+    if drop_closing and len(ordered) > 2 and (
         mathutils.Vector(ordered[-1]) - mathutils.Vector(ordered[0])
     ).length < 1e-3:
         ordered = ordered[:-1]
     return ordered
+
+
+def _polyline_length(pts):
+    return sum((pts[i + 1] - pts[i]).length for i in range(len(pts) - 1))
+
+
+def _bbox_diag(pts):
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    zs = [p[2] for p in pts]
+    return (
+        (max(xs) - min(xs)) ** 2
+        + (max(ys) - min(ys)) ** 2
+        + (max(zs) - min(zs)) ** 2
+    ) ** 0.5
+
+
+def gather_world_strokes(gp_obj, frame=None):
+    """Collect every stroke of every layer, as shown at ``frame``, in world space.
+
+    Returns a list of (points, cyclic) tuples, points being a list of Vectors.
+    Strokes with fewer than 2 points are skipped.
+    """
+    strokes = []
+    mw = gp_obj.matrix_world
+    for _, drawing in scoped_drawings(gp_obj, frame):
+        for stroke in drawing.strokes:
+            if len(stroke.points) < 2:
+                continue
+            pts = [mw @ p.position for p in stroke.points]
+            strokes.append((pts, stroke.cyclic))
+    return strokes
+
+
+def group_strokes_by_ends(strokes, lengths, fraction):
+    """Group strokes whose ends touch.
+
+    Two open strokes share a group when an end of one lies within
+    ``fraction`` * (length of the longer stroke) of an end of the other;
+    cyclic strokes stay alone. ``strokes`` is a list of (points, cyclic)
+    with at least 2 points each and ``lengths`` their lengths. Returns a
+    list of index lists.
+    """
+    from mathutils.kdtree import KDTree
+
+    # Endpoint KD-tree: index 2*i is the start of stroke i, 2*i+1 its end.
+    kd = KDTree(len(strokes) * 2)
+    for i, (pts, _) in enumerate(strokes):
+        kd.insert(pts[0], 2 * i)
+        kd.insert(pts[-1], 2 * i + 1)
+    kd.balance()
+
+    parent = list(range(len(strokes)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Querying with each stroke's own radius covers every pair, because a pair
+    # joins under the larger of the two strokes' radii.
+    for i, (pts, cyclic) in enumerate(strokes):
+        if cyclic:
+            continue
+        radius = lengths[i] * fraction
+        for endpoint in (pts[0], pts[-1]):
+            for _, idx, _ in kd.find_range(endpoint, radius):
+                j = idx // 2
+                if j != i and not strokes[j][1]:
+                    parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(len(strokes)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def group_strokes_into_outlines(strokes, stub_fraction=0.10, bridge_fraction=0.25):
+    """Split strokes into independent outlines and order each one.
+
+    Two strokes belong to the same outline when an endpoint of one lies within
+    bridge_fraction * (length of the longer stroke) of an endpoint of the
+    other, so a doorway drawn as arch + sides + floor stays one outline while
+    separate panel lines on the same sheet become separate outlines. Within an
+    outline made of several strokes, stubs shorter than stub_fraction * outline
+    bbox diagonal are dropped before walking the strokes into one chain.
+
+    An outline is cyclic when its only stroke is cyclic or when its chain ends
+    meet: they lie within bridge_fraction * (length of its longest stroke),
+    the tolerance strokes are joined with. Open panel lines stay open, also
+    when they are the only outline.
+
+    Returns a list of (ordered_points, cyclic) tuples.
+    """
+    strokes = [(list(pts), cyclic) for pts, cyclic in strokes if len(pts) >= 2]
+    if not strokes:
+        return []
+
+    lengths = [_polyline_length(pts) for pts, _ in strokes]
+    groups = group_strokes_by_ends(strokes, lengths, bridge_fraction)
+
+    outlines = []
+    for members in groups:
+        group_pts = [p for i in members for p in strokes[i][0]]
+        diag = _bbox_diag(group_pts)
+        if len(members) > 1 and diag > 1e-6:
+            kept = [i for i in members if lengths[i] >= diag * stub_fraction]
+            if kept:
+                members = kept
+
+        chain = walk_strokes_into_loop([strokes[i][0] for i in members], drop_closing=False)
+        chain = [mathutils.Vector(p) for p in chain]
+        if len(chain) < 2:
+            continue
+
+        gap = (chain[-1] - chain[0]).length
+        if len(members) == 1 and strokes[members[0]][1]:
+            cyclic = True
+        else:
+            cyclic = len(chain) > 2 and gap <= max(lengths[i] for i in members) * bridge_fraction
+        if cyclic and len(chain) > 3 and gap < 1e-3:
+            chain = chain[:-1]
+        outlines.append((chain, cyclic))
+
+    return [(chain, cyclic) for chain, cyclic in outlines if len(chain) >= (3 if cyclic else 2)]
@@ -0,0 +1,375 @@
+"""Direct fill-and-extrude engine for Solid and Blocks.
+
+Builds the mesh the SolidMesh and BlocksMesh node groups produce straight
+from the strokes, for batch conversion where no live modifier is wanted: no
+modifier, no depsgraph evaluation and no copy out of ``object_instances``.
+
+Strokes are read with ``foreach_get``, moved into the fitted (U, V, Normal)
+basis, resampled and filled with ``mathutils.geometry.delaunay_2d_cdt``:
+Solid's outlines through the planar arrangement (see arrangement), Blocks'
+the way Fill Curve fills them. The cap is extruded along the normal in
+NumPy, with side walls on its boundary edges, and returned as
+``mesh_transfer`` buffers.
+
+Known differences from the node groups: Blocks' per-block random values come
+from NumPy rather than the Geometry Nodes hash, so the same Jitter Seed
+jitters differently, and Noise Strength has no direct counterpart.
+"""
+
+import math
+
+import numpy as np
+
+from .arrangement import (
+    CDT_CONSTRAINTS_VALID_BMESH_WITH_HOLES,
+    CDT_INSIDE_WITH_HOLES,
+    _face_starts,
+    _next_corner,
+    _reversed_corners,
+    arrange_loops,
+    face_arrays,
+    triangulate_loops,
+)
+from .conversion import group_strokes_by_ends, scoped_drawings, walk_strokes_into_loop
+from .modifier_io import _key
+from .resample import _turning_angles, resample_polyline
+
+# Open strokes join when their ends are within this fraction of the longer
+# stroke's length, as in group_strokes_into_outlines
+_JOIN_FRACTION = 0.25
+
+SOLID_DEFAULTS = {
+    "Resolution": 64,
+    "Thickness": 0.4,
+    "Optimize Topology": False,
+    "Straight Angle": math.radians(0.25),
+    "Triangulate": False,
+}
+
+BLOCKS_DEFAULTS = {
+    **SOLID_DEFAULTS,
+    "Corner Radius": 0.0,
+    "Corner Resolution": 4,
+    "Noise Strength": 0.0,
+    "Thickness Jitter": 0.0,
+    "Scale Jitter": 0.0,
+    "Rotation Jitter": 0.0,
+    "Jitter Seed": 0,
+}
+
+
+def resolve_settings(defaults, params):
+    """``defaults`` overridden by ``params``, named as modifier inputs
+    ("Corner Radius" or "corner_radius"). Unknown names raise KeyError."""
+    names = {_key(name): name for name in defaults}
+    settings = dict(defaults)
+    for name, value in params.items():
+        panel_name = names.get(_key(name))
+        if panel_name is None:
+            raise KeyError(f"No direct input '{name}' (inputs: {', '.join(defaults)})")
+        settings[panel_name] = value
+    return settings
+
+
+# ---------------------------------------------------------------------------
+# Strokes
+# ---------------------------------------------------------------------------
+
+
+def read_strokes(gp_obj, frame, layers=None):
+    """(points (N, 3), cyclic) per stroke of the drawings shown at ``frame``.
+
+    Only strokes on ``layers`` (names) are read when given. Strokes with
+    fewer than 2 points are skipped.
+    """
+    strokes = []
+    for layer, drawing in scoped_drawings(gp_obj, frame):
+        if layers is not None and layer.name not in layers:
+            continue
+        position = drawing.attributes.get("position")
+        if position is None or len(position.data) == 0:
+            continue
+        co = np.empty(len(position.data) * 3, dtype=np.float32)
+        position.data.foreach_get("vector", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+
+        offsets = np.empty(len(drawing.curve_offsets), dtype=np.int32)
+        drawing.curve_offsets.foreach_get("value", offsets)
+        cyclic = np.zeros(len(offsets) - 1, dtype=bool)
+        attr = drawing.attributes.get("cyclic")
+        if attr is not None and len(attr.data) == len(cyclic):
+            attr.data.foreach_get("value", cyclic)
+
+        for start, end, closed in zip(offsets[:-1], offsets[1:], cyclic):
+            if end - start >= 2:
+                strokes.append((co[start:end], bool(closed)))
+    return strokes
+
+
+def to_basis(points, basis):
+    """Local points → (rel·U, rel·V, rel·N), the graphs' forward basis change."""
+    center, u, v, normal = basis
+    return (points - center) @ np.stack((u, v, normal), axis=1)
+
+
+def fillet_polyline(points, radius, count, cyclic):
+    """Round the corners of a polyline like Fillet Curve in Poly mode.
+
+    Every corner becomes an arc of ``count`` segments. The radius is reduced
+    where it would run past the middle of a neighbouring segment; the ends
+    of open polylines stay sharp.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    if radius <= 0.0 or len(pts) < 3:
+        return pts
+
+    to_prev = np.roll(pts, 1, axis=0) - pts
+    to_next = np.roll(pts, -1, axis=0) - pts
+    len_prev = np.linalg.norm(to_prev, axis=1)
+    len_next = np.linalg.norm(to_next, axis=1)
+    valid = (len_prev > 1e-9) & (len_next > 1e-9)
+    d_prev = to_prev / np.where(valid, len_prev, 1.0)[:, None]
+    d_next = to_next / np.where(valid, len_next, 1.0)[:, None]
+
+    # Interior angle; straight runs and fold-backs keep their point
+    theta = np.arccos(np.clip(np.einsum('ij,ij->i', d_prev, d_next), -1.0, 1.0))
+    valid &= (theta > 1e-4) & (theta < math.pi - 1e-4)
+    if not cyclic:
+        valid[0] = valid[-1] = False
+    if not valid.any():
+        return pts
+
+    half = np.where(valid, theta * 0.5, 1.0)
+    tangent = np.minimum(radius / np.tan(half), np.minimum(len_prev, len_next) * 0.5)
+    bisector = d_prev + d_next
+    bisector /= np.maximum(np.linalg.norm(bisector, axis=1), 1e-12)[:, None]
+    center = pts + bisector * (tangent / np.cos(half))[:, None]
+    arm_a = pts + d_prev * tangent[:, None] - center
+    arm_b = pts + d_next * tangent[:, None] - center
+
+    # Slerp between the two arms over the arc angle π − θ
+    phi = np.where(valid, math.pi - theta, 1.0)[:, None]
+    w = np.linspace(0.0, 1.0, max(1, int(count)) + 1)[None, :]
+    weight_a = np.sin((1.0 - w) * phi) / np.sin(phi)
+    weight_b = np.sin(w * phi) / np.sin(phi)
+    arcs = center[:, None] + weight_a[..., None] * arm_a[:, None] + weight_b[..., None] * arm_b[:, None]
+    arcs[~valid] = pts[~valid][:, None]
+
+    keep = np.zeros(arcs.shape[:2], dtype=bool)
+    keep[:, 0] = True
+    keep[valid] = True
+    return arcs[keep]
+
+
+def join_stroke_ends(strokes, fraction=_JOIN_FRACTION):
+    """Chain open strokes into outlines.
+
+    Two open strokes join when an end of one lies within ``fraction`` of the
+    longer stroke's length from an end of the other, so a shape drawn in
+    several strokes becomes one outline while separate loops (a hole drawn
+    inside a shape) stay apart. Cyclic strokes are left alone. Returns a
+    list of (N, 3) point arrays, all to be treated as closed.
+    """
+    loops = [pts for pts, cyclic in strokes if cyclic]
+    open_strokes = [pts for pts, cyclic in strokes if not cyclic]
+    if not open_strokes:
+        return loops
+
+    lengths = [float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum()) for pts in open_strokes]
+    groups = group_strokes_by_ends([(pts, False) for pts in open_strokes], lengths, fraction)
+    for members in ([open_strokes[i] for i in group] for group in groups):
+        if len(members) == 1:
+            loops.append(members[0])
+        else:
+            loops.append(np.asarray(walk_strokes_into_loop(members), dtype=np.float64))
+    return loops
+
+
+def outline(points, resolution, optimize=False, straight_angle=0.0):
+    """Closed outline in basis coordinates → resampled (N, 2) plane loop.
+
+    Resample gives ``resolution`` points like the graphs' Resample Curve;
+    with ``optimize`` points turning less than ``straight_angle`` are
+    dropped as dissolve_straight_points does.
+    """
+    loop = resample_polyline(points, max(3, int(resolution)), cyclic=True)
+    if optimize:
+        keep = _turning_angles(loop, True) >= straight_angle
+        if keep.sum() >= 3:
+            loop = loop[keep]
+    return loop[:, :2]
+
+
+# ---------------------------------------------------------------------------
+# Fill and extrude
+# ---------------------------------------------------------------------------
+
+
+def fill_loops(loops, ngons=False):
+    """Fill closed (N, 2) loops the way Fill Curve does.
+
+    Loops nested inside others cut holes and crossings are split. Returns
+    (co (V, 2), corners, face sizes) with every face counter-clockwise, or
+    None when nothing fills.
+    """
+    loops = [loop for loop in loops if len(loop) >= 3]
+    if not loops:
+        return None
+    output = CDT_CONSTRAINTS_VALID_BMESH_WITH_HOLES if ngons else CDT_INSIDE_WITH_HOLES
+    verts, _, faces, *_ = triangulate_loops(loops, output)
+    return face_arrays(verts, faces)
+
+
+def mesh_islands(vertex_count, corners, sizes):
+    """Connected-component index per vertex (the graphs' Mesh Island)."""
+    a = corners
+    b = corners[_next_corner(sizes)]
+    labels = np.arange(vertex_count)
+    while True:
+        low = np.minimum(labels[a], labels[b])
+        merged = labels.copy()
+        np.minimum.at(merged, a, low)
+        np.minimum.at(merged, b, low)
+        merged = merged[merged]
+        if np.array_equal(merged, labels):
+            break
+        labels = merged
+    return np.unique(labels, return_inverse=True)[1].ravel()
+
+
+def mesh_buffers(co, corners, sizes):
+    """``mesh_transfer`` buffers for faces given as corners + face sizes.
+
+    Edges are derived from the faces. Every face is flat shaded.
+    """
+    n = len(co)
+    following = corners[_next_corner(sizes)]
+    key = np.minimum(corners, following) * n + np.maximum(corners, following)
+    unique, loop_edges = np.unique(key, return_inverse=True)
+    edges = np.stack((unique // n, unique % n), axis=1)
+    return {
+        "vertex_count": n,
+        "edge_count": len(edges),
+        "loop_count": len(corners),
+        "face_count": len(sizes),
+        "co": np.asarray(co, dtype=np.float32),
+        "edges": edges.astype(np.int32),
+        "loop_verts": corners.astype(np.int32),
+        "loop_edges": loop_edges.ravel().astype(np.int32),
+        "loop_start": _face_starts(sizes).astype(np.int32),
+        "attributes": {
+            "sharp_face": ('BOOLEAN', 'FACE', np.ones((len(sizes), 1), dtype=bool)),
+        },
+    }
+
+
+def extrude_fill(co2, corners, sizes, basis, thickness, triangulate=False):
+    """Solid from a filled cap: the cap flipped on the plane, a copy moved
+    ``thickness`` along the normal and quads on the boundary edges between.
+
+    ``thickness`` is one value or one per vertex of ``co2``. Returns
+    ``mesh_transfer`` buffers in the basis' (object local) space.
+    """
+    center, u, v, normal = basis
+    thickness = np.broadcast_to(np.asarray(thickness, dtype=np.float64), (len(co2),))
+
+    bottom = center + co2[:, :1] * u + co2[:, 1:2] * v
+    if not np.any(thickness > 0.0):
+        return mesh_buffers(bottom, corners, sizes)
+
+    n = len(co2)
+    top = bottom + thickness[:, None] * normal
+
+    # Boundary edges are used by one face; counter-clockwise caps make
+    # (a, b, b', a') face outward.
+    following = corners[_next_corner(sizes)]
+    key = np.minimum(corners, following) * n + np.maximum(corners, following)
+    _, inverse, counts = np.unique(key, return_inverse=True, return_counts=True)
+    boundary = counts[inverse.ravel()] == 1
+    a, b = corners[boundary], following[boundary]
+    if triangulate:
+        sides = np.stack((a, b, b + n, a, b + n, a + n), axis=1)
+        side_size = 3
+    else:
+        sides = np.stack((a, b, b + n, a + n), axis=1)
+        side_size = 4
+
+    faces = np.concatenate((corners[_reversed_corners(sizes)], corners + n, sides.ravel()))
+    face_sizes = np.concatenate((sizes, sizes, np.full(sides.size // side_size, side_size)))
+    return mesh_buffers(np.concatenate((bottom, top)), faces, face_sizes)
+
+
+# ---------------------------------------------------------------------------
+# Recipes
+# ---------------------------------------------------------------------------
+
+
+def solid_regions(strokes, basis, settings):
+    """Solid's cap: the outlines of ``strokes`` arranged in the (U, V) plane.
+
+    ``basis`` is (center, U, V, normal) arrays in local space; ``settings``
+    comes from resolve_settings(SOLID_DEFAULTS, …). Returns (co (V, 2),
+    corners, sizes) or None when nothing is enclosed.
+    """
+    flat = [(to_basis(pts, basis), cyclic) for pts, cyclic in strokes]
+    optimize = settings["Optimize Topology"]
+    loops = [
+        outline(loop, settings["Resolution"], optimize, settings["Straight Angle"])
+        for loop in join_stroke_ends(flat)
+    ]
+    return arrange_loops(loops, ngons=optimize and not settings["Triangulate"])
+
+
+def solid_buffers(strokes, basis, settings):
+    """SolidMesh output for ``strokes`` on the fitted ``basis``: the
+    arranged cap extruded by Thickness. Returns buffers or None."""
+    cap = solid_regions(strokes, basis, settings)
+    if cap is None:
+        return None
+    co2, corners, sizes = cap
+    return extrude_fill(co2, corners, sizes, basis, settings["Thickness"], settings["Triangulate"])
+
+
+def blocks_buffers(strokes, basis, settings):
+    """BlocksMesh output: every stroke filleted, filled and extruded as its
+    own block with its thickness, scale and rotation jitter.
+
+    Raises ValueError for Noise Strength, which needs the modifier.
+    Returns buffers or None.
+    """
+    if settings["Noise Strength"] > 0.0:
+        raise ValueError("Noise Strength needs the BlocksMesh modifier")
+
+    optimize = settings["Optimize Topology"]
+    loops = []
+    for pts, cyclic in strokes:
+        pts = fillet_polyline(pts, settings["Corner Radius"], settings["Corner Resolution"], cyclic)
+        loops.append(outline(
+            to_basis(pts, basis), settings["Resolution"], optimize, settings["Straight Angle"],
+        ))
+    filled = fill_loops(loops, ngons=optimize and not settings["Triangulate"])
+    if filled is None:
+        return None
+    co2, corners, sizes = filled
+
+    # Per-block jitter around each island's vertex centroid, in the plane
+    island = mesh_islands(len(co2), corners, sizes)
+    count = int(island.max()) + 1
+    per_island = np.bincount(island, minlength=count)[:, None]
+    centroid = np.stack(
+        [np.bincount(island, weights=co2[:, i], minlength=count) for i in range(2)], axis=1,
+    ) / np.maximum(per_island, 1)
+
+    seed = int(settings["Jitter Seed"])
+    rand_thick, rand_scale, rand_rot = (
+        np.random.default_rng(seed + offset).uniform(-1.0, 1.0, count) for offset in (0, 31, 67)
+    )
+    angle = (rand_rot * settings["Rotation Jitter"])[island]
+    scale = (1.0 + rand_scale * settings["Scale Jitter"])[island]
+    thickness = settings["Thickness"] * (1.0 + rand_thick * settings["Thickness Jitter"])
+
+    rel = co2 - centroid[island]
+    cos, sin = np.cos(angle), np.sin(angle)
+    rotated = np.stack((rel[:, 0] * cos - rel[:, 1] * sin, rel[:, 0] * sin + rel[:, 1] * cos), axis=1)
+    co2 = centroid[island] + rotated * scale[:, None]
+    return extrude_fill(co2, corners, sizes, basis, thickness[island], settings["Triangulate"])
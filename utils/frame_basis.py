@@ -0,0 +1,241 @@
+"""Per-frame Center/U/V/Normal bases for animated drawings.
+
+Solid and Blocks flatten strokes into a plane fitted through them. On a
+hand-drawn animation every keyframe has its own pose, so one plane through
+all of them fits none. The operators fit one basis per keyframe (NumPy, one
+``foreach_get`` per drawing) and store them in a small "basis table" mesh:
+one vertex per frame of the scene range, positioned at that frame's Center,
+with "U", "V", "Normal" and "frame" point attributes.
+
+The graph reads the table through Object Info and samples the row of the
+current scene frame, so playback needs no Python at all. Without a table
+(a single keyframe, or older modifiers) the static Center/U/V/Normal
+inputs are used as before.
+"""
+
+import bpy
+import numpy as np
+
+from .conversion import scoped_drawings
+from .modifier_io import get_input, set_input
+
+TABLE_SOCKET = "Basis Table"
+BASIS_NAMES = ("Center", "U", "V", "Normal")
+
+
+def add_basis_table_socket(iface):
+    """Add the hidden basis table input to a node group interface."""
+    s = iface.new_socket(name=TABLE_SOCKET, in_out='INPUT', socket_type='NodeSocketObject')
+    s.hide_in_modifier = True
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+
+def stroke_points(gp_obj, frame, skip_layers=()):
+    """(N, 3) local positions of the drawings shown at ``frame``."""
+    chunks = []
+    for layer, drawing in scoped_drawings(gp_obj, frame):
+        if layer.name in skip_layers:
+            continue
+        position = drawing.attributes.get("position")
+        if position is None or len(position.data) == 0:
+            continue
+        buf = np.empty(len(position.data) * 3, dtype=np.float32)
+        position.data.foreach_get("vector", buf)
+        chunks.append(buf.reshape(-1, 3))
+    if not chunks:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def _basis_from_normal(normal):
+    """(U, V) perpendicular to ``normal``; same convention as Solid's _build_basis."""
+    helper = np.array((0.0, 0.0, 1.0))
+    if abs(normal @ helper) > 0.9:
+        helper = np.array((1.0, 0.0, 0.0))
+    u = helper - normal * (helper @ normal)
+    u /= np.linalg.norm(u)
+    v = np.cross(normal, u)
+    return u, v / np.linalg.norm(v)
+
+
+def plane_basis(points, reference_normal):
+    """PCA plane through ``points`` → (center, U, V, normal) as float arrays.
+
+    The normal is flipped to agree with ``reference_normal`` so consecutive
+    frames don't turn the shape inside out.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    center = pts.mean(axis=0)
+    rel = pts - center
+    _, vecs = np.linalg.eigh(rel.T @ rel)
+    normal = vecs[:, 0]
+    if normal @ reference_normal < 0.0:
+        normal = -normal
+    u, v = _basis_from_normal(normal)
+    return center, u, v, normal
+
+
+def keyframe_numbers(gp_obj, frame_start, frame_end, skip_layers=()):
+    """Frames in the range where the shown drawings change (start included)."""
+    keys = {frame_start}
+    for layer in gp_obj.data.layers:
+        if layer.name in skip_layers:
+            continue
+        keys.update(
+            f.frame_number for f in layer.frames if frame_start < f.frame_number <= frame_end
+        )
+    return sorted(keys)
+
+
+def fit_frame_bases(gp_obj, frame_start, frame_end, reference_normal, skip_layers=()):
+    """Fit one basis per keyframe and expand it to every frame of the range.
+
+    Returns a (frames, 12) array — Center, U, V, Normal per row — or None
+    when the drawing doesn't change within the range.
+    """
+    keys = keyframe_numbers(gp_obj, frame_start, frame_end, skip_layers)
+    if len(keys) < 2:
+        return None
+
+    rows = np.empty((frame_end - frame_start + 1, 12), dtype=np.float32)
+    previous = None
+    normal = np.asarray(reference_normal, dtype=np.float64)
+    for key, next_key in zip(keys, keys[1:] + [frame_end + 1]):
+        pts = stroke_points(gp_obj, key, skip_layers)
+        if len(pts) >= 3:
+            basis = plane_basis(pts, normal)
+            normal = basis[3]
+            previous = np.concatenate(basis)
+        elif previous is None:
+            u, v = _basis_from_normal(normal)
+            previous = np.concatenate((np.zeros(3), u, v, normal))
+        rows[key - frame_start:next_key - frame_start] = previous
+    return rows
+
+
+def write_basis_table(gp_obj, frame_start, rows, table=None):
+    """Store fitted rows in a basis table object (reusing ``table`` if given)."""
+    mesh = bpy.data.meshes.new(f"{gp_obj.name}_Bases")
+    mesh.vertices.add(len(rows))
+    mesh.vertices.foreach_set("co", rows[:, 0:3].ravel())
+    frames = np.arange(frame_start, frame_start + len(rows), dtype=np.float32)
+    mesh.attributes.new("frame", 'FLOAT', 'POINT').data.foreach_set("value", frames)
+    for i, name in enumerate(BASIS_NAMES[1:], start=1):
+        attr = mesh.attributes.new(name, 'FLOAT_VECTOR', 'POINT')
+        attr.data.foreach_set("vector", rows[:, 3 * i:3 * i + 3].ravel())
+    mesh.update()
+
+    if table is None:
+        return bpy.data.objects.new(f"{gp_obj.name}_Bases", mesh)
+    old = table.data
+    table.data = mesh
+    if old is not None and old.users == 0:
+        bpy.data.meshes.remove(old)
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Geometry Nodes lookup
+# ---------------------------------------------------------------------------
+
+
+def basis_inputs(ng, group_in, x=0, y=0):
+    """Center/U/V/Normal for the current frame.
+
+    Samples the basis table row of the scene frame (clamped to the table's
+    range) when a table is connected, otherwise passes the static inputs
+    through. Returns {name: output socket}.
+    """
+    nodes = ng.nodes
+    link = ng.links.new
+
+    table = nodes.new('GeometryNodeObjectInfo'); table.location = (x, y)
+    table.transform_space = 'ORIGINAL'
+    link(group_in.outputs[TABLE_SOCKET], table.inputs['Object'])
+    geometry = table.outputs['Geometry']
+
+    # Row index = floor(scene frame) − first frame of the table
+    first_attr = nodes.new('GeometryNodeInputNamedAttribute'); first_attr.location = (x, y - 250)
+    first_attr.data_type = 'FLOAT'
+    first_attr.inputs['Name'].default_value = "frame"
+    first = nodes.new('GeometryNodeAttributeStatistic'); first.location = (x + 200, y - 200)
+    first.data_type = 'FLOAT'
+    first.domain = 'POINT'
+    link(geometry, first.inputs['Geometry'])
+    link(first_attr.outputs['Attribute'], first.inputs['Attribute'])
+
+    time = nodes.new('GeometryNodeInputSceneTime'); time.location = (x + 200, y - 400)
+    floor = nodes.new('ShaderNodeMath'); floor.location = (x + 400, y - 400)
+    floor.operation = 'FLOOR'
+    link(time.outputs['Frame'], floor.inputs[0])
+    row = nodes.new('ShaderNodeMath'); row.location = (x + 600, y - 300)
+    row.operation = 'SUBTRACT'
+    link(floor.outputs['Value'], row.inputs[0])
+    link(first.outputs['Min'], row.inputs[1])
+
+    size = nodes.new('GeometryNodeAttributeDomainSize'); size.location = (x + 200, y + 200)
+    size.component = 'MESH'
+    link(geometry, size.inputs['Geometry'])
+    has_table = nodes.new('FunctionNodeCompare'); has_table.location = (x + 400, y + 200)
+    has_table.data_type = 'INT'
+    has_table.operation = 'GREATER_THAN'
+    link(size.outputs['Point Count'], has_table.inputs['A'])
+
+    position = nodes.new('GeometryNodeInputPosition'); position.location = (x + 600, y)
+    outputs = {}
+    for i, name in enumerate(BASIS_NAMES):
+        if name == "Center":
+            value = position.outputs['Position']
+        else:
+            attr = nodes.new('GeometryNodeInputNamedAttribute'); attr.location = (x + 600, y - 150 * i)
+            attr.data_type = 'FLOAT_VECTOR'
+            attr.inputs['Name'].default_value = name
+            value = attr.outputs['Attribute']
+
+        sample = nodes.new('GeometryNodeSampleIndex'); sample.location = (x + 800, y - 200 * i)
+        sample.data_type = 'FLOAT_VECTOR'
+        sample.domain = 'POINT'
+        sample.clamp = True
+        link(geometry, sample.inputs['Geometry'])
+        link(value, sample.inputs['Value'])
+        link(row.outputs['Value'], sample.inputs['Index'])
+
+        switch = nodes.new('GeometryNodeSwitch'); switch.location = (x + 1000, y - 200 * i)
+        switch.input_type = 'VECTOR'
+        link(has_table.outputs['Result'], switch.inputs['Switch'])
+        link(group_in.outputs[name], switch.inputs['False'])
+        link(sample.outputs['Value'], switch.inputs['True'])
+        outputs[name] = switch.outputs['Output']
+    return outputs
+
+
+def update_basis_table(mod, gp_obj, scene, reference_normal, skip_layers=()):
+    """Fit and connect a basis table for ``mod``, or disconnect it.
+
+    The table covers the scene frame range and is only built when the
+    drawing changes within it. Returns the number of keyframes fitted (0 when
+    the static basis is used).
+    """
+    identifier = None
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) == 'INPUT' and item.name == TABLE_SOCKET:
+            identifier = item.identifier
+    if identifier is None:
+        return 0
+
+    current = get_input(mod, identifier)
+    current = current if isinstance(current, bpy.types.Object) else None
+
+    rows = fit_frame_bases(gp_obj, scene.frame_start, scene.frame_end, reference_normal, skip_layers)
+    if rows is None:
+        set_input(mod, identifier, None)
+        if current is not None and current.users == 0:
+            bpy.data.objects.remove(current)
+        return 0
+
+    set_input(mod, identifier, write_basis_table(gp_obj, scene.frame_start, rows, current))
+    return len(keyframe_numbers(gp_obj, scene.frame_start, scene.frame_end, skip_layers))
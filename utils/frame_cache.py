@@ -0,0 +1,93 @@
+"""On-disk per-frame mesh buffers shared by the background frame baker.
+
+Worker processes write one ``<frame>.npz`` per evaluated frame holding the
+``read_mesh`` buffers of the object (see mesh_transfer); the parent reads
+them back when merging. Files are written under a temporary name and
+renamed, so a file that exists is always complete and the parent can count
+them for progress.
+
+This module only needs NumPy so the worker script can load it by path
+inside a background Blender without the add-on being installed there.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+_ARRAYS = ("co", "edges", "loop_verts", "loop_edges", "loop_start")
+_COUNTS = ("vertex_count", "edge_count", "loop_count", "face_count")
+
+
+def frame_path(directory, frame):
+    return os.path.join(directory, f"{frame:06d}.npz")
+
+
+def split_frame_range(frame_start, frame_end, chunks):
+    """Split an inclusive frame range into at most ``chunks`` contiguous parts."""
+    total = frame_end - frame_start + 1
+    chunks = max(1, min(chunks, total))
+    bounds = np.linspace(0, total, chunks + 1).round().astype(int)
+    return [
+        (frame_start + int(a), frame_start + int(b) - 1)
+        for a, b in zip(bounds[:-1], bounds[1:])
+        if b > a
+    ]
+
+
+def save_frame(directory, frame, data):
+    """Write one frame's buffers; ``data`` None means the frame is empty."""
+    arrays = {}
+    if data is not None:
+        for key in _COUNTS:
+            arrays[key] = np.int64(data[key])
+        for key in _ARRAYS:
+            arrays[key] = data[key]
+        for i, (name, (data_type, domain, buf)) in enumerate(data["attributes"].items()):
+            arrays[f"attr{i}"] = buf
+            arrays[f"attr{i}_meta"] = np.array([name, data_type, domain])
+    path = frame_path(directory, frame)
+    partial = path + ".part"
+    with open(partial, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(partial, path)
+
+
+def load_frame(directory, frame):
+    """Read one frame's buffers, or None for an empty frame."""
+    with np.load(frame_path(directory, frame)) as f:
+        if "co" not in f.files:
+            return None
+        data = {key: int(f[key]) for key in _COUNTS}
+        for key in _ARRAYS:
+            data[key] = f[key]
+        attributes = {}
+        i = 0
+        while f"attr{i}" in f.files:
+            name, data_type, domain = (str(v) for v in f[f"attr{i}_meta"])
+            attributes[name] = (data_type, domain, f[f"attr{i}"])
+            i += 1
+        data["attributes"] = attributes
+    return data
+
+
+def finished_frames(directory, frame_start, frame_end):
+    """Number of frames of the range already written."""
+    return sum(
+        os.path.exists(frame_path(directory, frame))
+        for frame in range(frame_start, frame_end + 1)
+    )
+
+
+def buffers_key(data):
+    """Hashable key of a frame's geometry, so held drawings share one mesh."""
+    if data is None:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    for key in _ARRAYS:
+        h.update(data[key].tobytes())
+    for name in sorted(data["attributes"]):
+        data_type, domain, buf = data["attributes"][name]
+        h.update(f"{name}:{data_type}:{domain}".encode())
+        h.update(buf.tobytes())
+    return h.digest()
@@ -0,0 +1,60 @@
+"""Background frame worker for the parallel frame baker.
+
+Not imported by the add-on; each worker runs it inside its own Blender:
+
+    blender -b --factory-startup <copy.blend> --python frame_worker.py -- \\
+        --object <name> --start <frame> --end <frame> --output <dir>
+
+It evaluates the object's modifiers on every frame of its chunk and writes
+one buffer file per frame (see frame_cache). A "GREASEMESH_FRAME <n>" line is
+printed after each frame for anyone watching stdout.
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+
+import bpy
+
+
+def _load(name):
+    """Load a sibling module by path; the add-on isn't installed in workers."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"greasemesh_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _arguments():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="frame_worker")
+    parser.add_argument("--object", required=True)
+    parser.add_argument("--start", type=int, required=True)
+    parser.add_argument("--end", type=int, required=True)
+    parser.add_argument("--output", required=True)
+    return parser.parse_args(argv)
+
+
+def main():
+    args = _arguments()
+    mesh_transfer = _load("mesh_transfer")
+    frame_cache = _load("frame_cache")
+
+    obj = bpy.data.objects.get(args.object)
+    if obj is None:
+        print(f"GREASEMESH_ERROR object '{args.object}' not found", flush=True)
+        sys.exit(1)
+
+    scene = bpy.context.scene
+    for frame in range(args.start, args.end + 1):
+        scene.frame_set(frame)
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        data = mesh_transfer.read_object_instances(depsgraph, obj)
+        frame_cache.save_frame(args.output, frame, data)
+        print(f"GREASEMESH_FRAME {frame}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
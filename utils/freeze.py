@@ -0,0 +1,287 @@
+"""Freeze GreaseMesh objects into a cached mesh until their strokes change.
+
+Freezing reads the evaluated result once, stores it in a mesh datablock and
+turns the object's modifiers off. A small "Frozen" GN modifier then outputs
+that mesh through Object Info, so the object looks the same but costs
+nothing to evaluate.
+
+Along with the mesh a content hash is stored: every stroke attribute of
+every drawing plus the settings and GN inputs of the modifier stack. A
+depsgraph handler rehashes frozen objects whose geometry was tagged; when
+the hash no longer matches (the strokes were edited or an input changed)
+the object is unfrozen from a timer and evaluates live again. Objects whose
+hashes match share one frozen mesh, and, when their stacks read other
+objects, also their transform.
+
+Frame-by-frame drawings are not frozen: the frozen mesh is a single frame.
+"""
+
+import hashlib
+import json
+
+import bpy
+import numpy as np
+
+from .frame_basis import keyframe_numbers
+from .mesh_transfer import _ATTRIBUTE_LAYOUT, mesh_from_buffers, read_instances_by_object
+from .modifier_io import get_input, reads_other_objects, set_input
+from .orphans import track_replaced_meshes
+from .viewport_proxy import FACTOR_SOCKET, NOISE_SOCKET, force_full_detail, restore_detail
+
+HASH_PROP = "greasemesh_frozen_hash"
+SHARE_PROP = "greasemesh_frozen_share"
+HOLDER_PROP = "greasemesh_frozen_object"
+MODIFIERS_PROP = "greasemesh_frozen_modifiers"
+
+NODE_GROUP_NAME = "GreaseMesh_Frozen"
+MODIFIER_NAME = "Frozen"
+
+# Inputs that only change viewport detail; the frozen mesh is full detail
+_IGNORED_SOCKETS = {FACTOR_SOCKET, NOISE_SOCKET}
+
+
+# ---------------------------------------------------------------------------
+# Content hash
+# ---------------------------------------------------------------------------
+
+
+def _stable(value):
+    """Value that repr()s the same across sessions (no pointers)."""
+    if isinstance(value, bpy.types.ID):
+        return ("id", value.name_full)
+    if hasattr(value, "as_pointer"):
+        return type(value).__name__
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, (str, bytes, int, bool)) or value is None:
+        return value
+    try:
+        return tuple(_stable(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+
+def _hash_drawing(h, drawing):
+    """Feed every public attribute of a drawing into ``h``."""
+    offsets = np.empty(len(drawing.curve_offsets), dtype=np.int32)
+    drawing.curve_offsets.foreach_get("value", offsets)
+    h.update(offsets.tobytes())
+    for attr in sorted(drawing.attributes, key=lambda a: a.name):
+        # Dotted attributes are internal: selection, hidden state …
+        layout = _ATTRIBUTE_LAYOUT.get(attr.data_type)
+        if attr.name.startswith(".") or layout is None:
+            continue
+        key, width, dtype = layout
+        buf = np.empty(len(attr.data) * width, dtype=dtype)
+        attr.data.foreach_get(key, buf)
+        h.update(f"{attr.name}:{attr.domain}".encode())
+        h.update(buf.tobytes())
+
+
+def _modifier_state(mod):
+    """Settings of one modifier, minus display toggles and proxy inputs."""
+    state = [mod.name, mod.type]
+    for prop in mod.bl_rna.properties:
+        name = prop.identifier
+        if prop.is_readonly or name.startswith("show_") or name in {"rna_type", "is_active"}:
+            continue
+        state.append((name, _stable(getattr(mod, name, None))))
+    if mod.type == 'NODES' and mod.node_group is not None:
+        for item in mod.node_group.interface.items_tree:
+            if getattr(item, 'in_out', None) != 'INPUT' or item.name in _IGNORED_SOCKETS:
+                continue
+            if item.socket_type == 'NodeSocketGeometry':
+                continue
+            state.append((item.name, _stable(get_input(mod, item.identifier))))
+    return state
+
+
+def _is_frozen_modifier(mod):
+    return mod.type == 'NODES' and mod.node_group is not None \
+        and mod.node_group.name == NODE_GROUP_NAME
+
+
+def content_hash(obj):
+    """Hash of a GP object's strokes and modifier stack (hex string)."""
+    h = hashlib.blake2b(digest_size=16)
+    for layer in obj.data.layers:
+        h.update(layer.name.encode())
+        for frame in layer.frames:
+            h.update(frame.frame_number.to_bytes(4, "little", signed=True))
+            if frame.drawing is not None:
+                _hash_drawing(h, frame.drawing)
+    for mod in obj.modifiers:
+        if _is_frozen_modifier(mod):
+            continue
+        h.update(repr(_modifier_state(mod)).encode())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Freeze / unfreeze
+# ---------------------------------------------------------------------------
+
+
+def get_or_create_frozen_node_group():
+    """Get existing or build the node group that outputs the frozen mesh."""
+    ng = bpy.data.node_groups.get(NODE_GROUP_NAME)
+    if ng is not None:
+        return ng
+
+    ng = bpy.data.node_groups.new(name=NODE_GROUP_NAME, type='GeometryNodeTree')
+    ng.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+    ng.interface.new_socket(name="Frozen Mesh", in_out='INPUT', socket_type='NodeSocketObject')
+    ng.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = ng.nodes
+    group_in = nodes.new('NodeGroupInput'); group_in.location = (-400, 0)
+    info = nodes.new('GeometryNodeObjectInfo'); info.location = (-200, 0)
+    info.transform_space = 'ORIGINAL'
+    ng.links.new(group_in.outputs['Frozen Mesh'], info.inputs['Object'])
+    group_out = nodes.new('NodeGroupOutput'); group_out.location = (0, 0)
+    ng.links.new(info.outputs['Geometry'], group_out.inputs['Geometry'])
+    return ng
+
+
+def is_frozen(obj):
+    return HASH_PROP in obj
+
+
+def is_animated(obj, scene):
+    """True when the drawing shown changes within the scene frame range."""
+    return len(keyframe_numbers(obj, scene.frame_start, scene.frame_end)) > 1
+
+
+def _share_key(obj, digest):
+    """Content hash, plus the transform when the stack reads other objects."""
+    if not reads_other_objects(obj):
+        return digest
+    return digest + ":" + ",".join(f"{v:.6f}" for row in obj.matrix_world for v in row)
+
+
+def _shared_mesh(key):
+    """A frozen mesh already built for the same content, if any."""
+    for mesh in bpy.data.meshes:
+        if mesh.get(SHARE_PROP) == key and mesh.users > 0:
+            return mesh
+    return None
+
+
+def freeze_objects(objects, depsgraph):
+    """Freeze GP objects. Returns the objects that were frozen.
+
+    All objects are read from a single depsgraph evaluation at full detail;
+    objects that produce no geometry, or whose drawing changes within the
+    scene frame range, are left live.
+    """
+    scene = depsgraph.scene
+    objects = [
+        o for o in objects
+        if o.type == 'GREASEPENCIL' and not is_frozen(o) and o.modifiers and not is_animated(o, scene)
+    ]
+    if not objects:
+        return []
+
+    saved = force_full_detail(objects)
+    depsgraph.update()
+    buffers = read_instances_by_object(depsgraph, objects)
+    restore_detail(saved)
+
+    frozen = []
+    for obj in objects:
+        data = buffers.get(obj)
+        if data is None:
+            continue
+        digest = content_hash(obj)
+        key = _share_key(obj, digest)
+
+        mesh = _shared_mesh(key)
+        if mesh is None:
+            mesh = mesh_from_buffers(f"{obj.name}_Frozen", data)
+            for mat in obj.data.materials:
+                mesh.materials.append(mat)
+            mesh[SHARE_PROP] = key
+        holder = bpy.data.objects.new(f"{obj.name}_Frozen", mesh)
+
+        toggles = []
+        for mod in obj.modifiers:
+            toggles.append([mod.name, mod.show_viewport, mod.show_render])
+            mod.show_viewport = False
+            mod.show_render = False
+
+        mod = obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+        mod.node_group = get_or_create_frozen_node_group()
+        for item in mod.node_group.interface.items_tree:
+            if getattr(item, 'in_out', None) == 'INPUT' and item.name == 'Frozen Mesh':
+                set_input(mod, item.identifier, holder)
+
+        obj[HASH_PROP] = digest
+        obj[HOLDER_PROP] = holder
+        obj[MODIFIERS_PROP] = json.dumps(toggles)
+        frozen.append(obj)
+    return frozen
+
+
+def unfreeze_object(obj):
+    """Bring a frozen object back to its live modifier stack."""
+    if not is_frozen(obj):
+        return False
+
+    for mod in list(obj.modifiers):
+        if _is_frozen_modifier(mod):
+            obj.modifiers.remove(mod)
+
+    for name, show_viewport, show_render in json.loads(obj.get(MODIFIERS_PROP, "[]")):
+        mod = obj.modifiers.get(name)
+        if mod is not None:
+            mod.show_viewport = show_viewport
+            mod.show_render = show_render
+
+    holder = obj.get(HOLDER_PROP)
+    for prop in (HASH_PROP, HOLDER_PROP, MODIFIERS_PROP):
+        if prop in obj:
+            del obj[prop]
+    if isinstance(holder, bpy.types.Object):
+        mesh = holder.data
+        bpy.data.objects.remove(holder)
+        # Other objects with the same content may still share the mesh
+        if mesh is not None and mesh.users == 0:
+            track_replaced_meshes(mesh)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Automatic unfreeze
+# ---------------------------------------------------------------------------
+
+_stale = set()
+
+
+def _unfreeze_stale():
+    names = list(_stale)
+    _stale.clear()
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is not None and is_frozen(obj):
+            unfreeze_object(obj)
+    return None
+
+
+@bpy.app.handlers.persistent
+def unfreeze_on_change(scene, depsgraph):
+    """depsgraph_update_post: unfreeze objects whose content hash changed.
+
+    Only rehashes frozen objects with a geometry update. The unfreeze itself
+    runs from a timer, outside the depsgraph update.
+    """
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        obj = update.id.original
+        if not isinstance(obj, bpy.types.Object) or not is_frozen(obj):
+            continue
+        if obj.name in _stale or content_hash(obj) == obj[HASH_PROP]:
+            continue
+        _stale.add(obj.name)
+        if not bpy.app.timers.is_registered(_unfreeze_stale):
+            bpy.app.timers.register(_unfreeze_stale, first_interval=0.0)
@@ -0,0 +1,163 @@
+"""Evaluate-on-idle: hold back GreaseMesh modifiers while strokes are drawn.
+
+Every stroke drawn on a GP with Blocks, Path or Wall re-evaluates the whole
+graph, which makes the pen lag on heavy graphs. With "Evaluate on Idle" on,
+the first stroke change in Draw or Sculpt mode puts the active object's
+GreaseMesh modifiers on a cheap stand-in: either disabled in the viewport
+or at the lowest viewport resolution. Each further change pushes the idle
+deadline back; once nothing has changed for "Idle Delay" seconds a
+``bpy.app.timers`` callback restores full evaluation.
+
+Suspended state is only held in memory, and is restored before the file
+is saved so a suspended stack never ends up on disk.
+"""
+
+import time
+
+import bpy
+
+from .bake import greasemesh_modifiers
+from .freeze import is_frozen
+from .modifier_io import get_input, set_input
+from .viewport_proxy import FACTOR_SOCKET, NOISE_SOCKET
+
+_DRAW_MODES = {'PAINT_GREASE_PENCIL', 'SCULPT_GREASE_PENCIL'}
+
+# Stand-in values for 'PROXY': the socket minimum and no noise detail
+_PROXY_VALUES = {FACTOR_SOCKET: 0.05, NOISE_SOCKET: 0.0}
+
+# object name → [(modifier name, input identifier or None, previous value)];
+# a None identifier means show_viewport was turned off.
+_suspended = {}
+_pending = set()
+_last_activity = 0.0
+
+
+def _settings():
+    scene = bpy.context.scene
+    return getattr(scene, "greasemesh", None) if scene else None
+
+
+def is_suspended(obj):
+    """True while ``obj`` is being drawn on and its modifiers are held back."""
+    return obj.name in _suspended or obj.name in _pending
+
+
+def suspend_object(obj, mode):
+    """Put the GreaseMesh modifiers of ``obj`` on their cheap stand-in."""
+    if obj.name in _suspended:
+        return
+    saved = []
+    for mod in greasemesh_modifiers(obj):
+        if not mod.show_viewport:
+            continue
+        if mode == 'DISABLE':
+            saved.append((mod.name, None, True))
+            mod.show_viewport = False
+            continue
+        for item in mod.node_group.interface.items_tree:
+            if getattr(item, 'in_out', None) == 'INPUT' and item.name in _PROXY_VALUES:
+                saved.append((mod.name, item.identifier, get_input(mod, item.identifier)))
+                set_input(mod, item.identifier, _PROXY_VALUES[item.name])
+    obj.update_tag()
+    _suspended[obj.name] = saved
+
+
+def resume_all():
+    """Restore full evaluation on every suspended object."""
+    for name, saved in _suspended.items():
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            continue
+        for mod_name, identifier, value in saved:
+            mod = obj.modifiers.get(mod_name)
+            if mod is None:
+                continue
+            if identifier is None:
+                mod.show_viewport = value
+            elif value is not None:
+                set_input(mod, identifier, value)
+        obj.update_tag()
+    _suspended.clear()
+
+
+def _suspend_pending():
+    settings = _settings()
+    names = list(_pending)
+    _pending.clear()
+    if settings is None or not settings.idle_evaluation:
+        return None
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            suspend_object(obj, settings.idle_proxy)
+    return None
+
+
+def _resume_when_idle():
+    settings = _settings()
+    delay = settings.idle_delay if settings is not None else 0.0
+    remaining = _last_activity + delay - time.monotonic()
+    if remaining > 0.0:
+        return remaining
+    resume_all()
+    return None
+
+
+@bpy.app.handlers.persistent
+def track_drawing(scene, depsgraph):
+    """depsgraph_update_post: note stroke edits on the active GP in a draw mode."""
+    global _last_activity
+    settings = getattr(scene, "greasemesh", None)
+    if settings is None or not settings.idle_evaluation:
+        return
+    obj = depsgraph.view_layer.objects.active
+    if obj is None or obj.type != 'GREASEPENCIL' or obj.mode not in _DRAW_MODES:
+        return
+    if is_frozen(obj):
+        return
+    # Only stroke data counts: our own modifier toggles tag the object
+    if not any(update.id.original == obj.data for update in depsgraph.updates):
+        return
+
+    _last_activity = time.monotonic()
+    if obj.name not in _suspended and obj.name not in _pending:
+        _pending.add(obj.name)
+        if not bpy.app.timers.is_registered(_suspend_pending):
+            bpy.app.timers.register(_suspend_pending, first_interval=0.0)
+    if not bpy.app.timers.is_registered(_resume_when_idle):
+        bpy.app.timers.register(_resume_when_idle, first_interval=settings.idle_delay)
+
+
+@bpy.app.handlers.persistent
+def _resume_before_save(*_args):
+    resume_all()
+
+
+@bpy.app.handlers.persistent
+def _forget_on_load(*_args):
+    _suspended.clear()
+    _pending.clear()
+
+
+_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, track_drawing),
+    (bpy.app.handlers.save_pre, _resume_before_save),
+    (bpy.app.handlers.load_pre, _forget_on_load),
+)
+
+
+def register_handlers():
+    for handlers, func in _HANDLERS:
+        if func not in handlers:
+            handlers.append(func)
+
+
+def unregister_handlers():
+    resume_all()
+    for handlers, func in _HANDLERS:
+        if func in handlers:
+            handlers.remove(func)
+    for timer in (_suspend_pending, _resume_when_idle):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
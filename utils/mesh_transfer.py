@@ -0,0 +1,229 @@
+"""Bulk mesh transfer through NumPy buffers.
+
+Evaluated GN output is copied with ``foreach_get`` into flat arrays and
+written back with ``foreach_set`` — no per-vertex Python objects. Besides
+positions and topology (edges, loops, faces) every generic attribute on every
+domain is carried over, which covers UV maps, colour attributes,
+``material_index``, ``sharp_face`` (shading), edge creases and user data.
+
+Data is passed around as a plain dict of arrays (see ``read_mesh``), so
+several meshes can be joined by concatenation before writing.
+"""
+
+import bpy
+import numpy as np
+
+# data_type → (foreach property, components per element, numpy dtype)
+_ATTRIBUTE_LAYOUT = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int8),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+_DOMAIN_SIZE_KEY = {
+    'POINT': "vertex_count",
+    'EDGE': "edge_count",
+    'FACE': "face_count",
+    'CORNER': "loop_count",
+}
+
+
+def _domain_size(mesh, domain):
+    if domain == 'POINT':
+        return len(mesh.vertices)
+    if domain == 'EDGE':
+        return len(mesh.edges)
+    if domain == 'FACE':
+        return len(mesh.polygons)
+    if domain == 'CORNER':
+        return len(mesh.loops)
+    return None
+
+
+def read_mesh(mesh, matrix=None):
+    """Read a mesh into NumPy buffers.
+
+    Positions are transformed by ``matrix`` (a 4x4 mathutils.Matrix) when
+    given. Internal attributes (names starting with '.') and ``position`` are
+    skipped — topology is read explicitly.
+    """
+    nv, ne, nl, nf = len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)
+
+    co = np.empty(nv * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    if matrix is not None:
+        m = np.array(matrix, dtype=np.float64)
+        co = (co @ m[:3, :3].T + m[:3, 3]).astype(np.float32)
+
+    edges = np.empty(ne * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    loop_verts = np.empty(nl, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(nl, dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    loop_start = np.empty(nf, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+
+    attributes = {}
+    for attr in mesh.attributes:
+        name = attr.name
+        if name.startswith(".") or name == "position":
+            continue
+        layout = _ATTRIBUTE_LAYOUT.get(attr.data_type)
+        size = _domain_size(mesh, attr.domain)
+        if layout is None or size is None:
+            continue
+        key, width, dtype = layout
+        buf = np.empty(size * width, dtype=dtype)
+        attr.data.foreach_get(key, buf)
+        attributes[name] = (attr.data_type, attr.domain, buf.reshape(size, width))
+
+    return {
+        "vertex_count": nv,
+        "edge_count": ne,
+        "loop_count": nl,
+        "face_count": nf,
+        "co": co,
+        "edges": edges.reshape(-1, 2),
+        "loop_verts": loop_verts,
+        "loop_edges": loop_edges,
+        "loop_start": loop_start,
+        "attributes": attributes,
+    }
+
+
+def join_mesh_data(parts):
+    """Concatenate several ``read_mesh`` results into one, offsetting indices.
+
+    Attributes missing from some parts are zero-filled for those parts.
+    Returns None for an empty list.
+    """
+    parts = [p for p in parts if p["vertex_count"] > 0]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0]
+
+    v_off = np.cumsum([0] + [p["vertex_count"] for p in parts[:-1]])
+    e_off = np.cumsum([0] + [p["edge_count"] for p in parts[:-1]])
+    l_off = np.cumsum([0] + [p["loop_count"] for p in parts[:-1]])
+
+    specs = {}
+    for p in parts:
+        for name, (data_type, domain, _) in p["attributes"].items():
+            specs.setdefault(name, (data_type, domain))
+
+    attributes = {}
+    for name, (data_type, domain) in specs.items():
+        _, width, dtype = _ATTRIBUTE_LAYOUT[data_type]
+        chunks = []
+        for p in parts:
+            entry = p["attributes"].get(name)
+            if entry is not None and entry[0] == data_type and entry[1] == domain:
+                chunks.append(entry[2])
+            else:
+                chunks.append(np.zeros((p[_DOMAIN_SIZE_KEY[domain]], width), dtype=dtype))
+        attributes[name] = (data_type, domain, np.concatenate(chunks))
+
+    return {
+        "vertex_count": sum(p["vertex_count"] for p in parts),
+        "edge_count": sum(p["edge_count"] for p in parts),
+        "loop_count": sum(p["loop_count"] for p in parts),
+        "face_count": sum(p["face_count"] for p in parts),
+        "co": np.concatenate([p["co"] for p in parts]),
+        "edges": np.concatenate([p["edges"] + o for p, o in zip(parts, v_off)]),
+        "loop_verts": np.concatenate([p["loop_verts"] + o for p, o in zip(parts, v_off)]),
+        "loop_edges": np.concatenate([p["loop_edges"] + o for p, o in zip(parts, e_off)]),
+        "loop_start": np.concatenate([p["loop_start"] + o for p, o in zip(parts, l_off)]),
+        "attributes": attributes,
+    }
+
+
+def write_mesh(mesh, data):
+    """Fill an empty mesh from ``read_mesh``/``join_mesh_data`` buffers."""
+    mesh.vertices.add(data["vertex_count"])
+    mesh.vertices.foreach_set("co", data["co"].ravel())
+    mesh.edges.add(data["edge_count"])
+    mesh.edges.foreach_set("vertices", data["edges"].ravel())
+    mesh.loops.add(data["loop_count"])
+    mesh.loops.foreach_set("vertex_index", data["loop_verts"])
+    mesh.loops.foreach_set("edge_index", data["loop_edges"])
+    mesh.polygons.add(data["face_count"])
+    mesh.polygons.foreach_set("loop_start", data["loop_start"])
+
+    for name, (data_type, domain, buf) in data["attributes"].items():
+        attr = mesh.attributes.get(name)
+        if attr is not None and (attr.data_type != data_type or attr.domain != domain):
+            continue
+        if attr is None:
+            attr = mesh.attributes.new(name=name, type=data_type, domain=domain)
+        key = _ATTRIBUTE_LAYOUT[data_type][0]
+        attr.data.foreach_set(key, buf.ravel())
+
+    mesh.update()
+    return mesh
+
+
+def read_instances_by_object(depsgraph, objects):
+    """Read and join the evaluated instances of several objects in one scan.
+
+    GN modifiers on GP objects emit their meshes as instances. A single pass
+    over ``depsgraph.object_instances`` collects every instance whose
+    original, or whose instancer for instanced objects (Stamp Scatter's
+    collection assets), is in ``objects``; each is transformed into its
+    source object's local space and joined per object.
+    Returns {object: buffers} for objects that produced geometry.
+    """
+    to_local = {obj: obj.matrix_world.inverted() for obj in objects}
+
+    parts = {}
+    for inst in depsgraph.object_instances:
+        if not inst.is_instance:
+            continue
+        source = inst.object.original
+        if source not in to_local:
+            source = inst.parent.original if inst.parent is not None else None
+            if source not in to_local:
+                continue
+        eval_obj = inst.object
+        try:
+            mesh = eval_obj.to_mesh()
+        except RuntimeError:
+            # Instanced objects without geometry (empties, lights)
+            continue
+        if mesh is not None and len(mesh.vertices) > 0:
+            parts.setdefault(source, []).append(
+                read_mesh(mesh, to_local[source] @ inst.matrix_world)
+            )
+        eval_obj.to_mesh_clear()
+
+    joined = {}
+    for obj, obj_parts in parts.items():
+        data = join_mesh_data(obj_parts)
+        if data is not None:
+            joined[obj] = data
+    return joined
+
+
+def read_object_instances(depsgraph, obj):
+    """Read and join every evaluated instance generated by ``obj``.
+
+    Returns the joined buffers in the object's local space, or None if no
+    instance produced geometry.
+    """
+    return read_instances_by_object(depsgraph, [obj]).get(obj)
+
+
+def mesh_from_buffers(name, data):
+    """Create a new mesh datablock from buffers."""
+    mesh = bpy.data.meshes.new(name=name)
+    return write_mesh(mesh, data)
@@ -36,3 +36,109 @@ def set_menu(mod, identifier, enum_value, legacy_value=None, legacy_menu=None):
             mod[identifier] = legacy_value
         if legacy_menu is not None:
             mod[identifier + "_menu"] = legacy_menu
+
+
+def get_input(mod, identifier, default=None):
+    """Read a Geometry Nodes modifier input by socket identifier."""
+    inputs = _inputs(mod)
+    if inputs is not None:
+        socket = getattr(inputs, identifier, None)             # Blender 5.x
+        return default if socket is None else socket.value
+    return mod.get(identifier, default)                     # Blender <= 4.x
+
+
+def _hashable(value):
+    if hasattr(value, "as_pointer"):                        # ID / struct refs
+        return ("ptr", value.as_pointer())
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return value
+    try:
+        return tuple(_hashable(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+
+def reads_other_objects(obj):
+    """True when a GN modifier of ``obj`` has a visible Object input set.
+
+    Such graphs read another object (Object Info, relative), so their local
+    result also depends on where ``obj`` is. Hidden object inputs (basis
+    table, regions) are built from the object's own data and don't count.
+    """
+    for mod in obj.modifiers:
+        if mod.type != 'NODES' or mod.node_group is None:
+            continue
+        for item in mod.node_group.interface.items_tree:
+            if getattr(item, 'in_out', None) != 'INPUT' or item.socket_type != 'NodeSocketObject':
+                continue
+            if not item.hide_in_modifier and get_input(mod, item.identifier) is not None:
+                return True
+    return False
+
+
+def modifier_signature(obj):
+    """Hashable summary of an object's modifier stack and GN input values.
+
+    Two objects with the same signature and the same data evaluate to the
+    same geometry (in local space). Returns None when the stack contains
+    anything other than Geometry Nodes modifiers, since their inputs can't be
+    compared generically. Hidden object inputs are left out; a stack that
+    reads other objects includes the object's world matrix (see
+    ``reads_other_objects``).
+    """
+    sig = []
+    for mod in obj.modifiers:
+        if mod.type != 'NODES':
+            return None
+        ng = mod.node_group
+        entry = [mod.name, mod.show_viewport, mod.show_render, _hashable(ng)]
+        if ng is not None:
+            for item in ng.interface.items_tree:
+                if getattr(item, 'in_out', None) != 'INPUT':
+                    continue
+                if item.socket_type == 'NodeSocketGeometry':
+                    continue
+                if item.socket_type == 'NodeSocketObject' and item.hide_in_modifier:
+                    continue
+                entry.append((item.identifier, _hashable(get_input(mod, item.identifier))))
+        sig.append(tuple(entry))
+    if reads_other_objects(obj):
+        sig.append(tuple(v for row in obj.matrix_world for v in row))
+    return tuple(sig)
+
+
+def get_inputs(mod, defaults):
+    """Read inputs by panel name: {name: value} for every name in
+    ``defaults``, falling back to the default where the node group has no
+    such input."""
+    identifiers = {
+        item.name: item.identifier for item in mod.node_group.interface.items_tree
+        if getattr(item, 'in_out', None) == 'INPUT'
+    }
+    return {
+        name: get_input(mod, identifiers[name], default) if name in identifiers else default
+        for name, default in defaults.items()
+    }
+
+
+def _key(name):
+    return name.strip().lower().replace(" ", "_")
+
+
+def set_inputs(mod, values):
+    """Set modifier inputs by panel name ("Corner Radius") or keyword form
+    ("corner_radius"). Menu inputs take the item name. Unknown names raise
+    KeyError listing the inputs the node group has."""
+    sockets = {
+        _key(item.name): item for item in mod.node_group.interface.items_tree
+        if getattr(item, 'in_out', None) == 'INPUT' and item.socket_type != 'NodeSocketGeometry'
+    }
+    for name, value in values.items():
+        item = sockets.get(_key(name))
+        if item is None:
+            available = ", ".join(i.name for i in sockets.values())
+            raise KeyError(f"'{mod.node_group.name}' has no input '{name}' (inputs: {available})")
+        if item.socket_type == 'NodeSocketMenu':
+            set_menu(mod, item.identifier, value)
+        else:
+            set_input(mod, item.identifier, tuple(value) if isinstance(value, list) else value)
@@ -0,0 +1,116 @@
+"""Keeping saved GreaseMesh node groups up to date.
+
+Node groups are built in Python but saved with the .blend file, so a file
+from an older version keeps the older graph: its modifiers lack newer inputs
+(name-based ``set_inputs`` raises KeyError) and newer nodes. Each builder
+stamps its group with a version; a group with an older stamp is rebuilt in
+place, and the values its modifiers had are carried over by input name.
+Groups in a loaded file are brought up to date from a load_post handler,
+and those in the open file once the add-on is enabled.
+"""
+
+import bpy
+
+from .modifier_io import get_input, set_input
+
+VERSION_PROP = "greasemesh_version"
+
+# Node group name → (version, get_or_create)
+NODE_GROUPS = {}
+
+
+def is_current(ng, version):
+    """True when ``ng`` was built by a builder at least at ``version``."""
+    return ng.get(VERSION_PROP, 0) >= version
+
+
+def _users(ng):
+    return [
+        mod for obj in bpy.data.objects for mod in obj.modifiers
+        if mod.type == 'NODES' and mod.node_group == ng
+    ]
+
+
+def _input_items(ng):
+    return [
+        item for item in ng.interface.items_tree
+        if getattr(item, 'in_out', None) == 'INPUT' and item.socket_type != 'NodeSocketGeometry'
+    ]
+
+
+def reset_node_group(name):
+    """Empty node group ``name`` for a rebuild, or create it.
+
+    Returns (node group, saved) where ``saved`` holds the input values of
+    the modifiers using it, for ``finish_node_group``.
+    """
+    ng = bpy.data.node_groups.get(name)
+    if ng is None:
+        return bpy.data.node_groups.new(name=name, type='GeometryNodeTree'), []
+
+    saved = []
+    for mod in _users(ng):
+        values = {}
+        for item in _input_items(ng):
+            value = get_input(mod, item.identifier)
+            if value is not None:
+                values[(item.name, item.socket_type)] = value
+        saved.append((mod, values))
+
+    ng.nodes.clear()
+    for item in list(ng.interface.items_tree):
+        ng.interface.remove(item)
+    return ng, saved
+
+
+def finish_node_group(ng, version, saved):
+    """Stamp a rebuilt group with ``version`` and restore the saved inputs.
+
+    Inputs that no longer exist, or changed type, keep their new default.
+    """
+    ng[VERSION_PROP] = version
+    items = {(item.name, item.socket_type): item.identifier for item in _input_items(ng)}
+    for mod, values in saved:
+        mod.node_group = ng     # refresh the modifier's inputs for the new interface
+        for key, value in values.items():
+            if key in items:
+                try:
+                    set_input(mod, items[key], value)
+                except (TypeError, ValueError):
+                    pass
+    return ng
+
+
+@bpy.app.handlers.persistent
+def update_node_groups(*_args):
+    """load_post: rebuild registered groups saved by an older version.
+
+    Also runs once from a timer after registration, for the open file.
+    """
+    for name, (version, get_or_create) in NODE_GROUPS.items():
+        ng = bpy.data.node_groups.get(name)
+        if ng is not None and not is_current(ng, version):
+            get_or_create()
+
+
+def register_node_group(name, version, get_or_create):
+    """Keep node group ``name`` at ``version`` in files loaded from now on.
+
+    ``get_or_create`` must rebuild a group that isn't current.
+    """
+    NODE_GROUPS[name] = (version, get_or_create)
+    if update_node_groups not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(update_node_groups)
+    # bpy.data is restricted while add-ons register
+    if not bpy.app.timers.is_registered(update_node_groups):
+        bpy.app.timers.register(update_node_groups, first_interval=0.0)
+
+
+def unregister_node_group(name):
+    NODE_GROUPS.pop(name, None)
+    if NODE_GROUPS:
+        return
+    if update_node_groups in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(update_node_groups)
+    if bpy.app.timers.is_registered(update_node_groups):
+        bpy.app.timers.unregister(update_node_groups)
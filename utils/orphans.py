@@ -0,0 +1,167 @@
+"""Registry for meshes left behind by Apply All Modifiers and Bool Cut.
+
+Both operators swap ``obj.data`` and keep the old mesh so the operator itself
+never deletes data mid-undo-step. Left alone, each of those meshes stays in
+RAM until the file is saved and reloaded. Every replaced mesh is tagged with
+the GreaseMesh operation "generation" it was orphaned in; purging removes
+tagged meshes that still have no users.
+
+Purges run from a ``bpy.app.timers`` callback (or the manual purge operator),
+never inside the operator that orphaned the mesh. Undo stays correct because
+every earlier undo step still holds the mesh and restores it on undo.
+
+The count and size shown in the panel are cached: scanning every mesh on each
+redraw is too slow in large files. Tracking, purging, undo and file loads
+drop the cache.
+"""
+
+import bpy
+
+from .mesh_transfer import _ATTRIBUTE_LAYOUT
+
+ORPHAN_PROP = "greasemesh_orphan_generation"
+
+# Generation counter lives on the window manager: it survives undo (the WM is
+# not part of undo steps) but not a file reload, when orphans are gone anyway.
+_GENERATION_PROP = "greasemesh_orphan_counter"
+
+# (count, total_bytes) from the last orphan_stats scan, None when outdated
+_stats = None
+
+
+def _current_generation():
+    wm = bpy.context.window_manager
+    return int(wm.get(_GENERATION_PROP, 0))
+
+
+def _next_generation():
+    wm = bpy.context.window_manager
+    gen = int(wm.get(_GENERATION_PROP, 0)) + 1
+    wm[_GENERATION_PROP] = gen
+    return gen
+
+
+def estimate_mesh_bytes(mesh):
+    """Rough in-memory size of a mesh: positions, topology and attributes."""
+    nv, ne, nl, nf = len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons)
+    total = nv * 12 + ne * 8 + nl * 8 + nf * 4
+    sizes = {'POINT': nv, 'EDGE': ne, 'FACE': nf, 'CORNER': nl}
+    for attr in mesh.attributes:
+        if attr.name.startswith(".") or attr.name == "position":
+            continue
+        layout = _ATTRIBUTE_LAYOUT.get(attr.data_type)
+        if layout is None:
+            continue
+        _, width, dtype = layout
+        item = 1 if dtype is bool else dtype().itemsize
+        total += sizes.get(attr.domain, 0) * width * item
+    return total
+
+
+def track_replaced_meshes(*meshes):
+    """Tag meshes that an operator just detached and schedule an auto purge.
+
+    All meshes passed in one call share one generation (one operation).
+    """
+    meshes = [m for m in meshes if m is not None]
+    if not meshes:
+        return
+    gen = _next_generation()
+    for mesh in meshes:
+        mesh[ORPHAN_PROP] = gen
+    forget_stats()
+    schedule_auto_purge()
+
+
+def tracked_orphans():
+    """Tagged meshes that currently have no users, oldest first."""
+    orphans = [
+        m for m in bpy.data.meshes
+        if m.users == 0 and not m.use_fake_user and ORPHAN_PROP in m
+    ]
+    orphans.sort(key=lambda m: m[ORPHAN_PROP])
+    return orphans
+
+
+def orphan_stats():
+    """Return (count, total_bytes) of tracked orphan meshes (cached)."""
+    global _stats
+    if _stats is None:
+        orphans = tracked_orphans()
+        _stats = len(orphans), sum(estimate_mesh_bytes(m) for m in orphans)
+    return _stats
+
+
+@bpy.app.handlers.persistent
+def forget_stats(*_args):
+    """Drop the cached orphan_stats; the next call scans again."""
+    global _stats
+    _stats = None
+
+
+def purge_orphans(keep_steps=0, memory_limit=0):
+    """Remove tracked orphans.
+
+    Meshes from the last ``keep_steps`` generations are kept, unless the
+    kept set still exceeds ``memory_limit`` bytes (0 = unlimited), in which
+    case the oldest of them go too. Returns (removed_count, freed_bytes).
+    """
+    orphans = tracked_orphans()
+    if not orphans:
+        return 0, 0
+    forget_stats()
+
+    cutoff = _current_generation() - keep_steps
+    sized = [(m, estimate_mesh_bytes(m)) for m in orphans]
+    doomed = [(m, size) for m, size in sized if m[ORPHAN_PROP] <= cutoff]
+    kept = [(m, size) for m, size in sized if m[ORPHAN_PROP] > cutoff]
+
+    if memory_limit > 0:
+        kept_bytes = sum(size for _, size in kept)
+        while kept and kept_bytes > memory_limit:
+            mesh, size = kept.pop(0)
+            doomed.append((mesh, size))
+            kept_bytes -= size
+
+    freed = 0
+    for mesh, size in doomed:
+        bpy.data.meshes.remove(mesh)
+        freed += size
+    return len(doomed), freed
+
+
+def _auto_purge():
+    scene = bpy.context.scene
+    settings = getattr(scene, "greasemesh", None) if scene else None
+    if settings is None or not settings.orphan_auto_purge:
+        return None
+    purge_orphans(
+        keep_steps=settings.orphan_keep_steps,
+        memory_limit=settings.orphan_memory_limit * 1024 * 1024,
+    )
+    return None
+
+
+def schedule_auto_purge():
+    """Run the auto purge once, after the current operator has finished."""
+    if not bpy.app.timers.is_registered(_auto_purge):
+        bpy.app.timers.register(_auto_purge, first_interval=0.1)
+
+
+_HANDLERS = (
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+    bpy.app.handlers.load_post,
+)
+
+
+def register_handlers():
+    for handlers in _HANDLERS:
+        if forget_stats not in handlers:
+            handlers.append(forget_stats)
+
+
+def unregister_handlers():
+    for handlers in _HANDLERS:
+        if forget_stats in handlers:
+            handlers.remove(forget_stats)
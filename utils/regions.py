@@ -0,0 +1,196 @@
+"""Python-built geometry for Geometry Nodes modifiers, kept live.
+
+Some results can't be computed in a node graph: Solid's planar arrangement
+of overlapping and nested strokes, or Wall's junction-aware footprint.
+These are built in Python by a builder registered for the node group, and
+stored in a small "regions" mesh in the object's local space. The graph
+reads it through Object Info in place of its own result, the way it reads
+the basis table, and falls back to the graph when it is empty.
+
+Regions are built at the modifier's viewport proxy factor, like the graph
+they stand in for; Apply, Freeze and Bake lift the factor and get them at
+full detail. Along with the mesh the object's content hash (see ``freeze``)
+and the factor are stored. A depsgraph handler rehashes objects with
+regions whose geometry was tagged and rebuilds the mesh from a timer when
+the strokes, inputs or factor changed. While Evaluate on Idle holds an
+object back it isn't rebuilt; resuming tags it, which rebuilds it once.
+Animated drawings keep the graph's result: each frame would need its own
+regions.
+"""
+
+import bpy
+
+from .frame_basis import keyframe_numbers
+from .freeze import content_hash, is_frozen
+from .idle_eval import is_suspended
+from .mesh_transfer import write_mesh
+from .modifier_io import get_input, set_input
+from .viewport_proxy import FACTOR_SOCKET
+
+REGIONS_SOCKET = "Regions"
+HASH_PROP = "greasemesh_regions_hash"
+
+# Node group name → build(mod, gp_obj, frame) returning mesh buffers or None
+BUILDERS = {}
+
+
+def add_regions_socket(iface):
+    """Add the hidden regions input to a node group interface."""
+    s = iface.new_socket(name=REGIONS_SOCKET, in_out='INPUT', socket_type='NodeSocketObject')
+    s.hide_in_modifier = True
+
+
+def regions_or(ng, group_in, geometry, x=0, y=0):
+    """The regions mesh when one is connected and has faces, else ``geometry``."""
+    nodes = ng.nodes
+    link = ng.links.new
+
+    info = nodes.new('GeometryNodeObjectInfo'); info.location = (x, y + 300)
+    info.transform_space = 'ORIGINAL'
+    link(group_in.outputs[REGIONS_SOCKET], info.inputs['Object'])
+
+    size = nodes.new('GeometryNodeAttributeDomainSize'); size.location = (x + 200, y + 500)
+    size.component = 'MESH'
+    link(info.outputs['Geometry'], size.inputs['Geometry'])
+    has_regions = nodes.new('FunctionNodeCompare'); has_regions.location = (x + 400, y + 500)
+    has_regions.data_type = 'INT'
+    has_regions.operation = 'GREATER_THAN'
+    link(size.outputs['Face Count'], has_regions.inputs['A'])
+
+    switch = nodes.new('GeometryNodeSwitch'); switch.location = (x + 600, y)
+    switch.input_type = 'GEOMETRY'
+    link(has_regions.outputs['Result'], switch.inputs['Switch'])
+    link(geometry, switch.inputs['False'])
+    link(info.outputs['Geometry'], switch.inputs['True'])
+    return switch.outputs['Output']
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+
+def _identifiers(mod):
+    return {
+        item.name: item.identifier for item in mod.node_group.interface.items_tree
+        if getattr(item, 'in_out', None) == 'INPUT'
+    }
+
+
+def _regions_key(gp_obj):
+    """Content hash plus the proxy factor of every modifier with regions."""
+    factors = []
+    for mod in _regions_modifiers(gp_obj):
+        identifier = _identifiers(mod).get(FACTOR_SOCKET)
+        factors.append(get_input(mod, identifier, 1.0) if identifier else 1.0)
+    return f"{content_hash(gp_obj)}:{factors}"
+
+
+def update_regions(mod, gp_obj, scene):
+    """Build and connect the regions mesh of ``mod``, or disconnect it.
+
+    Regions are built from the drawing at the current frame when the drawing
+    doesn't change within the scene range. Returns True when connected.
+    """
+    build = BUILDERS.get(mod.node_group.name)
+    identifier = _identifiers(mod).get(REGIONS_SOCKET)
+    if build is None or identifier is None:
+        return False
+
+    current = get_input(mod, identifier)
+    current = current if isinstance(current, bpy.types.Object) else None
+
+    data = None
+    if len(keyframe_numbers(gp_obj, scene.frame_start, scene.frame_end)) < 2:
+        data = build(mod, gp_obj, scene.frame_current)
+
+    if data is None:
+        set_input(mod, identifier, None)
+        if current is not None and current.users == 0:
+            bpy.data.objects.remove(current)
+    else:
+        mesh = write_mesh(bpy.data.meshes.new(f"{gp_obj.name}_Regions"), data)
+        if current is None:
+            current = bpy.data.objects.new(f"{gp_obj.name}_Regions", mesh)
+        else:
+            old = current.data
+            current.data = mesh
+            if old is not None and old.users == 0:
+                bpy.data.meshes.remove(old)
+        set_input(mod, identifier, current)
+
+    gp_obj[HASH_PROP] = _regions_key(gp_obj)
+    gp_obj.update_tag()
+    return data is not None
+
+
+# ---------------------------------------------------------------------------
+# Automatic refresh
+# ---------------------------------------------------------------------------
+
+_stale = set()
+
+
+def _regions_modifiers(obj):
+    return [
+        mod for mod in obj.modifiers
+        if mod.type == 'NODES' and mod.node_group is not None
+        and mod.node_group.name in BUILDERS and REGIONS_SOCKET in _identifiers(mod)
+    ]
+
+
+def refresh_regions(objects):
+    """Rebuild now the regions of ``objects`` that are out of date."""
+    scene = bpy.context.scene
+    for obj in objects:
+        if obj.type != 'GREASEPENCIL' or HASH_PROP not in obj or is_frozen(obj):
+            continue
+        if _regions_key(obj) == obj[HASH_PROP]:
+            continue
+        for mod in _regions_modifiers(obj):
+            update_regions(mod, obj, scene)
+
+
+def _refresh_stale():
+    names = list(_stale)
+    _stale.clear()
+    objects = [bpy.data.objects.get(name) for name in names]
+    refresh_regions([obj for obj in objects if obj is not None and not is_suspended(obj)])
+    return None
+
+
+@bpy.app.handlers.persistent
+def refresh_regions_on_change(scene, depsgraph):
+    """depsgraph_update_post: rebuild regions whose object's hash changed.
+
+    Only rehashes objects that have regions and a geometry update, and not
+    while Evaluate on Idle holds them back. The rebuild runs from a timer,
+    outside the depsgraph update.
+    """
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        obj = update.id.original
+        if not isinstance(obj, bpy.types.Object) or HASH_PROP not in obj:
+            continue
+        if obj.name in _stale or is_frozen(obj) or is_suspended(obj):
+            continue
+        if _regions_key(obj) == obj[HASH_PROP]:
+            continue
+        _stale.add(obj.name)
+        if not bpy.app.timers.is_registered(_refresh_stale):
+            bpy.app.timers.register(_refresh_stale, first_interval=0.0)
+
+
+def register_builder(node_group_name, build):
+    """Build regions for modifiers using ``node_group_name`` and keep them
+    up to date."""
+    BUILDERS[node_group_name] = build
+    if refresh_regions_on_change not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(refresh_regions_on_change)
+
+
+def unregister_builder(node_group_name):
+    BUILDERS.pop(node_group_name, None)
+    if not BUILDERS and refresh_regions_on_change in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(refresh_regions_on_change)
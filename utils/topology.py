@@ -0,0 +1,155 @@
+"""Optional output topology stage shared by the GreaseMesh node groups.
+
+With "Optimize Topology" on:
+  - outlines drop curve points whose turning angle is below "Straight Angle"
+    before they are filled or swept, so straight runs keep only their ends
+    and the side walls extruded from them come out as single quads;
+  - Fill Curve caps are n-gons instead of triangle fans.
+"Triangulate" turns the final mesh into triangles for real-time engines.
+
+Points are judged against their immediate neighbours, all at once, so a
+very gentle arc whose every step turns less than Straight Angle is
+flattened too — keep the angle small.
+"""
+
+import math
+
+OPTIMIZE_SOCKET = "Optimize Topology"
+STRAIGHT_SOCKET = "Straight Angle"
+TRIANGULATE_SOCKET = "Triangulate"
+
+TOPOLOGY_SOCKETS = (OPTIMIZE_SOCKET, STRAIGHT_SOCKET, TRIANGULATE_SOCKET)
+
+
+def add_topology_sockets(iface):
+    """Add the topology stage inputs to a node group interface."""
+    s = iface.new_socket(name=OPTIMIZE_SOCKET, in_out='INPUT', socket_type='NodeSocketBool')
+    s.default_value = False
+
+    s = iface.new_socket(name=STRAIGHT_SOCKET, in_out='INPUT', socket_type='NodeSocketFloat')
+    s.default_value, s.min_value, s.max_value = math.radians(0.25), 0.0, math.radians(10.0)
+    s.subtype = 'ANGLE'
+
+    s = iface.new_socket(name=TRIANGULATE_SOCKET, in_out='INPUT', socket_type='NodeSocketBool')
+    s.default_value = False
+
+
+def link_topology_inputs(ng, group_in, group_node):
+    """Pass the topology inputs through to a nested node group."""
+    for name in TOPOLOGY_SOCKETS:
+        ng.links.new(group_in.outputs[name], group_node.inputs[name])
+
+
+def _neighbour_position(ng, offset, x, y):
+    """(position of the point ``offset`` steps along the curve, is valid)."""
+    nodes = ng.nodes
+    off = nodes.new('GeometryNodeOffsetPointInCurve'); off.location = (x, y)
+    off.inputs['Offset'].default_value = offset
+    pos = nodes.new('GeometryNodeInputPosition'); pos.location = (x, y - 150)
+    at = nodes.new('GeometryNodeFieldAtIndex'); at.location = (x + 200, y)
+    at.data_type = 'FLOAT_VECTOR'
+    at.domain = 'POINT'
+    ng.links.new(off.outputs['Point Index'], at.inputs['Index'])
+    ng.links.new(pos.outputs['Position'], at.inputs['Value'])
+    return at.outputs['Value'], off.outputs['Is Valid Offset']
+
+
+def _direction(ng, a, b, x, y):
+    """normalize(b − a)."""
+    sub = ng.nodes.new('ShaderNodeVectorMath'); sub.location = (x, y)
+    sub.operation = 'SUBTRACT'
+    ng.links.new(b, sub.inputs[0])
+    ng.links.new(a, sub.inputs[1])
+    norm = ng.nodes.new('ShaderNodeVectorMath'); norm.location = (x + 200, y)
+    norm.operation = 'NORMALIZE'
+    ng.links.new(sub.outputs['Vector'], norm.inputs[0])
+    return norm.outputs['Vector']
+
+
+def _and(ng, a, b, x, y):
+    n = ng.nodes.new('FunctionNodeBooleanMath'); n.location = (x, y)
+    n.operation = 'AND'
+    ng.links.new(a, n.inputs[0])
+    ng.links.new(b, n.inputs[1])
+    return n.outputs['Boolean']
+
+
+def dissolve_straight_points(ng, group_in, curve, x=0, y=-600):
+    """Remove curve points on straight runs when Optimize Topology is on.
+
+    Open curve ends are always kept. Returns the curve output socket.
+    """
+    nodes = ng.nodes
+    link = ng.links.new
+
+    prev_pos, prev_ok = _neighbour_position(ng, -1, x, y)
+    next_pos, next_ok = _neighbour_position(ng, 1, x, y - 300)
+    here = nodes.new('GeometryNodeInputPosition'); here.location = (x + 200, y - 150)
+
+    d_in = _direction(ng, prev_pos, here.outputs['Position'], x + 400, y)
+    d_out = _direction(ng, here.outputs['Position'], next_pos, x + 400, y - 300)
+    dot = nodes.new('ShaderNodeVectorMath'); dot.location = (x + 800, y - 150)
+    dot.operation = 'DOT_PRODUCT'
+    link(d_in, dot.inputs[0])
+    link(d_out, dot.inputs[1])
+
+    cos_limit = nodes.new('ShaderNodeMath'); cos_limit.location = (x + 800, y - 350)
+    cos_limit.operation = 'COSINE'
+    link(group_in.outputs[STRAIGHT_SOCKET], cos_limit.inputs[0])
+
+    straight = nodes.new('FunctionNodeCompare'); straight.location = (x + 1000, y - 150)
+    straight.data_type = 'FLOAT'
+    straight.operation = 'GREATER_THAN'
+    link(dot.outputs['Value'], straight.inputs['A'])
+    link(cos_limit.outputs['Value'], straight.inputs['B'])
+
+    inner = _and(ng, prev_ok, next_ok, x + 1000, y - 350)
+    select = _and(ng, straight.outputs['Result'], inner, x + 1200, y - 250)
+    select = _and(ng, select, group_in.outputs[OPTIMIZE_SOCKET], x + 1400, y - 250)
+
+    delete = nodes.new('GeometryNodeDeleteGeometry'); delete.location = (x + 1600, y)
+    delete.domain = 'POINT'
+    link(curve, delete.inputs['Geometry'])
+    link(select, delete.inputs['Selection'])
+    return delete.outputs['Geometry']
+
+
+def _set_fill_mode(fill, mode):
+    if hasattr(fill, "mode"):
+        fill.mode = mode                                      # Blender <= 4.x
+    else:
+        fill.inputs['Mode'].default_value = 'N-gons' if mode == 'NGONS' else 'Triangles'
+
+
+def optimized_fill(ng, group_in, curve, x=0, y=0):
+    """Fill Curve that emits n-gon caps when Optimize Topology is on.
+
+    Returns the mesh output socket; only the chosen branch is evaluated.
+    """
+    nodes = ng.nodes
+    tris = nodes.new('GeometryNodeFillCurve'); tris.location = (x, y)
+    ngons = nodes.new('GeometryNodeFillCurve'); ngons.location = (x, y - 150)
+    _set_fill_mode(ngons, 'NGONS')
+    ng.links.new(curve, tris.inputs['Curve'])
+    ng.links.new(curve, ngons.inputs['Curve'])
+
+    switch = nodes.new('GeometryNodeSwitch'); switch.location = (x + 200, y)
+    switch.input_type = 'GEOMETRY'
+    ng.links.new(group_in.outputs[OPTIMIZE_SOCKET], switch.inputs['Switch'])
+    ng.links.new(tris.outputs['Mesh'], switch.inputs['False'])
+    ng.links.new(ngons.outputs['Mesh'], switch.inputs['True'])
+    return switch.outputs['Output']
+
+
+def triangulate_output(ng, group_in, geometry, x=0, y=0):
+    """Triangulate the final mesh when Triangulate is on."""
+    nodes = ng.nodes
+    tri = nodes.new('GeometryNodeTriangulate'); tri.location = (x, y - 150)
+    ng.links.new(geometry, tri.inputs['Mesh'])
+
+    switch = nodes.new('GeometryNodeSwitch'); switch.location = (x + 200, y)
+    switch.input_type = 'GEOMETRY'
+    ng.links.new(group_in.outputs[TRIANGULATE_SOCKET], switch.inputs['Switch'])
+    ng.links.new(geometry, switch.inputs['False'])
+    ng.links.new(tri.outputs['Mesh'], switch.inputs['True'])
+    return switch.outputs['Output']
@@ -0,0 +1,140 @@
+"""Viewport proxy detail for GreaseMesh node groups.
+
+Every node group exposes "Viewport Resolution Factor" (and "Viewport Noise"
+where it has noise). Resolution-like inputs are scaled by the factor only
+while ``Is Viewport`` is true, so editing works on cheap proxies and renders
+keep full detail. The scene-wide override in the GMesh panel pushes its
+values into every GreaseMesh modifier, and turning it off puts them back to
+full detail. Apply evaluates in the viewport
+depsgraph, so it lifts the proxy inputs to full detail while it reads.
+"""
+
+from .modifier_io import get_input, set_input
+
+FACTOR_SOCKET = "Viewport Resolution Factor"
+NOISE_SOCKET = "Viewport Noise"
+
+
+def add_proxy_sockets(iface, noise=False):
+    """Add the viewport proxy inputs to a node group interface."""
+    s = iface.new_socket(name=FACTOR_SOCKET, in_out='INPUT', socket_type='NodeSocketFloat')
+    s.default_value, s.min_value, s.max_value = 1.0, 0.05, 1.0
+    s.subtype = 'FACTOR'
+    if noise:
+        s = iface.new_socket(name=NOISE_SOCKET, in_out='INPUT', socket_type='NodeSocketFloat')
+        s.default_value, s.min_value, s.max_value = 1.0, 0.0, 1.0
+        s.subtype = 'FACTOR'
+
+
+def _viewport_scaled(ng, value, factor, minimum=None):
+    """Output of ``value * factor`` in the viewport and ``value`` at render."""
+    nodes = ng.nodes
+    x, y = value.node.location
+    mul = nodes.new('ShaderNodeMath'); mul.location = (x + 200, y - 200)
+    mul.operation = 'MULTIPLY'
+    ng.links.new(value, mul.inputs[0])
+    ng.links.new(factor, mul.inputs[1])
+    scaled = mul.outputs['Value']
+
+    if minimum is not None:
+        rounded = nodes.new('ShaderNodeMath'); rounded.location = (x + 400, y - 200)
+        rounded.operation = 'ROUND'
+        ng.links.new(scaled, rounded.inputs[0])
+        floor = nodes.new('ShaderNodeMath'); floor.location = (x + 600, y - 200)
+        floor.operation = 'MAXIMUM'
+        floor.inputs[1].default_value = minimum
+        ng.links.new(rounded.outputs['Value'], floor.inputs[0])
+        scaled = floor.outputs['Value']
+
+    is_viewport = nodes.new('GeometryNodeIsViewport'); is_viewport.location = (x + 600, y - 350)
+    switch = nodes.new('GeometryNodeSwitch'); switch.location = (x + 800, y - 200)
+    switch.input_type = 'FLOAT'
+    ng.links.new(is_viewport.outputs['Is Viewport'], switch.inputs['Switch'])
+    ng.links.new(value, switch.inputs['False'])
+    ng.links.new(scaled, switch.inputs['True'])
+    return switch.outputs['Output']
+
+
+def proxy_count(ng, group_in, name, minimum=2):
+    """Viewport-scaled version of an integer count input (resolution, segments)."""
+    return _viewport_scaled(ng, group_in.outputs[name], group_in.outputs[FACTOR_SOCKET], minimum)
+
+
+def proxy_noise(ng, group_in, name):
+    """Viewport-scaled version of a noise input (detail)."""
+    return _viewport_scaled(ng, group_in.outputs[name], group_in.outputs[NOISE_SOCKET])
+
+
+def _set_proxy_inputs(mod, factor, noise):
+    if mod.type != 'NODES' or mod.node_group is None:
+        return
+    values = {FACTOR_SOCKET: factor, NOISE_SOCKET: noise}
+    for item in mod.node_group.interface.items_tree:
+        if getattr(item, 'in_out', None) == 'INPUT' and item.name in values:
+            set_input(mod, item.identifier, values[item.name])
+
+
+def proxy_settings(settings, factor, counts):
+    """Python counterpart of ``proxy_count`` for inputs read from a modifier:
+    ``settings`` with each count in ``counts`` ({name: minimum}) scaled by
+    ``factor``."""
+    scaled = dict(settings)
+    for name, minimum in counts.items():
+        scaled[name] = max(minimum, int(settings[name] * factor + 0.5))
+    return scaled
+
+
+def apply_viewport_proxy(mod, settings):
+    """Write the scene override into one modifier, if enabled and supported."""
+    if settings.viewport_proxy_override:
+        _set_proxy_inputs(mod, settings.viewport_resolution_factor, settings.viewport_noise)
+
+
+def sync_viewport_proxy(scene):
+    """Push the scene override into every modifier of the scene's objects.
+
+    With the override off, every modifier goes back to full detail.
+    """
+    settings = scene.greasemesh
+    if settings.viewport_proxy_override:
+        factor, noise = settings.viewport_resolution_factor, settings.viewport_noise
+    else:
+        factor = noise = 1.0
+    for obj in scene.objects:
+        for mod in obj.modifiers:
+            _set_proxy_inputs(mod, factor, noise)
+        obj.update_tag()
+
+
+def force_full_detail(objects):
+    """Set every proxy input on the objects' modifiers to 1.0.
+
+    Returns [(modifier, identifier, previous value)] for restore_detail.
+    Regions built in Python at the proxy factor are rebuilt at full detail.
+    """
+    from .regions import refresh_regions
+
+    saved = []
+    for obj in objects:
+        for mod in obj.modifiers:
+            if mod.type != 'NODES' or mod.node_group is None:
+                continue
+            for item in mod.node_group.interface.items_tree:
+                if getattr(item, 'in_out', None) != 'INPUT':
+                    continue
+                if item.name not in (FACTOR_SOCKET, NOISE_SOCKET):
+                    continue
+                previous = get_input(mod, item.identifier, 1.0)
+                if previous != 1.0:
+                    saved.append((mod, item.identifier, previous))
+                    set_input(mod, item.identifier, 1.0)
+    refresh_regions({mod.id_data for mod, _, _ in saved})
+    return saved
+
+
+def restore_detail(saved):
+    from .regions import refresh_regions
+
+    for mod, identifier, value in saved:
+        set_input(mod, identifier, value)
+    refresh_regions({mod.id_data for mod, _, _ in saved})
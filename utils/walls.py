@@ -0,0 +1,392 @@
+"""Floor-plan walls from a planar graph of the stroke centerlines.
+
+Sweeping a rectangle along every curve overlaps wherever walls meet: T
+junctions and crossings leave faces inside the walls. Here the strokes
+become one planar graph first:
+
+  - open ends within Merge Distance of each other are welded; a free end
+    that stops short of another wall is extended onto it, and a stub that
+    runs past one by less than Merge Distance is trimmed;
+  - segments are split where they cross, found through a uniform-grid
+    spatial hash, so every junction is a shared vertex;
+  - every edge becomes a Thickness-wide rectangle and every outer corner a
+    mitered wedge (bevelled past _MITER_LIMIT);
+  - the union of those outlines (see arrangement) is refilled from its
+    boundary loops into one clean footprint and extruded by Height.
+
+The plan is the strokes' XY projection in object space; walls rise along
+local Z from the strokes' mean height, as the graph's Z-up sweep does.
+"""
+
+import itertools
+import math
+
+import numpy as np
+from mathutils.kdtree import KDTree
+
+from .arrangement import arrange_loops, boundary_loops
+from .fill_extrude import extrude_fill, fill_loops, fillet_polyline
+from .resample import _turning_angles, resample_polyline
+
+WALL_DEFAULTS = {
+    "Resolution": 64,
+    "Height": 3.0,
+    "Thickness": 0.3,
+    "Merge Distance": 0.5,
+    "Corner Radius": 0.1,
+    "Corner Resolution": 4,
+    "Optimize Topology": False,
+    "Straight Angle": math.radians(0.25),
+    "Triangulate": False,
+}
+
+# Outer corners sharper than this miter length (in half thicknesses) are
+# bevelled instead
+_MITER_LIMIT = 4.0
+
+_EPSILON = 1e-9
+
+
+# ---------------------------------------------------------------------------
+# Centerlines
+# ---------------------------------------------------------------------------
+
+
+def _arc_length(pts):
+    return float(np.linalg.norm(np.diff(pts, axis=0), axis=1).sum())
+
+
+def weld_stroke_ends(plan, distance):
+    """Weld the ends of open (N, 3) strokes lying within ``distance``.
+
+    Welded ends move to the mean of their group; a stroke whose two ends
+    meet becomes cyclic, unless it is too short to enclose anything, in
+    which case it is dropped. Returns a new list of (points, cyclic).
+    """
+    open_strokes = [pts for pts, cyclic in plan if not cyclic]
+    welded = [(pts, True) for pts, cyclic in plan if cyclic]
+    if not open_strokes:
+        return welded
+
+    # Endpoint KD-tree: index 2*i is the start of stroke i, 2*i+1 its end.
+    ends = np.array([pts[k] for pts in open_strokes for k in (0, -1)])
+    kd = KDTree(len(ends))
+    for i, co in enumerate(ends):
+        kd.insert(co, i)
+    kd.balance()
+
+    parent = list(range(len(ends)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    closable = [_arc_length(pts) > 2.0 * distance for pts in open_strokes]
+    for i, co in enumerate(ends):
+        for _, j, _ in kd.find_range(co, distance):
+            if j // 2 == i // 2 and not closable[i // 2]:
+                continue
+            parent[find(i)] = find(j)
+
+    _, group = np.unique([find(i) for i in range(len(ends))], return_inverse=True)
+    group = group.ravel()
+    centers = np.zeros((group.max() + 1, 3))
+    np.add.at(centers, group, ends)
+    centers /= np.bincount(group)[:, None]
+
+    for i, pts in enumerate(open_strokes):
+        pts = pts.copy()
+        start, end = group[2 * i], group[2 * i + 1]
+        pts[0], pts[-1] = centers[start], centers[end]
+        if start != end:
+            welded.append((pts, False))
+        elif len(pts) >= 4:
+            welded.append((pts[:-1], True))
+    return welded
+
+
+def centerlines(strokes, settings):
+    """Wall centerlines: strokes flattened to z = 0, ends welded, corners
+    filleted and resampled like the graph's Fillet and Resample Curve.
+
+    Returns a list of ((N, 2) points, cyclic).
+    """
+    plan = [(pts * (1.0, 1.0, 0.0), cyclic) for pts, cyclic in strokes]
+    lines = []
+    for pts, cyclic in weld_stroke_ends(plan, settings["Merge Distance"]):
+        pts = fillet_polyline(pts, settings["Corner Radius"], settings["Corner Resolution"], cyclic)
+        pts = resample_polyline(pts, max(3 if cyclic else 2, int(settings["Resolution"])), cyclic)
+        if settings["Optimize Topology"]:
+            keep = _turning_angles(pts, cyclic) >= settings["Straight Angle"]
+            if not cyclic:
+                keep[[0, -1]] = True
+            if keep.sum() >= (3 if cyclic else 2):
+                pts = pts[keep]
+        lines.append((pts[:, :2], cyclic))
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Planar graph
+# ---------------------------------------------------------------------------
+
+
+def segment_pairs(a, b):
+    """Index pairs (i < j) of segments a→b whose bounding boxes share a cell
+    of a uniform grid (the spatial hash), as an (P, 2) array."""
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    extent = float(np.max(hi.max(axis=0) - lo.min(axis=0)))
+    # About one segment per cell, but no more than 64 cells across the plan
+    cell = max(float(np.linalg.norm(b - a, axis=1).mean()), extent / 64.0, _EPSILON)
+
+    c0 = np.floor((lo - lo.min(axis=0)) / cell).astype(np.int64)
+    c1 = np.floor((hi - lo.min(axis=0)) / cell).astype(np.int64)
+    span = c1 - c0 + 1
+    counts = span.prod(axis=1)
+    segment = np.repeat(np.arange(len(a)), counts)
+    local = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    cx = np.repeat(c0[:, 0], counts) + local % np.repeat(span[:, 0], counts)
+    cy = np.repeat(c0[:, 1], counts) + local // np.repeat(span[:, 0], counts)
+    key = cx * (int(c1[:, 1].max()) + 1) + cy
+
+    order = np.argsort(key, kind='stable')
+    key, segment = key[order], segment[order]
+    bounds = np.flatnonzero(np.diff(key)) + 1
+    pairs = [
+        pair
+        for members in np.split(segment, bounds) if len(members) > 1
+        for pair in itertools.combinations(members.tolist(), 2)
+    ]
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.sort(np.array(pairs), axis=1), axis=0)
+
+
+def _cross(p, q):
+    return p[..., 0] * q[..., 1] - p[..., 1] * q[..., 0]
+
+
+def plan_graph(lines):
+    """Planar graph of centerlines, split where segments cross.
+
+    Returns (co (V, 2), edges (E, 2)) with coincident points welded and
+    duplicate edges removed.
+    """
+    co = np.concatenate([pts for pts, _ in lines])
+    segments = []
+    start = 0
+    for pts, cyclic in lines:
+        idx = np.arange(start, start + len(pts))
+        segments.append(np.stack((idx[:-1], idx[1:]), axis=1))
+        if cyclic:
+            segments.append([[idx[-1], idx[0]]])
+        start += len(pts)
+    segments = np.concatenate(segments).astype(np.int64)
+
+    # Crossings: a_i + t·r = a_j + u·s with both parameters inside the segments
+    a, b = co[segments[:, 0]], co[segments[:, 1]]
+    pairs = segment_pairs(a, b)
+    i, j = pairs[:, 0], pairs[:, 1]
+    r, s = b[i] - a[i], b[j] - a[j]
+    denom = _cross(r, s)
+    parallel = np.abs(denom) < _EPSILON
+    denom = np.where(parallel, 1.0, denom)
+    t = _cross(a[j] - a[i], s) / denom
+    u = _cross(a[j] - a[i], r) / denom
+    hit = ~parallel & (t > _EPSILON) & (t < 1.0 - _EPSILON) & (u > _EPSILON) & (u < 1.0 - _EPSILON)
+    i, j, t, u = i[hit], j[hit], t[hit], u[hit]
+    crossings = a[i] + t[:, None] * r[hit]
+    crossing_ids = len(co) + np.arange(len(crossings))
+    co = np.concatenate((co, crossings))
+
+    # Every segment's points ordered along it: its ends plus the crossings
+    n = len(segments)
+    seg = np.concatenate((np.arange(n), np.arange(n), i, j))
+    param = np.concatenate((np.zeros(n), np.ones(n), t, u))
+    vertex = np.concatenate((segments[:, 0], segments[:, 1], crossing_ids, crossing_ids))
+    order = np.lexsort((param, seg))
+    seg, vertex = seg[order], vertex[order]
+    same = seg[:-1] == seg[1:]
+    edges = np.stack((vertex[:-1][same], vertex[1:][same]), axis=1)
+
+    # Weld coincident points (closed strokes, welded ends, shared crossings)
+    co, remap = np.unique(np.round(co, 9), axis=0, return_inverse=True)
+    edges = remap.ravel()[edges]
+    edges = np.unique(np.sort(edges[edges[:, 0] != edges[:, 1]], axis=1), axis=0)
+    return co, edges
+
+
+def _adjacency(edges):
+    adjacent = {}
+    for v, w in edges.tolist():
+        adjacent.setdefault(v, set()).add(w)
+        adjacent.setdefault(w, set()).add(v)
+    return adjacent
+
+
+def _walk_from_end(adjacent, co, v):
+    """Follow the chain from free end ``v`` through degree-2 vertices.
+
+    Returns (vertices from ``v`` to the first vertex that isn't of degree 2,
+    chain length).
+    """
+    chain = [v, next(iter(adjacent[v]))]
+    while len(adjacent[chain[-1]]) == 2:
+        chain.append(next(w for w in adjacent[chain[-1]] if w != chain[-2]))
+    return chain, float(np.linalg.norm(np.diff(co[chain], axis=0), axis=1).sum())
+
+
+def trim_stubs(co, edges, distance):
+    """Drop dangling chains shorter than ``distance`` that hang off a
+    junction: stroke ends drawn past the wall they meet."""
+    adjacent = _adjacency(edges)
+    removed = set()
+    for v in [v for v, near in adjacent.items() if len(near) == 1]:
+        chain, length = _walk_from_end(adjacent, co, v)
+        if len(adjacent[chain[-1]]) >= 3 and length < distance:
+            removed.update(frozenset(e) for e in zip(chain, chain[1:]))
+    if not removed:
+        return edges
+    keep = [frozenset(e) not in removed for e in edges.tolist()]
+    return edges[np.array(keep, dtype=bool)]
+
+
+def extend_free_ends(co, edges, distance):
+    """Connect free ends that stop within ``distance`` short of another wall.
+
+    Each free end is joined to the nearest point ahead of it on an edge
+    outside its own chain, splitting that edge. Returns (co, edges).
+    """
+    adjacent = _adjacency(edges)
+    free = [v for v, near in adjacent.items() if len(near) == 1]
+    if not free:
+        return co, edges
+
+    co = list(co)
+    edges = [tuple(e) for e in edges.tolist()]
+    for v in free:
+        chain, _ = _walk_from_end(adjacent, np.asarray(co), v)
+        own = set(chain)
+        p = co[v]
+        tangent = p - co[next(iter(adjacent[v]))]
+
+        e = np.array(edges)
+        pts = np.asarray(co)
+        a, b = pts[e[:, 0]], pts[e[:, 1]]
+        ab = b - a
+        length_sq = np.maximum(np.einsum('ij,ij->i', ab, ab), _EPSILON)
+        t = np.clip(np.einsum('ij,ij->i', p - a, ab) / length_sq, 0.0, 1.0)
+        nearest = a + t[:, None] * ab
+        dist = np.linalg.norm(nearest - p, axis=1)
+        touching = dist <= _EPSILON
+        valid = (dist <= distance) & (touching | ((nearest - p) @ tangent > 0.0))
+        valid &= ~np.isin(e, list(own)).any(axis=1)
+        if not valid.any():
+            continue
+
+        k = int(np.flatnonzero(valid)[np.argmin(dist[valid])])
+        va, vb = edges[k]
+        if touching[k]:
+            # Already on the wall: split it at the end itself
+            if _EPSILON < t[k] < 1.0 - _EPSILON:
+                edges[k:k + 1] = [(va, v), (v, vb)]
+            continue
+        if t[k] < _EPSILON:
+            target = va
+        elif t[k] > 1.0 - _EPSILON:
+            target = vb
+        else:
+            target = len(co)
+            co.append(nearest[k])
+            edges[k:k + 1] = [(va, target), (target, vb)]
+        edges.append((v, target))
+    return np.array(co), np.array(edges, dtype=np.int64)
+
+
+# ---------------------------------------------------------------------------
+# Footprint
+# ---------------------------------------------------------------------------
+
+
+def wall_outlines(co, edges, half):
+    """Outlines whose union is the wall footprint: one rectangle per edge
+    and a mitered (or bevelled) wedge filling every outer corner."""
+    a, b = co[edges[:, 0]], co[edges[:, 1]]
+    d = (b - a) / np.linalg.norm(b - a, axis=1)[:, None]
+    left = np.stack((-d[:, 1], d[:, 0]), axis=1) * half
+    outlines = list(np.stack((a - left, b - left, b + left, a + left), axis=1))
+
+    # Edges around each vertex in counter-clockwise order; the gap from one
+    # edge to the next is an outer corner when it exceeds 180°
+    vertex = np.concatenate((edges[:, 0], edges[:, 1]))
+    direction = np.concatenate((d, -d))
+    side = np.concatenate((left, -left))
+    angle = np.arctan2(direction[:, 1], direction[:, 0])
+    order = np.lexsort((angle, vertex))
+    vertex, side, angle = vertex[order], side[order], angle[order]
+
+    first = np.flatnonzero(np.concatenate(([True], vertex[1:] != vertex[:-1])))
+    degree = np.diff(np.append(first, len(vertex)))
+    index = np.arange(len(vertex))
+    last = np.repeat(first + degree - 1, degree)
+    following = np.where(index == last, np.repeat(first, degree), index + 1)
+    # A free end's only edge follows itself: no gap, square end
+    gap = np.mod(angle[following] - angle, 2.0 * math.pi)
+
+    for k in np.flatnonzero(gap > math.pi + 1e-6):
+        center = co[vertex[k]]
+        p = center + side[k]
+        q = center - side[following[k]]
+        s = math.sin(gap[k] * 0.5)
+        if 1.0 / s <= _MITER_LIMIT:
+            bisector = angle[k] + gap[k] * 0.5
+            miter = center + (half / s) * np.array((math.cos(bisector), math.sin(bisector)))
+            outlines.append(np.array((center, p, miter, q)))
+        else:
+            outlines.append(np.array((center, p, q)))
+    return outlines
+
+
+def wall_footprint(strokes, settings):
+    """Floor footprint of the walls as (co (V, 2), corners, sizes), or None
+    when no wall remains."""
+    distance = settings["Merge Distance"]
+    lines = [(pts, cyclic) for pts, cyclic in centerlines(strokes, settings) if len(pts) >= 2]
+    if not lines:
+        return None
+
+    co, edges = plan_graph(lines)
+    edges = trim_stubs(co, edges, distance)
+    co, edges = extend_free_ends(co, edges, distance)
+    if len(edges) == 0:
+        return None
+
+    union = arrange_loops(wall_outlines(co, edges, settings["Thickness"] * 0.5), union=True)
+    if union is None:
+        return None
+
+    # Refill from the outline alone: one clean cap without the cells'
+    # edges, and boundary points only where the outline turns
+    straight = settings["Straight Angle"] if settings["Optimize Topology"] else 1e-6
+    loops = []
+    for loop in boundary_loops(*union):
+        keep = _turning_angles(np.column_stack((loop, np.zeros(len(loop)))), True) >= straight
+        if keep.sum() >= 3:
+            loops.append(loop[keep])
+    return fill_loops(loops, ngons=settings["Optimize Topology"] and not settings["Triangulate"])
+
+
+def wall_buffers(strokes, settings):
+    """WallMesh output for ``strokes`` (object space, as read_strokes gives
+    them): the footprint extruded by Height. Returns buffers or None."""
+    footprint = wall_footprint(strokes, settings)
+    if footprint is None:
+        return None
+    co2, corners, sizes = footprint
+    base = np.concatenate([pts[:, 2] for pts, _ in strokes]).mean()
+    basis = (np.array((0.0, 0.0, base)), np.array((1.0, 0.0, 0.0)),
+             np.array((0.0, 1.0, 0.0)), np.array((0.0, 0.0, 1.0)))
+    return extrude_fill(co2, corners, sizes, basis, settings["Height"], settings["Triangulate"])